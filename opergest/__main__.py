@@ -0,0 +1,5 @@
+import sys
+
+from opergest.cli import main
+
+sys.exit(main())
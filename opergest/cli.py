@@ -0,0 +1,437 @@
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date
+
+from opergest.core import (
+    Conexion, Migraciones, PERFILES_ALMACENAMIENTO, Pedidos, TallasCorte, Empleados,
+    RegistroHoras, Nomina, Quincena, Busqueda, Exportacion, Archivo, ErrorOperGest, DatosInvalidosError
+)
+from opergest.generador import ESCALAS, GeneradorPlanta
+
+# Milisegundos que puede tardar en importarse cada módulo sin interfaz, medido en un intérprete
+# nuevo. Los scripts de reportes y el cron pagan este costo en cada ejecución.
+PRESUPUESTO_IMPORTACION_MS = 100
+MODULOS_SIN_INTERFAZ = ("opergest.core", "opergest.cli")
+
+COLUMNAS_NOMINA = ["id_empleado", "nombre", "area", "bandos", "total_destajo",
+                   "horas", "salario_hora", "total_horas", "total"]
+COLUMNAS_CORTES = ["corte", "marca", "categoria", "color", "talla", "cantidad"]
+
+
+@contextmanager
+def abrir_salida(ruta, comprimir=False):
+    if ruta in (None, "-"):
+        if not comprimir:
+            yield sys.stdout
+            sys.stdout.flush()
+            return
+        with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb", compresslevel=6) as binario:
+            with io.TextIOWrapper(binario, encoding="utf-8", newline="") as archivo:
+                yield archivo
+        return
+    if comprimir:
+        with gzip.open(ruta, "wt", compresslevel=6, newline="", encoding="utf-8") as archivo:
+            yield archivo
+        return
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        yield archivo
+
+
+@contextmanager
+def abrir_entrada(ruta):
+    if ruta == "-":
+        yield sys.stdin
+        return
+    with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+        yield archivo
+
+
+def avisar(mensaje):
+    # Los avisos van a stderr para que stdout lleve solo los datos.
+    print(mensaje, file=sys.stderr)
+
+
+def comando_gui(args):
+    # Tk solo se importa cuando se abre la interfaz.
+    from opergest.gui import InterfazGrafica
+    InterfazGrafica().ejecutar()
+    return 0
+
+
+def comando_payroll(args):
+    quincena = Quincena.desde_clave(args.period) if args.period else Quincena.actual().anterior()
+    if args.cerrar and not quincena.cerrada():
+        avisar(f"Quincena {quincena.clave} cerrada con {quincena.cerrar()} empleados.")
+
+    filas = quincena.nomina()
+    if args.area:
+        filas = [f for f in filas if f['area'].lower() == args.area.lower()]
+
+    with abrir_salida(args.salida) as salida:
+        escritor = csv.DictWriter(salida, fieldnames=COLUMNAS_NOMINA)
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+    estado = "cerrada" if quincena.cerrada() else "abierta"
+    avisar(f"{quincena.clave} ({quincena.inicio} al {quincena.fin}, {estado}): "
+           f"{len(filas)} empleados, total Q{sum(f['total'] for f in filas):.2f}")
+    return 0
+
+
+def escribir_csv(salida, columnas, filas):
+    escritor = csv.writer(salida)
+    escritor.writerow(columnas)
+    for fila in filas:
+        escritor.writerow(fila)
+        yield fila
+
+
+def escribir_jsonl(salida, columnas, filas):
+    for fila in filas:
+        salida.write(json.dumps(dict(zip(columnas, fila)), ensure_ascii=False))
+        salida.write("\n")
+        yield fila
+
+
+def comando_export(args):
+    # Las filas pasan del cursor a la salida de una en una: la memoria no crece con el historial.
+    formato = args.formato or ("jsonl" if args.salida and ".jsonl" in args.salida else "csv")
+    comprimir = args.gzip or bool(args.salida and args.salida.endswith(".gz"))
+    escribir = escribir_jsonl if formato == "jsonl" else escribir_csv
+
+    inicio = time.perf_counter()
+    columnas, filas = Exportacion.abrir(args.conjunto, args.desde, args.hasta, args.lote)
+    total = 0
+    with abrir_salida(args.salida, comprimir) as salida:
+        for _ in escribir(salida, columnas, filas):
+            total += 1
+    segundos = time.perf_counter() - inicio
+
+    tamano = ""
+    if args.salida not in (None, "-"):
+        tamano = f", {os.path.getsize(args.salida) / 1024 / 1024:.1f} MiB"
+    avisar(f"{args.conjunto}: {total} filas {formato}{' gzip' if comprimir else ''} en {segundos:.2f} s "
+           f"({total / segundos if segundos else 0:.0f} filas/s){tamano}")
+    return 0
+
+
+def comando_import_cortes(args):
+    # Una fila por corte y talla; las filas con la misma clave "corte" forman un solo pedido.
+    # Todo el archivo entra en una transacción: un error en cualquier línea no deja nada a medias.
+    creados = {}
+    tallas = 0
+    with abrir_entrada(args.archivo) as entrada:
+        lector = csv.DictReader(entrada)
+        faltantes = [c for c in COLUMNAS_CORTES if c not in (lector.fieldnames or [])]
+        if faltantes:
+            raise DatosInvalidosError(f"Faltan columnas en el archivo: {', '.join(faltantes)}")
+
+        with Conexion.transaccion("IMMEDIATE"):
+            for numero, fila in enumerate(lector, start=2):
+                try:
+                    clave = fila['corte'].strip()
+                    if clave not in creados:
+                        creados[clave] = Pedidos(fila['marca'].strip(), fila['categoria'].strip(),
+                                                 fila['color'].strip()).guardar()
+                    TallasCorte(creados[clave], int(fila['talla']), int(fila['cantidad'])).agregar_talla()
+                    tallas += 1
+                except (ValueError, AttributeError) as e:
+                    raise DatosInvalidosError(f"Línea {numero}: {e}") from e
+
+    avisar(f"Importados {len(creados)} cortes con {tallas} tallas.")
+    return 0
+
+
+def tamano_base(conn, esquema):
+    paginas = conn.execute(f"PRAGMA {esquema}.page_count").fetchone()[0]
+    return paginas * conn.execute(f"PRAGMA {esquema}.page_size").fetchone()[0]
+
+
+def comando_vacuum(args):
+    conn = Conexion.get_conn()
+    esquemas = [fila['name'] for fila in conn.execute("PRAGMA database_list") if fila['name'] != "temp"]
+    for esquema in esquemas:
+        antes = tamano_base(conn, esquema)
+        inicio = time.perf_counter()
+        conn.execute(f"VACUUM {esquema}")
+        despues = tamano_base(conn, esquema)
+        avisar(f"{esquema}: {antes / 1024:.0f} KiB -> {despues / 1024:.0f} KiB "
+               f"en {time.perf_counter() - inicio:.2f} s")
+    conn.execute("PRAGMA optimize")
+    if conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal":
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return 0
+
+
+def comando_archive(args):
+    movidos = Archivo.archivar(args.antes_de, estado=args.estado)
+    for tabla, cantidad in movidos.items():
+        print(f"{tabla:<16}{cantidad:>10}")
+    avisar(f"Archivados {movidos['pedidos']} cortes en {Archivo.ruta()}.")
+    return 0
+
+
+def comando_verify(args):
+    conn = Conexion.get_conn()
+    problemas = 0
+
+    integridad = [fila[0] for fila in conn.execute("PRAGMA quick_check")]
+    if integridad != ["ok"]:
+        problemas += len(integridad)
+    print(f"quick_check: {', '.join(integridad[:args.mostrar])}")
+
+    for nombre, verificar in (("pedidos.cantidad", Pedidos.verificar_totales),
+                              ("corte_talla_saldo", TallasCorte.verificar_saldos),
+                              ("índices de búsqueda", Busqueda.verificar_indices)):
+        diferencias = verificar(corregir=args.corregir)
+        accion = " (corregidas)" if args.corregir and diferencias else ""
+        print(f"{nombre}: {len(diferencias)} diferencias{accion}")
+        for diferencia in diferencias[:args.mostrar]:
+            print(f"  {diferencia}")
+        if not args.corregir:
+            problemas += len(diferencias)
+
+    return 1 if problemas else 0
+
+
+def cronometrar(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return min(tiempos), statistics.median(tiempos)
+
+
+def recorrer_pedidos(estado="en proceso", tamano_pagina=50):
+    despues_de = 0
+    while True:
+        try:
+            pedidos = Pedidos.listar(estado=estado, despues_de=despues_de, limite=tamano_pagina)
+        except ErrorOperGest:
+            return
+        if not pedidos:
+            return
+        Pedidos.detalle_cortes([p['id'] for p in pedidos])
+        despues_de = pedidos[-1]['id']
+
+
+def medir_perfil(perfil, escrituras=2000, lecturas=2000, empleados=50):
+    with tempfile.TemporaryDirectory() as carpeta:
+        Conexion.configurar(ruta=os.path.join(carpeta, "bench.db"), perfil=perfil)
+        Migraciones.aplicar()
+
+        # Escrituras: una transacción por marcaje, como en la terminal del piso.
+        inicio = time.perf_counter()
+        for i in range(escrituras):
+            with Conexion.transaccion() as conn:
+                conn.execute(
+                    "INSERT INTO registro_horas (id_empleado, fecha, hora_entrada, hora_salida) VALUES (?, ?, ?, ?)",
+                    (i % empleados + 1, f"2025-01-{i % 28 + 1:02d}", "07:00:00", "16:00:00")
+                )
+        t_escritura = time.perf_counter() - inicio
+
+        # Lecturas: la consulta del reporte quincenal por empleado.
+        inicio = time.perf_counter()
+        for i in range(lecturas):
+            RegistroHoras.obtener_registros_horarios(i % empleados + 1, "2025-01-01", "2025-01-15")
+        t_lectura = time.perf_counter() - inicio
+
+        Conexion.cerrar()
+    return escrituras / t_escritura, lecturas / t_lectura
+
+
+def comando_bench(args):
+    # Consultas de solo lectura sobre la base configurada, en el orden en que las usa la planta.
+    quincena = Quincena.desde_clave(args.period) if args.period else Quincena.actual().anterior()
+    nomina = Nomina.calcular(quincena.inicio, quincena.fin)
+    costurera = max(nomina, key=lambda f: f['bandos'], default=None)
+
+    cargas = [
+        (f"nómina {quincena.clave}", lambda: Nomina.calcular(quincena.inicio, quincena.fin)),
+        ("directorio de empleados", Empleados.directorio),
+        ("cortes en proceso", recorrer_pedidos),
+        ("búsqueda de pedidos", lambda: Busqueda.pedidos("a")),
+    ]
+    if costurera and costurera['bandos']:
+        cargas.append((f"detalle destajo empleado {costurera['id_empleado']}",
+                       lambda: Nomina.detalle_destajo(costurera['id_empleado'], quincena.inicio, quincena.fin)))
+
+    print(f"{'Consulta':<36}{'Mínimo ms':>12}{'Mediana ms':>12}")
+    for nombre, funcion in cargas:
+        minimo, mediana = cronometrar(funcion, args.repeticiones)
+        print(f"{nombre:<36}{minimo:>12.2f}{mediana:>12.2f}")
+
+    if args.perfiles:
+        ruta, perfil = Conexion.ruta, Conexion.perfil
+        print(f"\n{'Perfil':<18}{'Escrituras/s':>15}{'Lecturas/s':>15}")
+        for nombre in args.perfiles:
+            escrituras, lecturas = medir_perfil(nombre)
+            print(f"{nombre:<18}{escrituras:>15.0f}{lecturas:>15.0f}")
+        Conexion.configurar(ruta=ruta, perfil=perfil)
+    return 0
+
+
+def medir_importacion(modulo):
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys, {modulo}; print('tkinter' in sys.modules)"],
+        cwd=raiz, capture_output=True, text=True, check=True
+    )
+    # Cada línea de -X importtime es "import time: propio | acumulado | módulo".
+    acumulado = None
+    for linea in salida.stderr.splitlines():
+        partes = linea.split("|")
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            acumulado = int(partes[1]) / 1000
+    return acumulado, salida.stdout.strip() == "True"
+
+
+def comando_import_time(args):
+    fallas = 0
+    for modulo in MODULOS_SIN_INTERFAZ:
+        mejor = None
+        for _ in range(args.repeticiones):
+            milisegundos, con_tk = medir_importacion(modulo)
+            mejor = milisegundos if mejor is None else min(mejor, milisegundos)
+            if con_tk:
+                break
+
+        estado = "ok"
+        if con_tk:
+            estado = "importa tkinter"
+        elif mejor > args.presupuesto:
+            estado = "excede el presupuesto"
+        if estado != "ok":
+            fallas += 1
+        print(f"{modulo:<16}{mejor:>8.1f} ms  {estado}")
+
+    return 1 if fallas else 0
+
+
+def comando_generate(args):
+    if args.reemplazar:
+        for sufijo in ("", "-wal", "-shm"):
+            if os.path.exists(args.salida + sufijo):
+                os.remove(args.salida + sufijo)
+
+    def al_avanzar(quincena, numero, total, conteo, segundos):
+        avisar(f"{quincena.clave} ({numero}/{total}): {conteo.get('reporte', 0)} filas de reporte, {segundos:.1f} s")
+
+    generador = GeneradorPlanta(args.salida, args.escala, args.semilla, args.hasta, quincenas=args.quincenas,
+                                costura=args.costura, tareas_por_dia=args.tareas_por_dia)
+    conteo, segundos = generador.generar(al_avanzar)
+    filas = sum(conteo.values())
+    for tabla, cantidad in conteo.items():
+        avisar(f"{tabla:<16}{cantidad:>12}")
+    avisar(f"{filas} filas en {segundos:.1f} s ({filas / segundos:.0f} filas/s) -> {args.salida}")
+    return 0
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="opergest", description="Herramientas de OPERGest.")
+    parser.add_argument("--db", help=f"ruta de la base (por defecto {Conexion.ruta})")
+    parser.add_argument("--perfil", choices=list(PERFILES_ALMACENAMIENTO), help="perfil de almacenamiento")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    gui = comandos.add_parser("gui", help="abre la interfaz gráfica")
+    gui.set_defaults(funcion=comando_gui)
+
+    payroll = comandos.add_parser("payroll", help="nómina de una quincena en CSV")
+    payroll.add_argument("--period", help="quincena AAAA-MM-1 o AAAA-MM-2 (por defecto la anterior)")
+    payroll.add_argument("--area", help="solo empleados de esta área")
+    payroll.add_argument("--cerrar", action="store_true", help="cierra la quincena antes de exportarla")
+    payroll.add_argument("-o", "--salida", help="archivo de salida (por defecto stdout)")
+    payroll.set_defaults(funcion=comando_payroll, usa_base=True)
+
+    export = comandos.add_parser("export", help="exporta una tabla o la nómina calculada en CSV o JSONL")
+    export.add_argument("conjunto", choices=Exportacion.conjuntos())
+    export.add_argument("--desde", type=date.fromisoformat,
+                        help="fecha inicial AAAA-MM-DD; en nomina, primera quincena que empieza ese día o después")
+    export.add_argument("--hasta", type=date.fromisoformat,
+                        help="fecha final AAAA-MM-DD (incluida); en nomina, última quincena terminada hasta ese día")
+    export.add_argument("--formato", choices=["csv", "jsonl"], help="por defecto según la extensión, o csv")
+    export.add_argument("--gzip", action="store_true", help="comprime la salida (implícito con .gz)")
+    export.add_argument("--lote", type=int, default=1000, help="filas por fetchmany")
+    export.add_argument("-o", "--salida", help="archivo de salida (por defecto stdout)")
+    export.set_defaults(funcion=comando_export, usa_base=True)
+
+    importar = comandos.add_parser("import-cortes", help="registra cortes y tallas desde un CSV")
+    importar.add_argument("archivo", help=f"CSV con columnas {','.join(COLUMNAS_CORTES)} ('-' para stdin)")
+    importar.set_defaults(funcion=comando_import_cortes, usa_base=True)
+
+    vacuum = comandos.add_parser("vacuum", help="compacta la base y su archivo")
+    vacuum.set_defaults(funcion=comando_vacuum, usa_base=True)
+
+    archive = comandos.add_parser("archive", help="mueve los cortes cerrados y su trabajo a la base de archivo")
+    archive.add_argument("--antes-de", type=date.fromisoformat, required=True,
+                         help="fecha AAAA-MM-DD; se archivan cortes sin tareas ni reportes desde ese día")
+    archive.add_argument("--estado", default="entregado", help="estado de los cortes a archivar")
+    archive.set_defaults(funcion=comando_archive, usa_base=True)
+
+    verify = comandos.add_parser("verify", help="revisa integridad y totales materializados")
+    verify.add_argument("--corregir", action="store_true", help="recalcula los totales con diferencias")
+    verify.add_argument("--mostrar", type=int, default=10, help="diferencias a listar por revisión")
+    verify.set_defaults(funcion=comando_verify, usa_base=True)
+
+    bench = comandos.add_parser("bench", help="mide las consultas principales sobre la base")
+    bench.add_argument("--period", help="quincena a medir (por defecto la anterior)")
+    bench.add_argument("--repeticiones", type=int, default=5)
+    bench.add_argument("--perfiles", nargs="*", choices=list(PERFILES_ALMACENAMIENTO),
+                       help="además compara los perfiles de almacenamiento en bases temporales")
+    bench.set_defaults(funcion=comando_bench, usa_base=True)
+
+    importacion = comandos.add_parser("import-time",
+                                      help="mide la importación de los módulos sin interfaz")
+    importacion.add_argument("--presupuesto", type=float, default=PRESUPUESTO_IMPORTACION_MS,
+                             help="milisegundos permitidos por módulo")
+    importacion.add_argument("--repeticiones", type=int, default=3)
+    importacion.set_defaults(funcion=comando_import_time)
+
+    generate = comandos.add_parser("generate", help="crea una base sintética con datos de una planta")
+    generate.add_argument("salida", help="ruta de la base nueva")
+    escalas = "; ".join(f"{nombre}: {p['costura']} costureras, {p['quincenas']} quincenas"
+                        for nombre, p in ESCALAS.items())
+    generate.add_argument("--escala", choices=list(ESCALAS), default="taller",
+                          help=f"{escalas}. taller da unas 7,700 filas de reporte y planta unos 10 millones")
+    generate.add_argument("--semilla", type=int, default=1, help="la misma semilla produce la misma base")
+    generate.add_argument("--quincenas", type=int, help="quincenas de historia (cambia la escala)")
+    generate.add_argument("--costura", type=int, help="costureras (cambia la escala)")
+    generate.add_argument("--tareas-por-dia", type=int, help="tareas por costurera al día (cambia la escala)")
+    generate.add_argument("--hasta", type=date.fromisoformat,
+                          help="fecha dentro de la última quincena (por defecto la anterior)")
+    generate.add_argument("--reemplazar", action="store_true", help="borra la base si ya existe")
+    generate.set_defaults(funcion=comando_generate)
+
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    if args.db or args.perfil:
+        Conexion.configurar(ruta=args.db, perfil=args.perfil)
+    try:
+        if getattr(args, "usa_base", False):
+            Migraciones.aplicar()
+        return args.funcion(args)
+    except ErrorOperGest as e:
+        avisar(f"opergest {args.comando}: {e}")
+        return 1
+    except BrokenPipeError:
+        # La salida se cortó (por ejemplo con "| head"); no es un error del comando.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
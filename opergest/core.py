@@ -0,0 +1,1895 @@
+import os
+import queue
+import re
+import sqlite3
+import threading
+import atexit
+import logging
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta
+
+
+DB_NAME = "registros.db"
+
+PERFILES_ALMACENAMIENTO = {
+    # Una sola terminal con la base en disco local: WAL deja leer mientras otro escribe.
+    "single-terminal": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # Base en una carpeta compartida: WAL no es seguro sobre la red, así que se queda
+    # el diario clásico y las terminales esperan el bloqueo en lugar de fallar.
+    "shared-LAN": {
+        "busy_timeout": 15000,
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+    },
+    # Importaciones y cargas de prueba: se sacrifica durabilidad ante cortes de luz.
+    "bulk-import": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+PERFIL_POR_DEFECTO = "single-terminal"
+
+
+class ErrorOperGest(ValueError):
+    pass
+
+
+class NoEncontradoError(ErrorOperGest):
+    pass
+
+
+class DatosInvalidosError(ErrorOperGest):
+    pass
+
+
+class CapacidadExcedidaError(ErrorOperGest):
+    pass
+
+
+class ConflictoError(ErrorOperGest):
+    pass
+
+
+class CredencialesInvalidasError(ErrorOperGest):
+    pass
+
+
+class Conexion:
+    # Una conexión por hilo, reutilizada por todas las clases de datos.
+    _local = threading.local()
+    _lock = threading.Lock()
+    _abiertas = []
+    _contadores = {"abiertas": 0, "reutilizadas": 0}
+    ruta = DB_NAME
+    perfil = os.environ.get("OPERGEST_PERFIL", PERFIL_POR_DEFECTO)
+
+    @staticmethod
+    def configurar(ruta=None, perfil=None):
+        if perfil is not None and perfil not in PERFILES_ALMACENAMIENTO:
+            raise DatosInvalidosError(f"Perfil de almacenamiento desconocido: {perfil}")
+        Conexion.cerrar()
+        if ruta is not None:
+            Conexion.ruta = ruta
+        if perfil is not None:
+            Conexion.perfil = perfil
+
+    @staticmethod
+    def _abrir():
+        if Conexion.perfil not in PERFILES_ALMACENAMIENTO:
+            raise DatosInvalidosError(f"Perfil de almacenamiento desconocido: {Conexion.perfil}")
+        conn = sqlite3.connect(Conexion.ruta, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma, valor in PERFILES_ALMACENAMIENTO[Conexion.perfil].items():
+            conn.execute(f"PRAGMA {pragma} = {valor}")
+        Archivo._adjuntar(conn)
+        return conn
+
+    @staticmethod
+    def get_conn():
+        conn = getattr(Conexion._local, "conn", None)
+        with Conexion._lock:
+            if conn is None:
+                conn = Conexion._abrir()
+                Conexion._local.conn = conn
+                Conexion._abiertas.append(conn)
+                Conexion._contadores["abiertas"] += 1
+            else:
+                Conexion._contadores["reutilizadas"] += 1
+        return conn
+
+    @staticmethod
+    @contextmanager
+    def transaccion(modo="DEFERRED"):
+        conn = Conexion.get_conn()
+        if conn.in_transaction:
+            # Transacción anidada: se une a la transacción exterior.
+            yield conn
+            return
+        conn.execute(f"BEGIN {modo}")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+    @staticmethod
+    def estadisticas():
+        with Conexion._lock:
+            return dict(Conexion._contadores)
+
+    @staticmethod
+    def cerrar():
+        with Conexion._lock:
+            for conn in Conexion._abiertas:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            Conexion._abiertas.clear()
+            Conexion._local = threading.local()
+
+
+atexit.register(Conexion.cerrar)
+
+
+class Trabajo:
+    def __init__(self, trabajador, funcion, args, kwargs, al_terminar, al_fallar):
+        self._trabajador = trabajador
+        self.funcion = funcion
+        self.args = args
+        self.kwargs = kwargs
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.cancelado = False
+
+    def cancelar(self):
+        self.cancelado = True
+        self._trabajador._interrumpir(self)
+
+
+class TrabajadorBD:
+    # Hilo con su propia conexión que ejecuta los trabajos en orden. Los resultados esperan en una
+    # cola hasta que el hilo de la interfaz llama a atender(); un trabajo cancelado no devuelve nada.
+    def __init__(self):
+        self._pendientes = queue.Queue()
+        self._resultados = queue.Queue()
+        self._lock = threading.Lock()
+        self._actual = None
+        self._conn = None
+        self._hilo = threading.Thread(target=self._ciclo, name="opergest-bd", daemon=True)
+        self._hilo.start()
+
+    def enviar(self, funcion, *args, al_terminar=None, al_fallar=None, **kwargs):
+        trabajo = Trabajo(self, funcion, args, kwargs, al_terminar, al_fallar)
+        self._pendientes.put(trabajo)
+        return trabajo
+
+    def _ciclo(self):
+        while True:
+            trabajo = self._pendientes.get()
+            if trabajo is None:
+                return
+            if trabajo.cancelado:
+                continue
+            try:
+                with self._lock:
+                    self._conn = Conexion.get_conn()
+                    self._actual = trabajo
+                resultado = trabajo.funcion(*trabajo.args, **trabajo.kwargs)
+            except Exception as e:
+                if not trabajo.cancelado:
+                    self._resultados.put((trabajo, trabajo.al_fallar, e))
+            else:
+                if not trabajo.cancelado:
+                    self._resultados.put((trabajo, trabajo.al_terminar, resultado))
+            finally:
+                with self._lock:
+                    self._actual = None
+
+    def _interrumpir(self, trabajo):
+        # sqlite3 permite interrumpir desde otro hilo; la consulta en curso falla con "interrupted".
+        with self._lock:
+            if self._actual is trabajo and self._conn is not None:
+                self._conn.interrupt()
+
+    def cancelar_todos(self):
+        while True:
+            try:
+                trabajo = self._pendientes.get_nowait()
+            except queue.Empty:
+                break
+            if trabajo is None:
+                self._pendientes.put(None)
+                break
+            trabajo.cancelado = True
+        with self._lock:
+            actual = self._actual
+        if actual is not None:
+            actual.cancelar()
+
+    def atender(self):
+        while True:
+            try:
+                trabajo, callback, valor = self._resultados.get_nowait()
+            except queue.Empty:
+                return
+            if trabajo.cancelado:
+                continue
+            if callback is not None:
+                callback(valor)
+            elif isinstance(valor, Exception):
+                raise valor
+
+    def detener(self, espera=5):
+        self.cancelar_todos()
+        self._pendientes.put(None)
+        self._hilo.join(espera)
+
+
+class Migraciones:
+    # Cada paso lleva la base de la versión N-1 a la N (PRAGMA user_version).
+    @staticmethod
+    def _ejecutar(conn, script):
+        # executescript() haría COMMIT de la transacción abierta; se ejecuta sentencia por sentencia.
+        for sentencia in script.split(";"):
+            if sentencia.strip():
+                conn.execute(sentencia)
+
+    @staticmethod
+    def _v1_esquema_base(conn):
+        Migraciones._ejecutar(conn, '''
+            CREATE TABLE IF NOT EXISTS pedidos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                marca TEXT NOT NULL,
+                categoria TEXT NOT NULL,
+                color TEXT NOT NULL,
+                cantidad INTEGER DEFAULT 0,
+                estado TEXT DEFAULT 'en proceso'
+            );
+            CREATE TABLE IF NOT EXISTS tallas_corte (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                corte INTEGER NOT NULL,
+                talla INTEGER NOT NULL,
+                cantidad_max INTEGER NOT NULL,
+                FOREIGN KEY(corte) REFERENCES pedidos(id)
+            );
+            CREATE TABLE IF NOT EXISTS bandos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                corte INTEGER NOT NULL,
+                talla INTEGER NOT NULL,
+                cantidad INTEGER NOT NULL,
+                FOREIGN KEY(corte) REFERENCES pedidos(id)
+            );
+            CREATE TABLE IF NOT EXISTS operaciones (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nombre TEXT NOT NULL,
+                small_price REAL NOT NULL,
+                big_price REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS empleados (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nombre TEXT NOT NULL,
+                telefono INTEGER NOT NULL,
+                area TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS salarios (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_empleado INTEGER NOT NULL,
+                salario REAL NOT NULL,
+                FOREIGN KEY(id_empleado) REFERENCES empleados(id)
+            );
+            CREATE TABLE IF NOT EXISTS tareas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_empleado INTEGER NOT NULL,
+                corte INTEGER NOT NULL,
+                bando TEXT NOT NULL,
+                operacion INTEGER NOT NULL,
+                fecha TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY(id_empleado) REFERENCES empleados(id),
+                FOREIGN KEY(corte) REFERENCES pedidos(id),
+                FOREIGN KEY(operacion) REFERENCES operaciones(id)
+            );
+            CREATE TABLE IF NOT EXISTS reporte (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_tarea INTEGER NOT NULL,
+                id_empleado INTEGER NOT NULL,
+                id_operacion INTEGER NOT NULL,
+                talla INTEGER NOT NULL,
+                bandos TEXT NOT NULL,
+                fecha TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY(id_tarea) REFERENCES tareas(id),
+                FOREIGN KEY(id_empleado) REFERENCES empleados(id),
+                FOREIGN KEY(id_operacion) REFERENCES operaciones(id)
+            );
+            CREATE TABLE IF NOT EXISTS registro_horas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_empleado INTEGER NOT NULL,
+                fecha TEXT DEFAULT (date('now')),
+                hora_entrada TEXT,
+                hora_salida TEXT,
+                FOREIGN KEY(id_empleado) REFERENCES empleados(id)
+            );
+            CREATE TABLE IF NOT EXISTS cuentas (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id_empleado INTEGER NOT NULL,
+                usuario TEXT NOT NULL,
+                password TEXT NOT NULL,
+                rol TEXT NOT NULL,
+                FOREIGN KEY(id_empleado) REFERENCES empleados(id)
+            );
+        ''')
+
+    @staticmethod
+    def _reconstruir_tabla(conn, tabla, definicion, columnas):
+        # SQLite no permite cambiar columnas ni DEFAULT: se crea la tabla nueva, se copian las
+        # filas y se conserva el contador AUTOINCREMENT.
+        fila = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (tabla,)).fetchone()
+        conn.execute(f"CREATE TABLE {tabla}_nuevo ({definicion})")
+        conn.execute(f"INSERT INTO {tabla}_nuevo ({columnas}) SELECT {columnas} FROM {tabla}")
+        conn.execute(f"DROP TABLE {tabla}")
+        conn.execute(f"ALTER TABLE {tabla}_nuevo RENAME TO {tabla}")
+        if fila:
+            conn.execute("UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = ?", (fila[0], tabla))
+
+    @staticmethod
+    def _v2_estado_pedidos(conn):
+        # Bases antiguas crearon pedidos con DEFAULT "En proceso"; se reconstruye la tabla.
+        columnas = {c['name']: c for c in conn.execute("PRAGMA table_info(pedidos)")}
+        if columnas['estado']['dflt_value'] != "'en proceso'":
+            Migraciones._reconstruir_tabla(conn, "pedidos", '''
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                marca TEXT NOT NULL,
+                categoria TEXT NOT NULL,
+                color TEXT NOT NULL,
+                cantidad INTEGER DEFAULT 0,
+                estado TEXT DEFAULT 'en proceso'
+            ''', "id, marca, categoria, color, cantidad, estado")
+        conn.execute("UPDATE pedidos SET estado = lower(estado) WHERE estado <> lower(estado)")
+
+    @staticmethod
+    def _v3_reportes_legado(conn):
+        # La tabla "reportes" quedó de una versión anterior; sus filas pasan a "reporte".
+        existe = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reportes'").fetchone()
+        if not existe:
+            return
+        # Las filas cuya tarea ya no existe no caben en "reporte"; se conservan en
+        # "reportes_sin_tarea" y se avisa cuántas son.
+        huerfanos = conn.execute(
+            "SELECT COUNT(*) FROM reportes r WHERE NOT EXISTS (SELECT 1 FROM tareas t WHERE t.id = r.id_tarea)"
+        ).fetchone()[0]
+        if huerfanos:
+            conn.execute('''
+                CREATE TABLE reportes_sin_tarea AS
+                SELECT * FROM reportes r WHERE NOT EXISTS (SELECT 1 FROM tareas t WHERE t.id = r.id_tarea)
+            ''')
+            logging.getLogger(__name__).warning(
+                "%d filas de la tabla reportes no tienen tarea; se guardaron en reportes_sin_tarea.", huerfanos)
+        Migraciones._ejecutar(conn, '''
+            INSERT INTO reporte (id_tarea, id_empleado, id_operacion, talla, bandos, fecha)
+                SELECT r.id_tarea, t.id_empleado, t.operacion, 30, t.bando, r.fecha
+                FROM reportes r
+                JOIN tareas t ON t.id = r.id_tarea;
+            DROP TABLE reportes;
+        ''')
+
+    @staticmethod
+    def _v4_indices(conn):
+        Migraciones._ejecutar(conn, '''
+            CREATE INDEX IF NOT EXISTS idx_tareas_empleado ON tareas(id_empleado);
+            CREATE INDEX IF NOT EXISTS idx_reporte_empleado_fecha ON reporte(id_empleado, fecha);
+            CREATE INDEX IF NOT EXISTS idx_bandos_corte_talla ON bandos(corte, talla);
+            CREATE INDEX IF NOT EXISTS idx_tallas_corte_corte_talla ON tallas_corte(corte, talla);
+            CREATE INDEX IF NOT EXISTS idx_registro_horas_empleado_fecha ON registro_horas(id_empleado, fecha);
+            CREATE INDEX IF NOT EXISTS idx_cuentas_usuario ON cuentas(usuario);
+            CREATE INDEX IF NOT EXISTS idx_cuentas_empleado ON cuentas(id_empleado);
+            CREATE INDEX IF NOT EXISTS idx_salarios_empleado ON salarios(id_empleado);
+            CREATE INDEX IF NOT EXISTS idx_empleados_nombre ON empleados(nombre);
+            CREATE INDEX IF NOT EXISTS idx_empleados_area ON empleados(area);
+        ''')
+
+    @staticmethod
+    def _v5_tarea_bandos(conn):
+        # tareas.bando y reporte.bandos guardaban "3, 7, 12"; pasan a la relación tarea_bandos.
+        Migraciones._ejecutar(conn, '''
+            CREATE TABLE IF NOT EXISTS tarea_bandos (
+                tarea_id INTEGER NOT NULL,
+                bando_id INTEGER NOT NULL,
+                PRIMARY KEY (tarea_id, bando_id),
+                FOREIGN KEY(tarea_id) REFERENCES tareas(id),
+                FOREIGN KEY(bando_id) REFERENCES bandos(id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_tarea_bandos_bando ON tarea_bandos(bando_id);
+        ''')
+        filas = conn.execute('''
+            SELECT id, bando FROM tareas
+            UNION ALL
+            SELECT id_tarea, bandos FROM reporte
+        ''').fetchall()
+        pares = {
+            (id_tarea, int(b))
+            for id_tarea, texto in filas if texto
+            for b in str(texto).split(",") if b.strip().isdigit()
+        }
+        conn.executemany("INSERT OR IGNORE INTO tarea_bandos (tarea_id, bando_id) VALUES (?, ?)", sorted(pares))
+
+        Migraciones._reconstruir_tabla(conn, "tareas", '''
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_empleado INTEGER NOT NULL,
+            corte INTEGER NOT NULL,
+            operacion INTEGER NOT NULL,
+            fecha TEXT DEFAULT (datetime('now')),
+            FOREIGN KEY(id_empleado) REFERENCES empleados(id),
+            FOREIGN KEY(corte) REFERENCES pedidos(id),
+            FOREIGN KEY(operacion) REFERENCES operaciones(id)
+        ''', "id, id_empleado, corte, operacion, fecha")
+        Migraciones._reconstruir_tabla(conn, "reporte", '''
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_tarea INTEGER NOT NULL,
+            id_empleado INTEGER NOT NULL,
+            id_operacion INTEGER NOT NULL,
+            talla INTEGER NOT NULL,
+            fecha TEXT DEFAULT (datetime('now')),
+            FOREIGN KEY(id_tarea) REFERENCES tareas(id),
+            FOREIGN KEY(id_empleado) REFERENCES empleados(id),
+            FOREIGN KEY(id_operacion) REFERENCES operaciones(id)
+        ''', "id, id_tarea, id_empleado, id_operacion, talla, fecha")
+        Migraciones._ejecutar(conn, '''
+            CREATE INDEX IF NOT EXISTS idx_tareas_empleado ON tareas(id_empleado);
+            CREATE INDEX IF NOT EXISTS idx_reporte_empleado_fecha ON reporte(id_empleado, fecha);
+            CREATE INDEX IF NOT EXISTS idx_reporte_tarea ON reporte(id_tarea);
+            CREATE INDEX IF NOT EXISTS idx_reporte_operacion ON reporte(id_operacion);
+        ''')
+
+    @staticmethod
+    def _v6_totales_pedidos(conn):
+        # pedidos.cantidad se mantiene con triggers sobre bandos en vez de recalcularse.
+        # Los cuerpos de los triggers llevan ";", por eso no pasan por _ejecutar().
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_bandos_total_insert AFTER INSERT ON bandos
+            BEGIN
+                UPDATE pedidos SET cantidad = COALESCE(cantidad, 0) + NEW.cantidad WHERE id = NEW.corte;
+            END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_bandos_total_delete AFTER DELETE ON bandos
+            BEGIN
+                UPDATE pedidos SET cantidad = COALESCE(cantidad, 0) - OLD.cantidad WHERE id = OLD.corte;
+            END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_bandos_total_update AFTER UPDATE OF corte, cantidad ON bandos
+            BEGIN
+                UPDATE pedidos SET cantidad = COALESCE(cantidad, 0) - OLD.cantidad WHERE id = OLD.corte;
+                UPDATE pedidos SET cantidad = COALESCE(cantidad, 0) + NEW.cantidad WHERE id = NEW.corte;
+            END
+        ''')
+        conn.execute('''
+            UPDATE pedidos
+            SET cantidad = (SELECT COALESCE(SUM(cantidad), 0) FROM bandos WHERE corte = pedidos.id)
+        ''')
+
+    @staticmethod
+    def _v7_saldo_tallas(conn):
+        # Saldo por corte y talla (máximo y ya asignado en bandos), mantenido por triggers.
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS corte_talla_saldo (
+                corte INTEGER NOT NULL,
+                talla INTEGER NOT NULL,
+                cantidad_max INTEGER NOT NULL DEFAULT 0,
+                asignada INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (corte, talla),
+                FOREIGN KEY(corte) REFERENCES pedidos(id)
+            ) WITHOUT ROWID
+        ''')
+        sumar_maximo = '''
+                INSERT INTO corte_talla_saldo (corte, talla, cantidad_max) VALUES (NEW.corte, NEW.talla, NEW.cantidad_max)
+                ON CONFLICT(corte, talla) DO UPDATE SET cantidad_max = cantidad_max + excluded.cantidad_max;'''
+        restar_maximo = '''
+                UPDATE corte_talla_saldo SET cantidad_max = cantidad_max - OLD.cantidad_max
+                WHERE corte = OLD.corte AND talla = OLD.talla;'''
+        sumar_asignada = '''
+                INSERT INTO corte_talla_saldo (corte, talla, asignada) VALUES (NEW.corte, NEW.talla, NEW.cantidad)
+                ON CONFLICT(corte, talla) DO UPDATE SET asignada = asignada + excluded.asignada;'''
+        restar_asignada = '''
+                UPDATE corte_talla_saldo SET asignada = asignada - OLD.cantidad
+                WHERE corte = OLD.corte AND talla = OLD.talla;'''
+        triggers = [
+            ("trg_tallas_saldo_insert", "AFTER INSERT ON tallas_corte", sumar_maximo),
+            ("trg_tallas_saldo_delete", "AFTER DELETE ON tallas_corte", restar_maximo),
+            ("trg_tallas_saldo_update", "AFTER UPDATE OF corte, talla, cantidad_max ON tallas_corte",
+             restar_maximo + sumar_maximo),
+            ("trg_bandos_saldo_insert", "AFTER INSERT ON bandos", sumar_asignada),
+            ("trg_bandos_saldo_delete", "AFTER DELETE ON bandos", restar_asignada),
+            ("trg_bandos_saldo_update", "AFTER UPDATE OF corte, talla, cantidad ON bandos",
+             restar_asignada + sumar_asignada),
+        ]
+        for nombre, evento, cuerpo in triggers:
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {nombre} {evento} BEGIN {cuerpo} END")
+
+        conn.execute("DELETE FROM corte_talla_saldo")
+        conn.execute('''
+            INSERT INTO corte_talla_saldo (corte, talla, cantidad_max, asignada)
+            SELECT corte, talla, SUM(cantidad_max), SUM(asignada)
+            FROM (
+                SELECT corte, talla, cantidad_max, 0 AS asignada FROM tallas_corte
+                UNION ALL
+                SELECT corte, talla, 0, cantidad FROM bandos
+            )
+            GROUP BY corte, talla
+        ''')
+
+    @staticmethod
+    def _v8_indices_nomina(conn):
+        # La nómina de toda la planta filtra por periodo sin empleado.
+        Migraciones._ejecutar(conn, '''
+            CREATE INDEX IF NOT EXISTS idx_reporte_fecha ON reporte(fecha);
+            CREATE INDEX IF NOT EXISTS idx_registro_horas_fecha ON registro_horas(fecha);
+        ''')
+
+    @staticmethod
+    def _v9_quincenas_cerradas(conn):
+        # Totales congelados por quincena cerrada; no se modifican una vez escritos.
+        Migraciones._ejecutar(conn, '''
+            CREATE TABLE IF NOT EXISTS quincenas (
+                clave TEXT PRIMARY KEY,
+                inicio TEXT NOT NULL,
+                fin TEXT NOT NULL,
+                cerrada_en TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            CREATE TABLE IF NOT EXISTS nomina_cerrada (
+                clave TEXT NOT NULL,
+                id_empleado INTEGER NOT NULL,
+                nombre TEXT NOT NULL,
+                area TEXT NOT NULL,
+                bandos INTEGER NOT NULL,
+                total_destajo REAL NOT NULL,
+                horas REAL NOT NULL,
+                salario_hora REAL NOT NULL,
+                total_horas REAL NOT NULL,
+                total REAL NOT NULL,
+                PRIMARY KEY (clave, id_empleado),
+                FOREIGN KEY(clave) REFERENCES quincenas(clave)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_nomina_cerrada_update BEFORE UPDATE ON nomina_cerrada
+            BEGIN SELECT RAISE(ABORT, 'La nómina de una quincena cerrada no se puede modificar'); END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_nomina_cerrada_delete BEFORE DELETE ON nomina_cerrada
+            BEGIN SELECT RAISE(ABORT, 'La nómina de una quincena cerrada no se puede modificar'); END
+        ''')
+
+    @staticmethod
+    def _v10_indice_estado_pedidos(conn):
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_estado ON pedidos(estado)")
+
+    @staticmethod
+    def _v11_busqueda_fts(conn):
+        # Índices FTS5 de contenido externo; si SQLite no trae FTS5, Busqueda recurre a LIKE.
+        indices = {
+            "pedidos_fts": ("pedidos", ["marca", "categoria", "color"]),
+            "empleados_fts": ("empleados", ["nombre", "area"]),
+        }
+        for indice, (tabla, columnas) in indices.items():
+            try:
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {indice} USING fts5(
+                        {", ".join(columnas)}, content='{tabla}', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                    )
+                """)
+            except sqlite3.OperationalError:
+                return
+
+            nuevos = ", ".join(f"NEW.{c}" for c in columnas)
+            viejos = ", ".join(f"OLD.{c}" for c in columnas)
+            lista = ", ".join(columnas)
+            insertar = f"INSERT INTO {indice} (rowid, {lista}) VALUES (NEW.id, {nuevos});"
+            borrar = f"INSERT INTO {indice} ({indice}, rowid, {lista}) VALUES ('delete', OLD.id, {viejos});"
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{indice}_insert AFTER INSERT ON {tabla} "
+                         f"BEGIN {insertar} END")
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{indice}_delete AFTER DELETE ON {tabla} "
+                         f"BEGIN {borrar} END")
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{indice}_update AFTER UPDATE OF {lista} ON {tabla} "
+                         f"BEGIN {borrar} {insertar} END")
+            conn.execute(f"INSERT INTO {indice} ({indice}) VALUES ('rebuild')")
+
+    PASOS = [_v1_esquema_base, _v2_estado_pedidos, _v3_reportes_legado, _v4_indices, _v5_tarea_bandos,
+             _v6_totales_pedidos, _v7_saldo_tallas, _v8_indices_nomina, _v9_quincenas_cerradas,
+             _v10_indice_estado_pedidos, _v11_busqueda_fts]
+
+    @staticmethod
+    def version_actual(conn):
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    @staticmethod
+    def aplicar():
+        conn = Conexion.get_conn()
+        version = Migraciones.version_actual(conn)
+        for numero, paso in enumerate(Migraciones.PASOS, start=1):
+            if numero <= version:
+                continue
+            with Conexion.transaccion("IMMEDIATE"):
+                paso(conn)
+                conn.execute(f"PRAGMA user_version = {numero}")
+        return Migraciones.version_actual(conn)
+
+
+class Pedidos:
+    def __init__(self, marca, categoria, color):
+        self.marca = marca
+        self.categoria = categoria
+        self.color = color
+
+    def guardar(self):
+        with Conexion.transaccion() as conn:
+            c = conn.cursor()
+            c.execute(
+                'INSERT INTO pedidos (marca, categoria, color) VALUES (?, ?, ?)',
+                (self.marca, self.categoria, self.color)
+            )
+            id_generado = c.lastrowid
+        return id_generado
+
+    @staticmethod
+    def verificar_totales(corregir=False):
+        # Recalcula pedidos.cantidad desde bandos y devuelve los cortes con diferencias.
+        with Conexion.transaccion() as conn:
+            diferencias = conn.execute('''
+                SELECT p.id, p.cantidad AS guardada, COALESCE(SUM(b.cantidad), 0) AS real
+                FROM pedidos p
+                LEFT JOIN bandos b ON b.corte = p.id
+                GROUP BY p.id
+                HAVING p.cantidad IS NOT COALESCE(SUM(b.cantidad), 0)
+            ''').fetchall()
+            if corregir and diferencias:
+                conn.executemany("UPDATE pedidos SET cantidad = ? WHERE id = ?",
+                                 [(fila['real'], fila['id']) for fila in diferencias])
+        return [dict(fila) for fila in diferencias]
+
+    @staticmethod
+    def listar(estado=None, despues_de=0, limite=None):
+        # Paginación por clave: la siguiente página empieza después del último id recibido.
+        filtro_estado = "AND estado = ?" if estado else ""
+        parametros = (despues_de,) + ((estado,) if estado else ()) + (limite if limite is not None else -1,)
+        conn = Conexion.get_conn()
+        pedidos = conn.execute(f"""
+            SELECT id, marca, categoria, color FROM pedidos
+            WHERE id > ? {filtro_estado}
+            ORDER BY id
+            LIMIT ?
+        """, parametros).fetchall()
+
+        if not pedidos and not despues_de:
+            filtro = f" {estado}" if estado else ""
+            raise NoEncontradoError(f"No hay pedidos{filtro} registrados.")
+        return pedidos
+
+    @staticmethod
+    def buscar(id_corte):
+        conn = Conexion.get_conn()
+        return conn.execute("SELECT * FROM pedidos WHERE id = ?", (id_corte,)).fetchone()
+
+    @staticmethod
+    def detalle_cortes(ids_cortes, tamano_lote=500):
+        # Saldos por talla y bandos de varios cortes con una consulta por tabla (por lote de ids).
+        ids = list(dict.fromkeys(int(i) for i in ids_cortes))
+        detalle = {id_corte: {"tallas": [], "bandos": []} for id_corte in ids}
+
+        conn = Conexion.get_conn()
+        for i in range(0, len(ids), tamano_lote):
+            lote = ids[i:i + tamano_lote]
+            marcadores = ", ".join("?" * len(lote))
+            for fila in conn.execute(f"""
+                SELECT corte, talla, cantidad_max, asignada, cantidad_max - asignada AS restante
+                FROM corte_talla_saldo
+                WHERE corte IN ({marcadores}) AND cantidad_max > 0
+                ORDER BY corte, talla
+            """, lote):
+                detalle[fila['corte']]["tallas"].append(dict(fila))
+            for fila in conn.execute(f"""
+                SELECT id, corte, talla, cantidad
+                FROM bandos
+                WHERE corte IN ({marcadores})
+                ORDER BY corte, id
+            """, lote):
+                detalle[fila['corte']]["bandos"].append(dict(fila))
+        return detalle
+
+    @staticmethod
+    def actualizar_estado(id_corte, nuevo_estado):
+        with Conexion.transaccion() as conn:
+            conn.execute("UPDATE pedidos SET estado = ? WHERE id = ?", (nuevo_estado, id_corte))
+
+
+class TallasCorte:
+    TALLAS_PERMITIDAS = [0, 2, 4, 6, 8, 10, 12, 14, 16, 28, 30, 32, 34, 36, 38, 40, 42, 44]
+
+    def __init__(self, corte, talla, cantidad):
+        self.corte = corte
+        self.talla = talla
+        self.cantidad = cantidad
+
+    def agregar_talla(self):
+        if self.talla not in TallasCorte.TALLAS_PERMITIDAS:
+            raise DatosInvalidosError(f"Talla {self.talla} no permitida.")
+
+        with Conexion.transaccion() as conn:
+            conn.execute('''
+                INSERT INTO tallas_corte (corte, talla, cantidad_max)
+                VALUES (?, ?, ?)
+            ''', (self.corte, self.talla, self.cantidad))
+
+    @staticmethod
+    def obtener_tallas_corte(corte):
+        conn = Conexion.get_conn()
+        tallas = conn.execute('SELECT * FROM tallas_corte WHERE corte = ?', (corte,)).fetchall()
+        if not tallas:
+            raise NoEncontradoError("El corte no tiene tallas registradas.")
+        return [fila[2] for fila in tallas]
+
+    @staticmethod
+    def obtener_tallas_cantidades(corte):
+        conn = Conexion.get_conn()
+        datos = conn.execute("SELECT talla, cantidad_max FROM tallas_corte WHERE corte=?", (corte,)).fetchall()
+        return {t: cant for t, cant in datos}
+
+    @staticmethod
+    def buscar(corte):
+        conn = Conexion.get_conn()
+        return conn.execute('SELECT talla, cantidad FROM tallas_corte WHERE corte = ?', (corte,)).fetchone()
+
+    @staticmethod
+    def obtener_saldos(corte):
+        conn = Conexion.get_conn()
+        datos = conn.execute('''
+            SELECT talla, cantidad_max, asignada, cantidad_max - asignada AS restante
+            FROM corte_talla_saldo
+            WHERE corte = ?
+            ORDER BY talla
+        ''', (corte,)).fetchall()
+        return [dict(fila) for fila in datos]
+
+    @staticmethod
+    def verificar_saldos(corregir=False):
+        # Recalcula corte_talla_saldo desde tallas_corte y bandos y devuelve las diferencias.
+        with Conexion.transaccion() as conn:
+            diferencias = conn.execute('''
+                WITH real AS (
+                    SELECT corte, talla, SUM(cantidad_max) AS cantidad_max, SUM(asignada) AS asignada
+                    FROM (
+                        SELECT corte, talla, cantidad_max, 0 AS asignada FROM tallas_corte
+                        UNION ALL
+                        SELECT corte, talla, 0, cantidad FROM bandos
+                    )
+                    GROUP BY corte, talla
+                )
+                SELECT r.corte, r.talla,
+                       s.cantidad_max AS max_guardado, r.cantidad_max AS max_real,
+                       s.asignada AS asignada_guardada, r.asignada AS asignada_real
+                FROM real r
+                LEFT JOIN corte_talla_saldo s ON s.corte = r.corte AND s.talla = r.talla
+                WHERE s.cantidad_max IS NOT r.cantidad_max OR s.asignada IS NOT r.asignada
+            ''').fetchall()
+            if corregir and diferencias:
+                conn.executemany('''
+                    INSERT INTO corte_talla_saldo (corte, talla, cantidad_max, asignada) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(corte, talla) DO UPDATE
+                    SET cantidad_max = excluded.cantidad_max, asignada = excluded.asignada
+                ''', [(f['corte'], f['talla'], f['max_real'], f['asignada_real']) for f in diferencias])
+        return [dict(fila) for fila in diferencias]
+
+
+class Bandos:
+    def __init__(self, corte, talla, cantidad):
+        self.corte = corte
+        self.talla = talla
+        self.cantidad = cantidad
+
+    def agregar_bando(self):
+        if int(self.cantidad) <= 0:
+            raise DatosInvalidosError("La cantidad del bando debe ser mayor que cero.")
+
+        # BEGIN IMMEDIATE toma el bloqueo de escritura antes de leer el saldo; el INSERT además
+        # vuelve a comprobar el tope por si la llamada se une a una transacción exterior.
+        with Conexion.transaccion("IMMEDIATE") as conn:
+            saldo = conn.execute(
+                'SELECT cantidad_max, asignada FROM corte_talla_saldo WHERE corte = ? AND talla = ?',
+                (self.corte, self.talla)
+            ).fetchone()
+            if not saldo or not saldo["cantidad_max"]:
+                raise NoEncontradoError(f"El corte {self.corte} no contiene talla {self.talla}.")
+
+            c = conn.execute('''
+                INSERT INTO bandos (corte, talla, cantidad)
+                SELECT ?, ?, ? FROM corte_talla_saldo
+                WHERE corte = ? AND talla = ? AND asignada + ? <= cantidad_max
+            ''', (self.corte, self.talla, self.cantidad,
+                  self.corte, self.talla, self.cantidad))
+
+            if c.rowcount == 0:
+                raise CapacidadExcedidaError(f"No se puede agregar {self.cantidad} unidades. "
+                                             f"\nEl máximo permitido para talla {self.talla} es {saldo['cantidad_max']}. "
+                                             f"\n(Actual: {saldo['asignada']})")
+        return c.lastrowid
+
+    @staticmethod
+    def obtener_num_bandos_corte(corte):
+        conn = Conexion.get_conn()
+        bandos = conn.execute('SELECT * FROM bandos WHERE corte = ?', (corte,)).fetchall()
+        if not bandos:
+            return "sin bandos"
+        return bandos
+
+    @staticmethod
+    def obtener_bandos_corte(corte):
+        conn = Conexion.get_conn()
+        datos = conn.execute("SELECT id, talla, cantidad FROM bandos WHERE corte=?", (corte,)).fetchall()
+        return [{"id": b, "talla": t, "cantidad": cant} for b, t, cant in datos]
+
+    @staticmethod
+    def buscar(corte):
+        conn = Conexion.get_conn()
+        bando = conn.execute("SELECT id, talla, cantidad FROM bandos WHERE cortes=?", (corte)).fetchall()
+        return [{"id": b, "talla": t, "cantidad": cant} for b, t, cant in bando]
+
+
+class Operaciones:
+    # Catálogo en memoria: se carga completo una vez y se invalida al escribir.
+    _catalogo = None
+    _catalogo_ruta = None
+    _lock = threading.Lock()
+    _contadores = {"aciertos": 0, "fallos": 0}
+
+    def __init__(self, nombre, small_price, big_price):
+        self.nombre = nombre
+        self.small_price = small_price
+        self.big_price = big_price
+
+    def guardar(self):
+        with Conexion.transaccion() as conn:
+            conn.execute(
+                "INSERT INTO operaciones (nombre, small_price, big_price) VALUES (?, ?, ?)",
+                (self.nombre, self.small_price, self.big_price)
+            )
+        Operaciones.invalidar()
+
+    @staticmethod
+    def _cargar():
+        conn = Conexion.get_conn()
+        filas = conn.execute("SELECT * FROM operaciones ORDER BY id").fetchall()
+        Operaciones._catalogo = {fila['id']: fila for fila in filas}
+        Operaciones._catalogo_ruta = Conexion.ruta
+
+    @staticmethod
+    def _obtener(id_operacion):
+        # Un id desconocido recarga una vez: puede venir de otra terminal.
+        with Operaciones._lock:
+            catalogo = Operaciones._catalogo
+            if catalogo is not None and Operaciones._catalogo_ruta == Conexion.ruta:
+                fila = catalogo.get(int(id_operacion))
+                if fila is not None:
+                    Operaciones._contadores["aciertos"] += 1
+                    return fila
+            Operaciones._contadores["fallos"] += 1
+            Operaciones._cargar()
+            return Operaciones._catalogo.get(int(id_operacion))
+
+    @staticmethod
+    def invalidar():
+        with Operaciones._lock:
+            Operaciones._catalogo = None
+
+    @staticmethod
+    def estadisticas():
+        with Operaciones._lock:
+            datos = dict(Operaciones._contadores)
+            datos["en_cache"] = len(Operaciones._catalogo or {})
+            return datos
+
+    @staticmethod
+    def listar():
+        with Operaciones._lock:
+            if Operaciones._catalogo is None or Operaciones._catalogo_ruta != Conexion.ruta:
+                Operaciones._contadores["fallos"] += 1
+                Operaciones._cargar()
+            else:
+                Operaciones._contadores["aciertos"] += 1
+            operaciones = list(Operaciones._catalogo.values())
+
+        if not operaciones:
+            raise NoEncontradoError("No hay operaciones registradas.")
+        return operaciones
+
+    @staticmethod
+    def buscar(id):
+        operacion = Operaciones._obtener(id)
+        if not operacion:
+            raise NoEncontradoError("No se encontró ninguna operación.")
+        return operacion
+
+    @staticmethod
+    def buscar_nombre_por_id(id_operacion):
+        dato = Operaciones._obtener(id_operacion)
+        return dato['nombre'] if dato else "Desconocida"
+
+    @staticmethod
+    def obtener_precio_small(id_operacion):
+        dato = Operaciones._obtener(id_operacion)
+        return float(dato['small_price']) if dato else 0
+
+    @staticmethod
+    def obtener_precio_big(id_operacion):
+        dato = Operaciones._obtener(id_operacion)
+        return float(dato['big_price']) if dato else 0
+
+    @staticmethod
+    def modificar(id, nombre, small_price, big_price):
+        with Conexion.transaccion() as conn:
+            fila = conn.execute('SELECT * FROM operaciones WHERE id = ?', (id,)).fetchone()
+            if not fila:
+                raise NoEncontradoError("No se encontró ninguna operación con ese nombre!")
+            conn.execute(
+                "UPDATE operaciones SET nombre = ?, small_price = ?, big_price = ? WHERE id = ?",
+                (nombre, small_price, big_price, id)
+            )
+        Operaciones.invalidar()
+
+    @staticmethod
+    def eliminar(id):
+        with Conexion.transaccion() as conn:
+            cur = conn.execute('DELETE FROM operaciones WHERE id = ?', (id,))
+            if cur.rowcount == 0:
+                raise NoEncontradoError("No se encontró ninguna operación con el nombre ingresado!")
+        Operaciones.invalidar()
+
+
+class Empleados:
+    def __init__(self, nombre, telefono, area):
+        self.nombre = nombre
+        self.telefono = telefono
+        self.area = area
+
+    def guardar(self):
+        with Conexion.transaccion() as conn:
+            conn.execute(
+                "INSERT INTO empleados (nombre, telefono, area) VALUES (?, ?, ?)",
+                (self.nombre, self.telefono, self.area)
+            )
+
+    def obtener_id(self):
+        conn = Conexion.get_conn()
+        fila = conn.execute('SELECT * FROM empleados WHERE nombre = ?', (self.nombre,)).fetchone()
+        if not fila:
+            raise NoEncontradoError("No se encontró a ningún empleado")
+        else:
+            return fila['id']
+
+    @staticmethod
+    def listar():
+        conn = Conexion.get_conn()
+        lista = conn.execute('SELECT * FROM empleados').fetchall()
+        if len(lista) < 2:
+            raise NoEncontradoError("No hay empleados registrados!")
+        return lista
+
+    @staticmethod
+    def directorio(area=None, despues_de=0, limite=None):
+        # Empleado, salario vigente y rol de su cuenta en una sola consulta, paginada por id.
+        filtro_area = "AND e.area = ?" if area else ""
+        parametros = (despues_de,) + ((area,) if area else ()) + (limite if limite is not None else -1,)
+        conn = Conexion.get_conn()
+        datos = conn.execute(f'''
+            SELECT e.id, e.nombre, e.telefono, e.area, s.salario, c.rol
+            FROM empleados e
+            LEFT JOIN salarios s ON s.id = (SELECT MIN(id) FROM salarios WHERE id_empleado = e.id)
+            LEFT JOIN cuentas c ON c.id = (SELECT MIN(id) FROM cuentas WHERE id_empleado = e.id)
+            WHERE e.id > ? {filtro_area}
+            ORDER BY e.id
+            LIMIT ?
+        ''', parametros).fetchall()
+        return [dict(fila) for fila in datos]
+
+    @staticmethod
+    def consultar(id_empleado):
+        conn = Conexion.get_conn()
+        empleado = conn.execute('SELECT * FROM empleados WHERE id = ?', (id_empleado,)).fetchone()
+        if not empleado:
+            raise NoEncontradoError("No se encontró a ningpun empleado")
+        return empleado
+
+    @staticmethod
+    def buscar_empleado_costura():
+        conn = Conexion.get_conn()
+        empleados_costura = conn.execute("SELECT id, nombre FROM empleados WHERE area = 'Costura'").fetchall()
+        if not empleados_costura:
+            raise NoEncontradoError("No hay empleados en el área de costura")
+        return [f"{e['id']} - {e['nombre']}" for e in empleados_costura]
+
+    @staticmethod
+    def obtener_area(id_empleado):
+        conn = Conexion.get_conn()
+        dato = conn.execute("SELECT area FROM empleados WHERE id = ?", (id_empleado,)).fetchone()
+        return dato[0] if dato else ""
+
+    @staticmethod
+    def obtener_salario_hora(id_empleado):
+        conn = Conexion.get_conn()
+        dato = conn.execute("SELECT salario_hora FROM empleados WHERE id = ?", (id_empleado,)).fetchone()
+        return float(dato[0]) if dato else 0
+
+    @staticmethod
+    def modificar(id, nombre, telefono, area):
+        with Conexion.transaccion() as conn:
+            fila = conn.execute('SELECT * FROM empleados WHERE id = ?', (id,)).fetchone()
+            if not fila:
+                raise NoEncontradoError("No se encontró a ningún empleado!")
+            conn.execute(
+                "UPDATE empleados SET nombre=?, telefono=?, area=? WHERE id=?",
+                (nombre, telefono, area, id)
+            )
+
+    @staticmethod
+    def eliminar(id):
+        with Conexion.transaccion() as conn:
+            cur = conn.execute('DELETE FROM empleados WHERE id = ?', (id,))
+            if cur.rowcount == 0:
+                raise NoEncontradoError("No se encontró ningún empleado!")
+
+
+class Salarios:
+    def __init__(self, id_empleado, salario):
+        self.id_empleado = id_empleado
+        self.salario = salario
+
+    def agregar_salario(self):
+        with Conexion.transaccion() as conn:
+            conn.execute(
+                "INSERT INTO salarios(id_empleado, salario) VALUES (?, ?)",
+                (self.id_empleado, self.salario)
+            )
+
+    @staticmethod
+    def modificar_salario(id_empleado, nuevo_salario):
+        with Conexion.transaccion() as conn:
+            fila = conn.execute("SELECT * FROM salarios WHERE id_empleado = ?", (id_empleado,)).fetchone()
+            if not fila:
+                raise NoEncontradoError("No se encontró el salario del empleado")
+            conn.execute(
+                "UPDATE salarios SET salario = ? WHERE id_empleado = ?",
+                (nuevo_salario, id_empleado)
+            )
+
+    @staticmethod
+    def mostrar_salario(id_empleado):
+        conn = Conexion.get_conn()
+        fila = conn.execute("SELECT salario FROM salarios WHERE id_empleado = ?", (id_empleado,)).fetchone()
+        if fila:
+            return fila['salario']
+        else:
+            return 0.0
+
+    @staticmethod
+    def eliminar(id_empleado):
+        with Conexion.transaccion() as conn:
+            conn.execute("DELETE FROM salarios WHERE id_empleado = ?", (id_empleado,))
+
+class Tareas:
+    def __init__(self, id_empleado, corte, bandos, operacion, fecha=None):
+        self.id_empleado = id_empleado
+        self.corte = corte
+        self.bandos = bandos
+        self.operacion = operacion
+        self.fecha = fecha
+
+
+    def guardar(self):
+        with Conexion.transaccion() as conn:
+            c = conn.execute('''
+                INSERT INTO tareas (id_empleado, corte, operacion, fecha)
+                VALUES (?, ?, ?, datetime('now'))
+            ''', (self.id_empleado, self.corte, self.operacion))
+            id_tarea = c.lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO tarea_bandos (tarea_id, bando_id) VALUES (?, ?)",
+                [(id_tarea, int(b)) for b in self.bandos]
+            )
+        return id_tarea
+
+    @staticmethod
+    def listar_por_empleado(id_empleado, pendientes=False):
+        # Con pendientes=True se omiten las tareas que ya están en reporte.
+        filtro = "AND NOT EXISTS (SELECT 1 FROM reporte r WHERE r.id_tarea = t.id)" if pendientes else ""
+        conn = Conexion.get_conn()
+        datos = conn.execute(f'''
+            SELECT t.id, t.corte, t.operacion, tb.bando_id
+            FROM tareas t
+            LEFT JOIN tarea_bandos tb ON tb.tarea_id = t.id
+            WHERE t.id_empleado = ? {filtro}
+            ORDER BY t.id, tb.bando_id
+        ''', (id_empleado,)).fetchall()
+
+        resultado = {}
+        for t in datos:
+            tarea = resultado.setdefault(t['id'], {
+                'id': t['id'],
+                'corte': t['corte'],
+                'bandos': [],
+                'operacion': t['operacion']
+            })
+            if t['bando_id'] is not None:
+                tarea['bandos'].append(t['bando_id'])
+        return list(resultado.values())
+
+    @staticmethod
+    def eliminar(id_tarea):
+        with Conexion.transaccion() as conn:
+            reportada = conn.execute("SELECT 1 FROM reporte WHERE id_tarea = ?", (id_tarea,)).fetchone()
+            if reportada:
+                raise ConflictoError("La tarea ya fue reportada como realizada y no se puede eliminar.")
+            conn.execute("DELETE FROM tarea_bandos WHERE tarea_id = ?", (id_tarea,))
+            conn.execute("DELETE FROM tareas WHERE id = ?", (id_tarea,))
+
+
+class Reportes:
+    def __init__(self, id_tarea, fecha, estado):
+        self.id_tarea = id_tarea
+        self.fecha = fecha
+        self.estado = estado
+
+    @staticmethod
+    def registrar_tarea(id_tarea):
+        Reportes.registrar_tareas([id_tarea])
+
+    @staticmethod
+    def registrar_tareas(ids_tareas, tamano_lote=500):
+        ids = list(dict.fromkeys(int(i) for i in ids_tareas))
+        resultado = {"registradas": [], "fallidas": {}}
+        if not ids:
+            return resultado
+
+        with Conexion.transaccion() as conn:
+            tareas = {}
+            reportadas = set()
+            for i in range(0, len(ids), tamano_lote):
+                lote = ids[i:i + tamano_lote]
+                marcadores = ", ".join("?" * len(lote))
+                for fila in conn.execute(f"""
+                    SELECT id, id_empleado, operacion AS id_operacion
+                    FROM tareas
+                    WHERE id IN ({marcadores})
+                """, lote):
+                    tareas[fila['id']] = fila
+                reportadas.update(fila[0] for fila in conn.execute(
+                    f"SELECT id_tarea FROM reporte WHERE id_tarea IN ({marcadores})", lote
+                ))
+
+            filas = []
+            for id_tarea in ids:
+                tarea = tareas.get(id_tarea)
+                if tarea is None:
+                    resultado["fallidas"][id_tarea] = "La tarea no existe."
+                    continue
+                if id_tarea in reportadas:
+                    resultado["fallidas"][id_tarea] = "La tarea ya fue registrada."
+                    continue
+                filas.append((id_tarea, tarea['id_empleado'], tarea['id_operacion'], 30))
+                resultado["registradas"].append(id_tarea)
+
+            conn.executemany("""
+                INSERT INTO reporte (id_tarea, id_empleado, id_operacion, talla, fecha)
+                VALUES (?, ?, ?, ?, datetime('now'))
+            """, filas)
+        return resultado
+
+    @staticmethod
+    def obtener_tareas_realizadas(id_empleado, inicio, fin):
+        conn = Conexion.get_conn()
+        datos = conn.execute("""
+                  SELECT r.id,
+                         r.fecha,
+                         r.id_operacion,
+                         r.talla,
+                         group_concat(tb.bando_id, ', ') AS bandos,
+                         count(tb.bando_id) AS num_bandos,
+                         o.nombre AS operacion
+                  FROM reporte r
+                           JOIN operaciones o ON r.id_operacion = o.id
+                           LEFT JOIN tarea_bandos tb ON tb.tarea_id = r.id_tarea
+                  WHERE r.id_empleado = ?
+                    AND r.fecha BETWEEN ? AND ?
+                  GROUP BY r.id
+                  """, (id_empleado, inicio, fin)).fetchall()
+        return datos
+
+    @staticmethod
+    def bandos_realizados(id_operacion, corte=None):
+        conn = Conexion.get_conn()
+        datos = conn.execute("""
+            SELECT DISTINCT tb.bando_id
+            FROM reporte r
+            JOIN tarea_bandos tb ON tb.tarea_id = r.id_tarea
+            JOIN tareas t ON t.id = r.id_tarea
+            WHERE r.id_operacion = ?
+              AND (? IS NULL OR t.corte = ?)
+            ORDER BY tb.bando_id
+        """, (id_operacion, corte, corte)).fetchall()
+        return [fila[0] for fila in datos]
+
+    @staticmethod
+    def eliminar(id_reporte):
+        with Conexion.transaccion() as conn:
+            conn.execute("DELETE FROM reporte WHERE id = ?", (id_reporte,))
+
+    @staticmethod
+    def buscar_por_empleado(id_empleado):
+        conn = Conexion.get_conn()
+        datos = conn.execute(
+            '''SELECT r.id, r.id_empleado, t.corte, group_concat(tb.bando_id, ', ') AS bandos,
+                      r.id_operacion AS operacion, r.fecha
+               FROM reporte r
+               INNER JOIN tareas t ON r.id_tarea = t.id
+               LEFT JOIN tarea_bandos tb ON tb.tarea_id = r.id_tarea
+               WHERE r.id_empleado = ?
+               GROUP BY r.id''',
+            (id_empleado,)
+        ).fetchall()
+        return datos
+
+
+class RegistroHoras:
+    def __init__(self, id_empleado, fecha=None, hora_entrada=None, hora_salida=None):
+        self.id_empleado = id_empleado
+        self.fecha = fecha
+        self.hora_entrada = hora_entrada
+        self.hora_salida = hora_salida
+
+    @staticmethod
+    def registrar_entrada(id_empleado):
+        with Conexion.transaccion() as conn:
+            pendiente = conn.execute('''
+                SELECT id FROM registro_horas
+                WHERE id_empleado = ? AND hora_salida IS NULL
+                AND fecha = date('now')
+            ''', (id_empleado,)).fetchone()
+
+            if pendiente:
+                raise ConflictoError("Ya existe una entrada sin marcar salida para hoy.")
+            conn.execute('''
+                INSERT INTO registro_horas (id_empleado, hora_entrada)
+                VALUES (?, time('now'))
+            ''', (id_empleado,))
+
+    @staticmethod
+    def registrar_salida(id_empleado):
+        with Conexion.transaccion() as conn:
+            fila = conn.execute('''
+                SELECT id FROM registro_horas
+                WHERE id_empleado = ? AND hora_salida IS NULL
+                ORDER BY id DESC LIMIT 1
+            ''', (id_empleado,)).fetchone()
+
+            if not fila:
+                raise ConflictoError("No hay entrada registrada pendiente de salida.")
+            conn.execute('''
+                UPDATE registro_horas
+                SET hora_salida = time('now')
+                WHERE id = ?
+            ''', (fila[0],))
+
+    @staticmethod
+    def obtener_registros_horarios(id_empleado, inicio, fin):
+        conn = Conexion.get_conn()
+        datos = conn.execute('''
+            SELECT fecha, hora_entrada, hora_salida
+            FROM registro_horas
+            WHERE id_empleado = ? AND fecha BETWEEN ? AND ?
+            ORDER BY fecha ASC
+        ''', (id_empleado, str(inicio), str(fin))).fetchall()
+
+        registros = []
+        for d in datos:
+            fecha, entrada, salida = d
+            if entrada and salida:
+                formato = "%H:%M:%S"
+                h1 = datetime.strptime(entrada, formato)
+                h2 = datetime.strptime(salida, formato)
+                horas = (h2 - h1).seconds / 3600
+            else:
+                horas = 0
+            registros.append({
+                'fecha': fecha,
+                'entrada': entrada,
+                'salida': salida,
+                'horas': round(horas, 2)
+            })
+        return registros
+
+    @staticmethod
+    def obtener_por_empleado(id_empleado):
+        conn = Conexion.get_conn()
+        c = conn.execute("""
+              SELECT fecha, hora_entrada, hora_salida, horas_trabajadas, salario_hora
+              FROM registro_horas
+              WHERE empleado_id = ?
+                AND (pagado IS NULL OR pagado = 0)
+              """, (id_empleado,))
+        registros = [
+            {
+            'fecha': row[0],
+            'hora_entrada': row[1],
+            'hora_salida': row[2],
+            'horas_trabajadas': row[3],
+            'salario_hora': row[4]
+            }
+            for row in c.fetchall()
+        ]
+        return registros
+
+    @staticmethod
+    def reiniciar_horas(id_empleado):
+        with Conexion.transaccion() as conn:
+            conn.execute("DELETE FROM registro_horas WHERE empleado_id = ?", (id_empleado,))
+
+
+class Archivo:
+    # Cortes entregados y todo su trabajo se mueven a <base>_archivo.db, adjunta como "archivo".
+    # Las vistas temporales historico_<tabla> unen ambas bases para los reportes viejos.
+    TABLAS = ["pedidos", "tallas_corte", "bandos", "tareas", "tarea_bandos", "reporte"]
+
+    @staticmethod
+    def ruta():
+        base, extension = os.path.splitext(Conexion.ruta)
+        return f"{base}_archivo{extension}"
+
+    @staticmethod
+    def _adjuntar(conn, crear=False):
+        # ATTACH no se permite dentro de una transacción; devuelve si el archivo quedó disponible.
+        if any(fila['name'] == "archivo" for fila in conn.execute("PRAGMA database_list")):
+            return True
+        if conn.in_transaction or not (crear or os.path.exists(Archivo.ruta())):
+            return False
+
+        conn.execute("ATTACH DATABASE ? AS archivo", (Archivo.ruta(),))
+        # El archivo guarda la versión de esquema con la que se igualó; si una migración cambió
+        # las tablas después, se crean las que falten y se agregan las columnas nuevas.
+        version = conn.execute("PRAGMA main.user_version").fetchone()[0]
+        if conn.execute("PRAGMA archivo.user_version").fetchone()[0] != version:
+            Archivo._igualar_esquema(conn)
+            conn.execute(f"PRAGMA archivo.user_version = {version}")
+        for tabla in Archivo.TABLAS:
+            columnas = Archivo._columnas(conn, tabla)
+            conn.execute(f"""
+                CREATE TEMP VIEW IF NOT EXISTS historico_{tabla} AS
+                SELECT {columnas} FROM main.{tabla} UNION ALL SELECT {columnas} FROM archivo.{tabla}
+            """)
+        return True
+
+    @staticmethod
+    def _columnas(conn, tabla):
+        return ", ".join(f'"{c["name"]}"' for c in conn.execute(f"PRAGMA main.table_info({tabla})"))
+
+    @staticmethod
+    def _igualar_esquema(conn):
+        marcadores = ", ".join("?" * len(Archivo.TABLAS))
+        esquema = conn.execute(f"""
+            SELECT sql FROM main.sqlite_master
+            WHERE tbl_name IN ({marcadores}) AND type IN ('table', 'index') AND sql IS NOT NULL
+            ORDER BY type DESC
+        """, Archivo.TABLAS).fetchall()
+        for fila in esquema:
+            conn.execute(re.sub(r'^CREATE (TABLE|INDEX) "?(\w+)"?', r'CREATE \1 IF NOT EXISTS archivo."\2"', fila['sql']))
+        for tabla in Archivo.TABLAS:
+            existentes = {c['name'] for c in conn.execute(f"PRAGMA archivo.table_info({tabla})")}
+            for c in conn.execute(f"PRAGMA main.table_info({tabla})").fetchall():
+                if c['name'] not in existentes:
+                    defecto = f" DEFAULT {c['dflt_value']}" if c['dflt_value'] is not None else ""
+                    conn.execute(f'ALTER TABLE archivo.{tabla} ADD COLUMN "{c["name"]}" {c["type"]}{defecto}')
+        conn.execute("CREATE TABLE IF NOT EXISTS archivo.archivo_meta (clave TEXT PRIMARY KEY, valor TEXT NOT NULL)")
+
+    @staticmethod
+    def hasta():
+        conn = Conexion.get_conn()
+        if not Archivo._adjuntar(conn):
+            return None
+        fila = conn.execute("SELECT valor FROM archivo.archivo_meta WHERE clave = 'hasta'").fetchone()
+        return fila['valor'] if fila else None
+
+    @staticmethod
+    def tablas(inicio):
+        # Un periodo que empieza antes del último corte de archivo se lee por las vistas históricas.
+        hasta = Archivo.hasta()
+        if hasta and str(inicio) < hasta:
+            return {tabla: f"historico_{tabla}" for tabla in Archivo.TABLAS}
+        return {tabla: tabla for tabla in Archivo.TABLAS}
+
+    @staticmethod
+    def archivar(antes_de, estado="entregado"):
+        conn = Conexion.get_conn()
+        if not Archivo._adjuntar(conn, crear=True):
+            raise ConflictoError("No se puede archivar dentro de una transacción abierta.")
+
+        limite = str(antes_de)
+        cortes = "SELECT id FROM temp.cortes_por_archivar"
+        filtros = {
+            "pedidos": f"id IN ({cortes})",
+            "tallas_corte": f"corte IN ({cortes})",
+            "bandos": f"corte IN ({cortes})",
+            "tareas": f"corte IN ({cortes})",
+            "tarea_bandos": f"tarea_id IN (SELECT id FROM main.tareas WHERE corte IN ({cortes}))",
+            "reporte": f"id_tarea IN (SELECT id FROM main.tareas WHERE corte IN ({cortes}))",
+        }
+        movidos = {}
+        # Con WAL, SQLite no confirma de forma atómica una transacción que abarca dos bases. Por eso
+        # se copia y se confirma primero en el archivo, y solo después se borra de la base principal.
+        # Si algo falla entre los dos pasos, repetir el archivado es seguro: INSERT OR REPLACE usa
+        # los mismos ids.
+        with Conexion.transaccion("IMMEDIATE") as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS cortes_por_archivar (id INTEGER PRIMARY KEY)")
+            conn.execute("DELETE FROM temp.cortes_por_archivar")
+            conn.execute('''
+                INSERT INTO temp.cortes_por_archivar
+                SELECT p.id FROM main.pedidos p
+                WHERE p.estado = ?
+                  AND NOT EXISTS (SELECT 1 FROM main.tareas t WHERE t.corte = p.id AND t.fecha >= ?)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM main.reporte r JOIN main.tareas t ON t.id = r.id_tarea
+                      WHERE t.corte = p.id AND r.fecha >= ?
+                  )
+            ''', (estado, limite, limite))
+
+            for tabla in Archivo.TABLAS:
+                columnas = Archivo._columnas(conn, tabla)
+                conn.execute(f"""
+                    INSERT OR REPLACE INTO archivo.{tabla} ({columnas})
+                    SELECT {columnas} FROM main.{tabla} WHERE {filtros[tabla]}
+                """)
+            conn.execute('''
+                INSERT INTO archivo.archivo_meta (clave, valor) VALUES ('hasta', ?)
+                ON CONFLICT(clave) DO UPDATE SET valor = max(valor, excluded.valor)
+            ''', (limite,))
+
+        with Conexion.transaccion("IMMEDIATE") as conn:
+            for tabla in ["reporte", "tarea_bandos", "tareas", "bandos", "tallas_corte", "pedidos"]:
+                movidos[tabla] = conn.execute(f"DELETE FROM main.{tabla} WHERE {filtros[tabla]}").rowcount
+            conn.execute(f"DELETE FROM main.corte_talla_saldo WHERE corte IN ({cortes})")
+        return movidos
+
+
+class Nomina:
+    # Horas de un marcaje; una salida anterior a la entrada cruzó la medianoche.
+    _HORAS = """
+        CASE WHEN hora_entrada IS NULL OR hora_salida IS NULL THEN 0
+             WHEN hora_salida >= hora_entrada THEN (julianday(hora_salida) - julianday(hora_entrada)) * 24
+             ELSE (julianday(hora_salida) - julianday(hora_entrada)) * 24 + 24 END"""
+
+    # Precio por bando según la talla del bando (la del reporte si el bando ya no existe).
+    _PRECIO = "CASE WHEN COALESCE(b.talla, r.talla) < 28 THEN o.small_price ELSE o.big_price END"
+
+    @staticmethod
+    def calcular(inicio, fin, id_empleado=None):
+        # GROUP BY +columna: que el planificador use el rango de fechas y no recorra
+        # idx_reporte_empleado_fecha completo solo para evitar el ordenamiento.
+        filtro_reporte = "AND r.id_empleado = ?" if id_empleado is not None else ""
+        filtro_horas = "AND id_empleado = ?" if id_empleado is not None else ""
+        filtro_empleado = "WHERE e.id = ?" if id_empleado is not None else ""
+        extra = (id_empleado,) if id_empleado is not None else ()
+
+        fuente = Archivo.tablas(inicio)
+
+        conn = Conexion.get_conn()
+        datos = conn.execute(f"""
+            WITH destajo AS (
+                SELECT r.id_empleado, COUNT(*) AS bandos, SUM({Nomina._PRECIO}) AS total
+                FROM {fuente['reporte']} r
+                JOIN operaciones o ON o.id = r.id_operacion
+                JOIN {fuente['tarea_bandos']} tb ON tb.tarea_id = r.id_tarea
+                LEFT JOIN {fuente['bandos']} b ON b.id = tb.bando_id
+                WHERE r.fecha >= ? AND r.fecha < date(?, '+1 day') {filtro_reporte}
+                GROUP BY +r.id_empleado
+            ), horas AS (
+                SELECT id_empleado, SUM({Nomina._HORAS}) AS horas
+                FROM registro_horas
+                WHERE fecha BETWEEN ? AND ? {filtro_horas}
+                GROUP BY id_empleado
+            )
+            SELECT e.id AS id_empleado, e.nombre, e.area,
+                   IFNULL(d.bandos, 0) AS bandos,
+                   ROUND(IFNULL(d.total, 0), 2) AS total_destajo,
+                   ROUND(IFNULL(h.horas, 0), 2) AS horas,
+                   IFNULL(s.salario, 0) AS salario_hora,
+                   ROUND(IFNULL(h.horas, 0) * IFNULL(s.salario, 0), 2) AS total_horas,
+                   ROUND(IFNULL(d.total, 0) + IFNULL(h.horas, 0) * IFNULL(s.salario, 0), 2) AS total
+            FROM empleados e
+            LEFT JOIN destajo d ON d.id_empleado = e.id
+            LEFT JOIN horas h ON h.id_empleado = e.id
+            LEFT JOIN salarios s ON s.id = (SELECT MIN(id) FROM salarios WHERE id_empleado = e.id)
+            {filtro_empleado}
+            ORDER BY e.id
+        """, (str(inicio), str(fin)) + extra + (str(inicio), str(fin)) + extra + extra).fetchall()
+        return [dict(fila) for fila in datos]
+
+    @staticmethod
+    def resumen_empleado(id_empleado, inicio, fin):
+        datos = Nomina.calcular(inicio, fin, id_empleado)
+        if not datos:
+            raise NoEncontradoError(f"No existe el empleado {id_empleado}.")
+        return datos[0]
+
+    @staticmethod
+    def detalle_destajo(id_empleado, inicio, fin):
+        fuente = Archivo.tablas(inicio)
+
+        conn = Conexion.get_conn()
+        datos = conn.execute(f"""
+            SELECT t.corte, o.nombre AS operacion, COALESCE(b.talla, r.talla) AS talla,
+                   group_concat(tb.bando_id, ', ') AS bandos,
+                   COUNT(*) AS num_bandos,
+                   {Nomina._PRECIO} AS precio,
+                   ROUND(COUNT(*) * {Nomina._PRECIO}, 2) AS total
+            FROM {fuente['reporte']} r
+            JOIN {fuente['tareas']} t ON t.id = r.id_tarea
+            JOIN operaciones o ON o.id = r.id_operacion
+            JOIN {fuente['tarea_bandos']} tb ON tb.tarea_id = r.id_tarea
+            LEFT JOIN {fuente['bandos']} b ON b.id = tb.bando_id
+            WHERE r.id_empleado = ? AND r.fecha >= ? AND r.fecha < date(?, '+1 day')
+            GROUP BY r.id, COALESCE(b.talla, r.talla)
+            ORDER BY r.fecha, r.id
+        """, (id_empleado, str(inicio), str(fin))).fetchall()
+        return [dict(fila) for fila in datos]
+
+    @staticmethod
+    def detalle_horas(id_empleado, inicio, fin):
+        conn = Conexion.get_conn()
+        datos = conn.execute(f"""
+            SELECT h.fecha, h.hora_entrada, h.hora_salida,
+                   ROUND(h.horas, 2) AS horas_trabajadas,
+                   IFNULL(s.salario, 0) AS salario_hora,
+                   ROUND(h.horas * IFNULL(s.salario, 0), 2) AS pago_dia
+            FROM (
+                SELECT id_empleado, fecha, hora_entrada, hora_salida, {Nomina._HORAS} AS horas
+                FROM registro_horas
+                WHERE id_empleado = ? AND fecha BETWEEN ? AND ?
+            ) h
+            LEFT JOIN salarios s ON s.id = (SELECT MIN(id) FROM salarios WHERE id_empleado = h.id_empleado)
+            ORDER BY h.fecha ASC
+        """, (id_empleado, str(inicio), str(fin))).fetchall()
+        return [dict(fila) for fila in datos]
+
+
+class Quincena:
+    # Dos quincenas por mes: "AAAA-MM-1" va del 9 al 22 y "AAAA-MM-2" del 23 al 8 del mes siguiente.
+    def __init__(self, anio, mes, mitad):
+        if mitad not in (1, 2) or not 1 <= mes <= 12:
+            raise DatosInvalidosError(f"Quincena inválida: {anio}-{mes}-{mitad}")
+        self.anio = anio
+        self.mes = mes
+        self.mitad = mitad
+        if mitad == 1:
+            self.inicio = date(anio, mes, 9)
+            self.fin = date(anio, mes, 22)
+        else:
+            self.inicio = date(anio, mes, 23)
+            siguiente = date(anio + mes // 12, mes % 12 + 1, 1)
+            self.fin = siguiente.replace(day=8)
+
+    @property
+    def clave(self):
+        return f"{self.anio:04d}-{self.mes:02d}-{self.mitad}"
+
+    def __eq__(self, otra):
+        return isinstance(otra, Quincena) and self.clave == otra.clave
+
+    def __repr__(self):
+        return f"Quincena({self.clave}: {self.inicio} al {self.fin})"
+
+    @staticmethod
+    def para_fecha(fecha):
+        if 9 <= fecha.day <= 22:
+            return Quincena(fecha.year, fecha.month, 1)
+        if fecha.day >= 23:
+            return Quincena(fecha.year, fecha.month, 2)
+        anterior = fecha.replace(day=1) - timedelta(days=1)
+        return Quincena(anterior.year, anterior.month, 2)
+
+    @staticmethod
+    def actual():
+        return Quincena.para_fecha(datetime.now().date())
+
+    @staticmethod
+    def desde_clave(clave):
+        try:
+            anio, mes, mitad = (int(parte) for parte in clave.split("-"))
+        except ValueError:
+            raise DatosInvalidosError(f"Clave de quincena inválida: {clave!r} (formato AAAA-MM-1 o AAAA-MM-2)")
+        return Quincena(anio, mes, mitad)
+
+    def anterior(self):
+        return Quincena.para_fecha(self.inicio - timedelta(days=1))
+
+    def siguiente(self):
+        return Quincena.para_fecha(self.fin + timedelta(days=1))
+
+    def cerrada(self):
+        conn = Conexion.get_conn()
+        return conn.execute("SELECT 1 FROM quincenas WHERE clave = ?", (self.clave,)).fetchone() is not None
+
+    def cerrar(self):
+        if self.fin >= datetime.now().date():
+            raise ConflictoError(f"La quincena {self.clave} termina el {self.fin} y aún no se puede cerrar.")
+
+        with Conexion.transaccion("IMMEDIATE") as conn:
+            if conn.execute("SELECT 1 FROM quincenas WHERE clave = ?", (self.clave,)).fetchone():
+                raise ConflictoError(f"La quincena {self.clave} ya está cerrada.")
+            nomina = Nomina.calcular(self.inicio, self.fin)
+            conn.execute(
+                "INSERT INTO quincenas (clave, inicio, fin) VALUES (?, ?, ?)",
+                (self.clave, str(self.inicio), str(self.fin))
+            )
+            conn.executemany('''
+                INSERT INTO nomina_cerrada (clave, id_empleado, nombre, area, bandos, total_destajo,
+                                            horas, salario_hora, total_horas, total)
+                VALUES (:clave, :id_empleado, :nombre, :area, :bandos, :total_destajo,
+                        :horas, :salario_hora, :total_horas, :total)
+            ''', [dict(fila, clave=self.clave) for fila in nomina])
+        return len(nomina)
+
+    def reporte_empleado(self, id_empleado):
+        empleado = dict(Empleados.consultar(id_empleado))
+        costura = "costura" in empleado['area'].lower()
+        return {
+            "empleado": empleado,
+            "costura": costura,
+            "destajo": Nomina.detalle_destajo(id_empleado, self.inicio, self.fin) if costura else [],
+            "horas": [] if costura else Nomina.detalle_horas(id_empleado, self.inicio, self.fin),
+            "resumen": self.resumen_empleado(id_empleado),
+        }
+
+    def nomina(self):
+        conn = Conexion.get_conn()
+        if not self.cerrada():
+            return Nomina.calcular(self.inicio, self.fin)
+        datos = conn.execute('''
+            SELECT id_empleado, nombre, area, bandos, total_destajo, horas, salario_hora, total_horas, total
+            FROM nomina_cerrada
+            WHERE clave = ?
+            ORDER BY id_empleado
+        ''', (self.clave,)).fetchall()
+        return [dict(fila) for fila in datos]
+
+    def resumen_empleado(self, id_empleado):
+        conn = Conexion.get_conn()
+        if not self.cerrada():
+            return Nomina.resumen_empleado(id_empleado, self.inicio, self.fin)
+        fila = conn.execute('''
+            SELECT id_empleado, nombre, area, bandos, total_destajo, horas, salario_hora, total_horas, total
+            FROM nomina_cerrada
+            WHERE clave = ? AND id_empleado = ?
+        ''', (self.clave, id_empleado)).fetchone()
+        if not fila:
+            raise NoEncontradoError(f"El empleado {id_empleado} no figura en la quincena cerrada {self.clave}.")
+        return dict(fila)
+
+
+class Exportacion:
+    # Tablas que se pueden exportar y la columna de fecha por la que se filtran (None: sin fecha).
+    TABLAS = {
+        "pedidos": None, "tallas_corte": None, "bandos": None, "tareas": "fecha", "tarea_bandos": None,
+        "reporte": "fecha", "registro_horas": "fecha", "empleados": None, "salarios": None, "operaciones": None,
+    }
+    COLUMNAS_NOMINA = ["quincena", "id_empleado", "nombre", "area", "bandos", "total_destajo",
+                       "horas", "salario_hora", "total_horas", "total"]
+
+    @staticmethod
+    def conjuntos():
+        return list(Exportacion.TABLAS) + ["nomina"]
+
+    @staticmethod
+    def _por_lotes(cursor, tamano_lote):
+        while True:
+            lote = cursor.fetchmany(tamano_lote)
+            if not lote:
+                return
+            for fila in lote:
+                yield tuple(fila)
+
+    @staticmethod
+    def _quincenas_completas(desde, hasta):
+        # Solo quincenas enteras y terminadas: desde avanza a la primera que empieza ese día o después,
+        # hasta retrocede a la última que termina ese día o antes, y la quincena en curso nunca entra.
+        ultima = Quincena.actual().anterior()
+        if hasta and hasta < ultima.fin:
+            ultima = Quincena.para_fecha(hasta)
+            if ultima.fin > hasta:
+                ultima = ultima.anterior()
+        primera = ultima
+        if desde:
+            primera = Quincena.para_fecha(desde)
+            if primera.inicio < desde:
+                primera = primera.siguiente()
+        if primera.inicio > ultima.inicio:
+            raise DatosInvalidosError(f"No hay quincenas completas y cerradas entre {desde} y {hasta or ultima.fin}.")
+        return primera, ultima
+
+    @staticmethod
+    def _nomina(primera, ultima):
+        # Una consulta agrupada por quincena: en memoria nunca hay más de una quincena de filas.
+        quincena = primera
+        while quincena.inicio <= ultima.inicio:
+            for fila in quincena.nomina():
+                yield (quincena.clave,) + tuple(fila[c] for c in Exportacion.COLUMNAS_NOMINA[1:])
+            quincena = quincena.siguiente()
+
+    @staticmethod
+    def abrir(conjunto, desde=None, hasta=None, tamano_lote=1000):
+        # Devuelve (columnas, generador de filas); las filas se leen del cursor por lotes con fetchmany.
+        if conjunto == "nomina":
+            # Sin desde se exporta una sola quincena: la anterior, o la última que termina en hasta.
+            primera, ultima = Exportacion._quincenas_completas(desde, hasta)
+            return list(Exportacion.COLUMNAS_NOMINA), Exportacion._nomina(primera, ultima)
+
+        if conjunto not in Exportacion.TABLAS:
+            raise DatosInvalidosError(f"No se puede exportar {conjunto!r}.")
+        columna_fecha = Exportacion.TABLAS[conjunto]
+        if (desde or hasta) and not columna_fecha:
+            raise DatosInvalidosError(f"La tabla {conjunto} no tiene fecha para filtrar.")
+
+        # Con un archivo adjunto, las tablas archivadas se leen por su vista histórica.
+        fuente = Archivo.tablas(date.min).get(conjunto, conjunto)
+        condiciones = []
+        parametros = []
+        if desde:
+            condiciones.append(f"{columna_fecha} >= ?")
+            parametros.append(str(desde))
+        if hasta:
+            condiciones.append(f"{columna_fecha} < date(?, '+1 day')")
+            parametros.append(str(hasta))
+        donde = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+
+        conn = Conexion.get_conn()
+        cursor = conn.execute(f"SELECT * FROM {fuente} {donde}", parametros)
+        columnas = [columna[0] for columna in cursor.description]
+        return columnas, Exportacion._por_lotes(cursor, tamano_lote)
+
+
+class Cuentas:
+    def __init__(self, id_empleado, usuario, password, rol):
+        self.id_empleado = id_empleado
+        self.usuario = usuario
+        self.password = password
+        self.rol = rol
+
+    def guardar(self):
+        with Conexion.transaccion() as conn:
+            conn.execute(
+                "INSERT INTO cuentas(id_empleado, usuario, password, rol) VALUES (?, ?, ?, ?)",
+                (self.id_empleado, self.usuario, self.password, self.rol)
+            )
+
+    @staticmethod
+    def listar():
+        conn = Conexion.get_conn()
+        cur = conn.execute("SELECT * FROM cuentas").fetchall()
+        if not cur:
+            return False
+        return True
+
+    @staticmethod
+    def buscar(usuario, password):
+        conn = Conexion.get_conn()
+        cur = conn.execute("SELECT rol FROM cuentas WHERE usuario = ? AND password = ?" ,
+                           (usuario, password)).fetchone()
+        if not cur:
+            raise CredencialesInvalidasError("Usuario o contraseña incorrectos!")
+        return cur['rol']
+
+    @staticmethod
+    def buscar_id(usuario, password):
+        conn = Conexion.get_conn()
+        id_empleado = conn.execute("SELECT id_empleado FROM cuentas WHERE usuario = ? AND password = ?",
+                                   (usuario, password)).fetchone()
+        return id_empleado[0] if id_empleado else None
+
+    @staticmethod
+    def eliminar(id_empleado):
+        with Conexion.transaccion() as conn:
+            conn.execute("DELETE FROM cuentas WHERE id_empleado = ?", (id_empleado,))
+
+
+class Busqueda:
+    # Búsqueda incremental: cada palabra escrita funciona como prefijo y todas deben coincidir.
+    @staticmethod
+    def _terminos(texto):
+        return re.findall(r"\w+", texto or "")
+
+    @staticmethod
+    def _con_fts(conn, indice):
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (indice,)
+        ).fetchone() is not None
+
+    @staticmethod
+    def _buscar(tabla, columnas, texto, filtro, limite):
+        conn = Conexion.get_conn()
+        campos = ", ".join(f"t.{c}" for c in ["id"] + columnas)
+        columna_filtro, valor_filtro = filtro
+        condicion = f"AND t.{columna_filtro} = ?" if valor_filtro else ""
+        extra = (valor_filtro,) if valor_filtro else ()
+        terminos = Busqueda._terminos(texto)
+
+        resultados = {}
+        # Un número puede ser el id que aparece en los combos ("12 - ...").
+        if len(terminos) == 1 and terminos[0].isdigit():
+            for fila in conn.execute(f"SELECT {campos} FROM {tabla} t WHERE t.id = ? {condicion}",
+                                     (int(terminos[0]),) + extra):
+                resultados[fila['id']] = fila
+
+        if not terminos:
+            datos = conn.execute(f"SELECT {campos} FROM {tabla} t WHERE 1 {condicion} ORDER BY t.id LIMIT ?",
+                                 extra + (limite,)).fetchall()
+        elif Busqueda._con_fts(conn, f"{tabla}_fts"):
+            consulta = " ".join(f'"{termino}"*' for termino in terminos)
+            datos = conn.execute(f"""
+                SELECT {campos}
+                FROM {tabla}_fts f
+                JOIN {tabla} t ON t.id = f.rowid
+                WHERE {tabla}_fts MATCH ? {condicion}
+                ORDER BY f.rank
+                LIMIT ?
+            """, (consulta,) + extra + (limite,)).fetchall()
+        else:
+            texto_columnas = " || ' ' || ".join(f"t.{c}" for c in columnas)
+            condiciones = " AND ".join(f"({texto_columnas}) LIKE ?" for _ in terminos)
+            datos = conn.execute(f"""
+                SELECT {campos} FROM {tabla} t
+                WHERE {condiciones} {condicion}
+                ORDER BY t.id
+                LIMIT ?
+            """, tuple(f"%{termino}%" for termino in terminos) + extra + (limite,)).fetchall()
+
+        for fila in datos:
+            resultados.setdefault(fila['id'], fila)
+        return list(resultados.values())[:limite]
+
+    @staticmethod
+    def pedidos(texto, estado=None, limite=20):
+        return Busqueda._buscar("pedidos", ["marca", "categoria", "color"], texto, ("estado", estado), limite)
+
+    @staticmethod
+    def empleados(texto, area=None, limite=20):
+        return Busqueda._buscar("empleados", ["nombre", "area"], texto, ("area", area), limite)
+
+    @staticmethod
+    def verificar_indices(corregir=False):
+        # integrity-check compara cada índice FTS con su tabla; devuelve los índices desfasados.
+        conn = Conexion.get_conn()
+        desfasados = []
+        for indice in ("pedidos_fts", "empleados_fts"):
+            if not Busqueda._con_fts(conn, indice):
+                continue
+            try:
+                conn.execute(f"INSERT INTO {indice}({indice}) VALUES ('integrity-check')")
+            except sqlite3.DatabaseError:
+                desfasados.append(indice)
+                if corregir:
+                    with Conexion.transaccion() as conn:
+                        conn.execute(f"INSERT INTO {indice}({indice}) VALUES ('rebuild')")
+        return desfasados
@@ -0,0 +1,194 @@
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from opergest.core import Conexion, Migraciones, Quincena, TallasCorte, DatosInvalidosError, ConflictoError
+
+# Tamaños de planta. "tareas_por_dia" es lo que completa cada costurera en un día hábil; cada
+# tarea es una operación sobre 1 a 4 bandos y genera una fila en reporte al completarse.
+# planta: 300 costureras x 40 tareas x 12 días x 72 quincenas ~ 10M filas de reporte.
+ESCALAS = {
+    "taller": {"costura": 8, "corte": 2, "empacar": 2, "tareas_por_dia": 20, "quincenas": 4},
+    "mediana": {"costura": 60, "corte": 8, "empacar": 6, "tareas_por_dia": 30, "quincenas": 24},
+    "planta": {"costura": 300, "corte": 30, "empacar": 20, "tareas_por_dia": 40, "quincenas": 72},
+}
+
+NOMBRES = ["María", "Ana", "Rosa", "Carmen", "Lucía", "Marta", "Elena", "Gloria", "Sandra", "Patricia",
+           "Juana", "Sofía", "Claudia", "Verónica", "Karla", "Jorge", "Luis", "Carlos", "José", "Marcos",
+           "Pedro", "Mario", "Édgar", "Byron", "Otto", "Fernando", "Julio", "Hugo", "Raúl", "Óscar"]
+APELLIDOS = ["López", "García", "Pérez", "Hernández", "Morales", "Ramírez", "Castillo", "Gómez", "Juárez",
+             "Méndez", "Cifuentes", "Barrios", "Orellana", "Estrada", "Monterroso", "Coronado", "Chávez",
+             "Xicará", "Tzul", "Ajú", "Sic", "Cux", "Yat", "Pop", "Coc"]
+OPERACIONES = ["Pegar bolsa trasera", "Ruedo", "Pretina", "Cerrar costado", "Pasadores", "Pegar zipper",
+               "Ojal", "Botón", "Remaches", "Tiro", "Entrepierna", "Bolsa delantera", "Etiqueta", "Yugo",
+               "Sobrecostura", "Vista", "Forro de bolsa", "Atraque", "Cadeneta", "Pespunte"]
+MARCAS = ["Pepe", "Jhon Mike", "Wrangler", "Levi's", "Lee"]
+COLORES = ["azul", "azul claro", "negro", "gris", "celeste", "índigo", "blanco", "café"]
+# Cada categoría usa un tramo de las tallas que acepta TallasCorte.agregar_talla.
+TALLAS_POR_CATEGORIA = {
+    categoria: [t for t in TallasCorte.TALLAS_PERMITIDAS if desde <= t <= hasta]
+    for categoria, desde, hasta in [("Niño", 2, 16), ("Juvenil", 10, 30), ("Dama", 0, 16), ("Caballero", 28, 44)]
+}
+
+
+class GeneradorPlanta:
+    # Genera una base nueva con la misma semilla y fecha final siempre idéntica. Los ids se
+    # asignan aquí para insertar por lotes sin leer lastrowid fila por fila.
+    def __init__(self, ruta, escala="taller", semilla=1, hasta=None, **ajustes):
+        if escala not in ESCALAS:
+            raise DatosInvalidosError(f"Escala desconocida: {escala}")
+        self.ruta = ruta
+        self.parametros = dict(ESCALAS[escala], **{k: v for k, v in ajustes.items() if v is not None})
+        self.azar = random.Random(semilla)
+        self.hasta = hasta or Quincena.actual().anterior().fin
+        self.ids = {tabla: 0 for tabla in ["pedidos", "tallas_corte", "bandos", "tareas", "reporte"]}
+        self.conteo = {}
+
+    def _siguiente_id(self, tabla):
+        self.ids[tabla] += 1
+        return self.ids[tabla]
+
+    def _insertar(self, conn, tabla, columnas, filas):
+        marcadores = ", ".join("?" * len(columnas))
+        conn.executemany(f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcadores})", filas)
+        self.conteo[tabla] = self.conteo.get(tabla, 0) + len(filas)
+
+    def _nombre(self):
+        return f"{self.azar.choice(NOMBRES)} {self.azar.choice(APELLIDOS)} {self.azar.choice(APELLIDOS)}"
+
+    def _personal(self, conn):
+        empleados = [(1, "admin", 0, "administrador")]
+        salarios = []
+        areas = {"Costura": [], "Corte": [], "Empacar": []}
+        for area in areas:
+            for _ in range(self.parametros[area.lower()]):
+                id_empleado = len(empleados) + 1
+                empleados.append((id_empleado, self._nombre(), self.azar.randint(30000000, 59999999), area))
+                areas[area].append(id_empleado)
+                if area != "Costura":
+                    salarios.append((id_empleado, round(self.azar.uniform(11, 16), 2)))
+
+        self._insertar(conn, "empleados", ["id", "nombre", "telefono", "area"], empleados)
+        self._insertar(conn, "salarios", ["id_empleado", "salario"], salarios)
+        self._insertar(conn, "cuentas", ["id_empleado", "usuario", "password", "rol"],
+                       [(1, "admin", "admin", "administrador")])
+        return areas
+
+    def _operaciones(self, conn):
+        filas = []
+        for id_operacion, nombre in enumerate(OPERACIONES, start=1):
+            pequena = round(self.azar.uniform(0.10, 0.60), 3)
+            filas.append((id_operacion, nombre, pequena, round(pequena * self.azar.uniform(1.1, 1.3), 3)))
+        self._insertar(conn, "operaciones", ["id", "nombre", "small_price", "big_price"], filas)
+        return [fila[0] for fila in filas]
+
+    def _corte(self, conn, estado, completo):
+        # Las tallas del centro de la categoría llevan más piezas; cada bando es un paquete de 12 a 24.
+        categoria = self.azar.choice(list(TALLAS_POR_CATEGORIA))
+        disponibles = TALLAS_POR_CATEGORIA[categoria]
+        ancho = self.azar.randint(3, len(disponibles))
+        desde = self.azar.randint(0, len(disponibles) - ancho)
+        tallas = disponibles[desde:desde + ancho]
+
+        id_corte = self._siguiente_id("pedidos")
+        self._insertar(conn, "pedidos", ["id", "marca", "categoria", "color", "cantidad", "estado"],
+                       [(id_corte, self.azar.choice(MARCAS), categoria, self.azar.choice(COLORES), 0, estado)])
+
+        filas_tallas = []
+        filas_bandos = []
+        base = self.azar.randint(2, 5) * 12
+        for posicion, talla in enumerate(tallas):
+            peso = 1 + min(posicion, len(tallas) - 1 - posicion)
+            cantidad_max = base * peso
+            filas_tallas.append((self._siguiente_id("tallas_corte"), id_corte, talla, cantidad_max))
+
+            pendiente = cantidad_max if completo else int(cantidad_max * self.azar.uniform(0.6, 1.0))
+            while pendiente > 0:
+                cantidad = min(pendiente, self.azar.randint(12, 24))
+                filas_bandos.append((self._siguiente_id("bandos"), id_corte, talla, cantidad))
+                pendiente -= cantidad
+
+        self._insertar(conn, "tallas_corte", ["id", "corte", "talla", "cantidad_max"], filas_tallas)
+        self._insertar(conn, "bandos", ["id", "corte", "talla", "cantidad"], filas_bandos)
+        return id_corte, filas_bandos
+
+    def _momento(self, dia, hora_inicio=7, hora_fin=17):
+        segundos = self.azar.randint(hora_inicio * 3600, hora_fin * 3600 - 1)
+        return (datetime.combine(dia, datetime.min.time()) + timedelta(seconds=segundos)).strftime("%Y-%m-%d %H:%M:%S")
+
+    def _quincena(self, conn, quincena, costureras, por_horas, operaciones, ultima):
+        dias = [quincena.inicio + timedelta(days=i) for i in range((quincena.fin - quincena.inicio).days + 1)]
+        dias = [d for d in dias if d.weekday() < 6]
+        objetivo = len(costureras) * self.parametros["tareas_por_dia"] * len(dias)
+        completado = 0.6 if ultima else 0.98
+
+        tareas, tarea_bandos, reporte = [], [], []
+        while len(tareas) < objetivo:
+            id_corte, bandos = self._corte(conn, "en proceso" if ultima else "entregado", completo=not ultima)
+            pasos = self.azar.sample(operaciones, self.azar.randint(len(operaciones) // 2, len(operaciones)))
+            for id_operacion in pasos:
+                i = 0
+                while i < len(bandos):
+                    # Una tarea agrupa bandos consecutivos de la misma talla.
+                    grupo = [bandos[i]]
+                    while (len(grupo) < self.azar.randint(1, 4) and i + len(grupo) < len(bandos)
+                           and bandos[i + len(grupo)][2] == grupo[0][2]):
+                        grupo.append(bandos[i + len(grupo)])
+                    i += len(grupo)
+
+                    id_tarea = self._siguiente_id("tareas")
+                    id_empleado = self.azar.choice(costureras)
+                    dia = self.azar.choice(dias)
+                    tareas.append((id_tarea, id_empleado, id_corte, id_operacion, self._momento(dia, 7, 10)))
+                    tarea_bandos.extend((id_tarea, bando[0]) for bando in grupo)
+                    if self.azar.random() < completado:
+                        reporte.append((self._siguiente_id("reporte"), id_tarea, id_empleado, id_operacion,
+                                        grupo[0][2], self._momento(dia, 10, 17)))
+
+        self._insertar(conn, "tareas", ["id", "id_empleado", "corte", "operacion", "fecha"], tareas)
+        self._insertar(conn, "tarea_bandos", ["tarea_id", "bando_id"], tarea_bandos)
+        self._insertar(conn, "reporte", ["id", "id_tarea", "id_empleado", "id_operacion", "talla", "fecha"], reporte)
+
+        # Marcajes diarios del personal por horas, con algunas ausencias.
+        marcajes = []
+        for dia in dias:
+            for id_empleado in por_horas:
+                if self.azar.random() < 0.03:
+                    continue
+                entrada = self._momento(dia, 6, 7)[11:]
+                salida = self._momento(dia, 15, 17)[11:]
+                marcajes.append((id_empleado, str(dia), entrada, salida))
+        self._insertar(conn, "registro_horas", ["id_empleado", "fecha", "hora_entrada", "hora_salida"], marcajes)
+
+    def generar(self, al_avanzar=None):
+        if os.path.exists(self.ruta):
+            raise ConflictoError(f"{self.ruta} ya existe; la base sintética debe crearse en un archivo nuevo.")
+        # Se restauran la base y el perfil de quien llama: si no, seguiría escribiendo con
+        # synchronous=OFF sobre la base generada.
+        ruta, perfil = Conexion.ruta, Conexion.perfil
+        Conexion.configurar(ruta=self.ruta, perfil="bulk-import")
+        try:
+            Migraciones.aplicar()
+
+            inicio = time.perf_counter()
+            with Conexion.transaccion("IMMEDIATE") as conn:
+                areas = self._personal(conn)
+                operaciones = self._operaciones(conn)
+
+            quincenas = [Quincena.para_fecha(self.hasta)]
+            while len(quincenas) < self.parametros["quincenas"]:
+                quincenas.insert(0, quincenas[0].anterior())
+
+            # Una transacción por quincena: el progreso queda guardado si se interrumpe.
+            for numero, quincena in enumerate(quincenas, start=1):
+                with Conexion.transaccion("IMMEDIATE") as conn:
+                    self._quincena(conn, quincena, areas["Costura"], areas["Corte"] + areas["Empacar"],
+                                   operaciones, ultima=numero == len(quincenas))
+                if al_avanzar:
+                    al_avanzar(quincena, numero, len(quincenas), dict(self.conteo), time.perf_counter() - inicio)
+
+            Conexion.get_conn().execute("PRAGMA optimize")
+            return dict(self.conteo), time.perf_counter() - inicio
+        finally:
+            Conexion.configurar(ruta=ruta, perfil=perfil)
@@ -0,0 +1,2229 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from opergest.core import (
+    Conexion, Migraciones, Pedidos, TallasCorte, Bandos, Operaciones, Empleados,
+    Salarios, Tareas, Reportes, RegistroHoras, Quincena, Cuentas, Busqueda, TrabajadorBD, ErrorOperGest
+)
+
+
+class VentanaConfirmacion(tk.Toplevel):
+    def __init__(self, parent, mensaje):
+        super().__init__(parent)
+        self.title("Confirmación")
+        self.geometry("320x150")
+        self.configure(bg='white')
+        self.resizable(False, False)
+        self.resultado = False
+
+        tk.Label(self, text=mensaje, bg='white', fg='black', font=("Arial", 10), wraplength=280, justify="center").pack(pady=20)
+
+        frame_botones = tk.Frame(self, bg='white')
+        frame_botones.pack(pady=10)
+
+        tk.Button(frame_botones, text="Confirmar", bg="#28A745", fg="white", font=("Arial", 9, "bold"),
+                  relief='flat', width=12, command=self.confirmar).pack(side='left', padx=10)
+        tk.Button(frame_botones, text="Cancelar", bg="#DC3545", fg="white", font=("Arial", 9, "bold"),
+                  relief='flat', width=12, command=self.cancelar).pack(side='left', padx=10)
+
+        self.transient(parent)
+        self.grab_set()
+        self.wait_window(self)
+
+    def confirmar(self):
+        self.resultado = True
+        self.destroy()
+
+    def cancelar(self):
+        self.resultado = False
+        self.destroy()
+
+
+class ComboBusqueda(ttk.Combobox):
+    # Combo editable: al escribir consulta el índice de búsqueda y reemplaza las opciones.
+    def __init__(self, parent, buscar, formato, retraso=200, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.buscar = buscar
+        self.formato = formato
+        self.retraso = retraso
+        self._pendiente = None
+        self.bind("<KeyRelease>", self._al_escribir)
+        self._actualizar()
+
+    def _al_escribir(self, evento):
+        if evento.keysym in ("Up", "Down", "Left", "Right", "Return", "Escape", "Tab"):
+            return
+        if self._pendiente:
+            self.after_cancel(self._pendiente)
+        self._pendiente = self.after(self.retraso, self._actualizar)
+
+    def _actualizar(self):
+        self._pendiente = None
+        self["values"] = [self.formato(fila) for fila in self.buscar(self.get())]
+
+    def recargar(self, texto=""):
+        # Vuelve a consultar las opciones; las pantallas en caché lo llaman al mostrarse.
+        if self._pendiente:
+            self.after_cancel(self._pendiente)
+        self.set(texto)
+        self._actualizar()
+
+    def seleccion(self):
+        valor = self.get()
+        return valor if valor and valor in self["values"] else ""
+
+
+class TablaDatos(tk.Frame):
+    # Tabla sobre ttk.Treeview que inserta las filas por lotes conforme se acerca el final de la
+    # vista: un reporte de miles de filas no crea miles de widgets. Columnas: (clave, título, ancho,
+    # formato), donde formato es None, un texto para str.format o una función.
+    def __init__(self, parent, columnas, filas=(), totales=None, casilla=None, arbol=None, lote=100, altura=12):
+        super().__init__(parent, bg='white')
+        self.columnas = [tuple(c) + (None,) * (4 - len(c)) for c in columnas]
+        self.casilla = casilla
+        self.lote = lote
+        self._pendientes = []
+        self._indice = 0
+        self._filas = {}
+        self._marcadas = set()
+
+        claves = (["_casilla"] if casilla else []) + [c[0] for c in self.columnas]
+        self.tabla = ttk.Treeview(self, columns=claves, show="tree headings" if arbol else "headings",
+                                  height=altura)
+        self.pie = ttk.Treeview(self, columns=claves, show="tree" if arbol else "", height=1,
+                                selectmode='none') if totales is not None else None
+
+        for vista in filter(None, [self.tabla, self.pie]):
+            if arbol:
+                vista.column("#0", width=arbol[1], stretch=False)
+            if casilla:
+                vista.column("_casilla", width=40, anchor='center', stretch=False)
+            for clave, _, ancho, _ in self.columnas:
+                vista.column(clave, width=ancho, anchor='w', stretch=False)
+            vista.tag_configure("grupo", font=("Arial", 10, "bold"))
+            vista.tag_configure("total", font=("Arial", 10, "bold"), foreground='green')
+            vista.tag_configure("alerta", foreground='red')
+
+        if arbol:
+            self.tabla.heading("#0", text=arbol[0], anchor='w')
+        if casilla:
+            self.tabla.heading("_casilla", text="✔")
+        for clave, titulo, _, _ in self.columnas:
+            self.tabla.heading(clave, text=titulo, anchor='w')
+
+        vsb = ttk.Scrollbar(self, orient="vertical", command=self.tabla.yview)
+        hsb = ttk.Scrollbar(self, orient="horizontal", command=self._desplazar_x)
+        self.tabla.configure(yscrollcommand=lambda primero, ultimo: self._al_desplazar(vsb, primero, ultimo),
+                             xscrollcommand=hsb.set)
+
+        self.tabla.grid(row=0, column=0, sticky='nsew')
+        vsb.grid(row=0, column=1, sticky='ns')
+        if self.pie is not None:
+            self.pie.grid(row=1, column=0, sticky='ew')
+        hsb.grid(row=2, column=0, sticky='ew')
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.tabla.bind("<Button-1>", self._al_click)
+        self.cargar(filas, totales)
+
+    def _desplazar_x(self, *args):
+        self.tabla.xview(*args)
+        if self.pie is not None:
+            self.pie.xview(*args)
+
+    @staticmethod
+    def _texto(formato, valor):
+        if callable(formato):
+            return formato(valor)
+        if valor is None:
+            return ""
+        return formato.format(valor) if formato else valor
+
+    def _valores(self, fila, con_casilla=True):
+        valores = [self._texto(formato, fila.get(clave)) for clave, _, _, formato in self.columnas]
+        if self.casilla:
+            marcada = con_casilla and fila[self.casilla] in self._marcadas
+            valores.insert(0, ("☑" if marcada else "☐") if con_casilla else "")
+        return valores
+
+    def cargar(self, filas, totales=None):
+        self.tabla.delete(*self.tabla.get_children())
+        self._filas.clear()
+        self._marcadas.clear()
+        self._pendientes = list(filas)
+        self._indice = 0
+        self._insertar_lote()
+
+        if self.pie is not None:
+            self.pie.delete(*self.pie.get_children())
+            if totales:
+                self.pie.insert('', 'end', text=totales.get("_texto", ""),
+                                values=self._valores(totales, con_casilla=False), tags=("total",))
+
+    def agregar(self, filas):
+        self._pendientes.extend(filas)
+        self._insertar_lote()
+
+    def _insertar_lote(self):
+        fin = min(self._indice + self.lote, len(self._pendientes))
+        for fila in self._pendientes[self._indice:fin]:
+            hijos = fila.get("_hijos", ())
+            etiquetas = (("grupo",) if hijos else ()) + tuple(fila.get("_etiquetas", ()))
+            iid = self.tabla.insert('', 'end', text=fila.get("_texto", ""), values=self._valores(fila),
+                                    open=True, tags=etiquetas)
+            self._filas[iid] = fila
+            for hijo in hijos:
+                self.tabla.insert(iid, 'end', text=hijo.get("_texto", ""), values=self._valores(hijo, False))
+        self._indice = fin
+
+    def _al_desplazar(self, barra, primero, ultimo):
+        barra.set(primero, ultimo)
+        if float(ultimo) > 0.9 and self._indice < len(self._pendientes):
+            self.after_idle(self._insertar_lote)
+
+    def _al_click(self, evento):
+        if not self.casilla or self.tabla.identify_region(evento.x, evento.y) != "cell":
+            return
+        if self.tabla.identify_column(evento.x) != "#1":
+            return
+        iid = self.tabla.identify_row(evento.y)
+        fila = self._filas.get(iid)
+        if fila is None:
+            return
+        clave = fila[self.casilla]
+        if clave in self._marcadas:
+            self._marcadas.discard(clave)
+            self.tabla.set(iid, "_casilla", "☐")
+        else:
+            self._marcadas.add(clave)
+            self.tabla.set(iid, "_casilla", "☑")
+
+    def marcadas(self):
+        return [fila[self.casilla] for fila in self._filas.values() if fila[self.casilla] in self._marcadas]
+
+
+class TablaHoras:
+    def __init__(self, parent, registros):
+        self.parent = parent
+        self.registros = registros
+
+    def mostrar(self):
+        total_pago = sum(h.get('pago_dia') or 0 for h in self.registros)
+        tabla = TablaDatos(self.parent, [
+            ("fecha", "Fecha", 100),
+            ("hora_entrada", "Hora Entrada", 100, lambda v: v or "-"),
+            ("hora_salida", "Hora Salida", 100, lambda v: v or "-"),
+            ("horas_trabajadas", "Horas Totales", 100, "{:.2f}"),
+            ("salario_hora", "Salario/Hora", 100, "Q{:.2f}"),
+            ("pago_dia", "Pago Día", 100, "Q{:.2f}"),
+        ], self.registros, totales={"fecha": "TOTAL A PAGAR", "pago_dia": total_pago})
+        tabla.pack(fill='both', expand=True)
+        return tabla
+
+
+class TablaDestajo:
+    def __init__(self, parent, registros, total):
+        self.parent = parent
+        self.registros = registros
+        self.total = total
+
+    def mostrar(self):
+        tabla = TablaDatos(self.parent, [
+            ("corte", "Corte", 70),
+            ("operacion", "Operación", 180),
+            ("talla", "Talla", 60),
+            ("bandos", "Bandos", 160),
+            ("precio", "Precio", 80, "Q{:.2f}"),
+            ("total", "Total", 100, "Q{:.2f}"),
+        ], self.registros, totales={"operacion": "TOTAL GENERAL", "total": self.total})
+        tabla.pack(fill='both', expand=True)
+        return tabla
+
+
+class Pantalla:
+    def __init__(self, frame):
+        self.frame = frame
+        self.refrescar = None
+        self.indicadores = []
+
+    def ocultar(self):
+        # Los trabajos pendientes de la pantalla se cancelan igual que cuando se destruía.
+        for indicador in self.indicadores:
+            if indicador.winfo_exists():
+                indicador.destroy()
+        self.indicadores.clear()
+        self.frame.pack_forget()
+
+
+class InterfazGrafica:
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.title("OPERGest")
+        self.root.geometry("500x600")
+        self.root.resizable(False, False)
+        self.root.configure(bg='white')
+
+        self.centrar_ventana(500, 600)
+
+        self.usuario_actual = None
+        self.password_actual = None
+        self.tipo_usuario = None
+
+        self.marco = tk.Frame(self.root, bg='white')
+        self.marco.pack(fill='both', expand=True)
+        self.pantallas = {}
+        self.pantalla_actual = None
+        self.contenedor = None
+
+        Migraciones.aplicar()
+        self.trabajador = TrabajadorBD()
+        self.root.after(50, self.atender_trabajos)
+        self.ventana_login()
+
+    def atender_trabajos(self):
+        try:
+            self.trabajador.atender()
+        finally:
+            self.root.after(50, self.atender_trabajos)
+
+    def en_segundo_plano(self, contenedor, funcion, *args, al_terminar, al_fallar=None,
+                         mensaje="Cargando...", **kwargs):
+        # Muestra un indicador mientras el trabajo corre en el hilo de la base. Destruir el
+        # indicador (botón Cancelar, limpiar la pantalla) cancela el trabajo y descarta su resultado.
+        indicador = tk.Frame(contenedor, bg='white')
+        indicador.pack(fill='x', pady=10)
+        tk.Label(indicador, text=mensaje, bg='white', fg='gray',
+                 font=("Arial", 10, "italic")).pack(side='left', padx=(0, 10))
+        barra = ttk.Progressbar(indicador, mode='indeterminate', length=150)
+        barra.pack(side='left')
+        barra.start(10)
+        tk.Button(indicador, text="Cancelar", bg="#DC3545", fg="white", font=("Arial", 9, "bold"),
+                  relief='flat', cursor="hand2", command=indicador.destroy).pack(side='left', padx=10)
+
+        def responder(callback, valor):
+            if not indicador.winfo_exists():
+                return
+            indicador.destroy()
+            callback(valor)
+
+        trabajo = self.trabajador.enviar(
+            funcion, *args,
+            al_terminar=lambda valor: responder(al_terminar, valor),
+            al_fallar=lambda e: responder(al_fallar or (lambda e: messagebox.showerror("Error", str(e))), e),
+            **kwargs
+        )
+        indicador.bind("<Destroy>", lambda e: trabajo.cancelar())
+        if self.pantalla_actual is not None:
+            self.pantalla_actual.indicadores.append(indicador)
+        return trabajo
+
+    def centrar_ventana(self, ancho, alto):
+        ancho_pantalla = self.root.winfo_screenwidth()
+        alto_pantalla = self.root.winfo_screenheight()
+        x = (ancho_pantalla // 2) - (ancho // 2)
+        y = (alto_pantalla // 2) - (alto // 2)
+        self.root.geometry(f'{ancho}x{alto}+{x}+{y}')
+
+    def abrir_pantalla(self, nombre, *args):
+        # Cada pantalla se construye una sola vez y se oculta al salir de ella; al volver solo se
+        # refrescan sus datos con los argumentos recibidos. Devuelve True si hay que construirla.
+        if self.pantalla_actual is not None:
+            self.pantalla_actual.ocultar()
+
+        pantalla = self.pantallas.get(nombre)
+        nueva = pantalla is None
+        if nueva:
+            pantalla = self.pantallas[nombre] = Pantalla(tk.Frame(self.marco, bg='white'))
+
+        self.pantalla_actual = pantalla
+        self.contenedor = pantalla.frame
+        pantalla.frame.pack(fill='both', expand=True)
+        if not nueva and pantalla.refrescar:
+            pantalla.refrescar(*args)
+        return nueva
+
+    def al_mostrar(self, refrescar, *args):
+        self.pantalla_actual.refrescar = refrescar
+        refrescar(*args)
+
+    def descartar_pantallas(self):
+        for pantalla in self.pantallas.values():
+            pantalla.ocultar()
+            pantalla.frame.destroy()
+        self.pantallas.clear()
+        self.pantalla_actual = None
+
+    def crear_cabecera_submenu(self, titulo):
+        cabecera = tk.Frame(self.contenedor, bg='#0078D7', height=80)
+        cabecera.pack(fill='x')
+        cabecera.pack_propagate(False)
+
+        tk.Label(cabecera, text=titulo,
+                 font=("Arial", 10, "bold"), bg='#0078D7', fg='white').pack(pady=25)
+
+    def crear_footer_volver(self, comando_volver):
+        pied_pagina = tk.Frame(self.contenedor, bg='white')
+        pied_pagina.pack(fill='x', padx=40, pady=20)
+
+        boton_volver = tk.Button(pied_pagina, text="← Volver", bg='#FF8C00', fg='white',
+                                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                                  command=comando_volver)
+        boton_volver.pack(fill='x', ipady=10)
+
+    def cerrar_sesion(self):
+        self.usuario_actual = None
+        self.password_actual = None
+        self.tipo_usuario = None
+        self.descartar_pantallas()
+        self.ventana_login()
+
+    def ventana_login(self):
+        if not self.abrir_pantalla("login"):
+            return
+
+        titulo = tk.Label(self.contenedor, text="INICIAR SESIÓN",
+                          font=("Arial", 16, "bold"), fg="gray")
+        titulo.pack(pady=40)
+
+        subtitulo = tk.Label(self.contenedor, text="Iniciar sesión\nIngrese usuario y contraseña",
+                             font=("Arial", 9), bg='white', fg='gray')
+        subtitulo.pack(pady=10)
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(pady=20, padx=50, fill='x')
+
+        tk.Label(frame, text="Usuario:", font=("Arial", 10), bg='white').pack(anchor='w', pady=(10, 5))
+        self.entry_usuario = tk.Entry(frame, font=("Arial", 10), relief='solid', bd=1)
+        self.entry_usuario.pack(fill="x", ipady=8)
+
+        tk.Label(frame, text="Contraseña:", font=("Arial", 10), bg='white').pack(anchor='w', pady=(20, 5))
+        self.entry_password = tk.Entry(frame, show="*", font=("Arial", 10), relief='solid', bd=1)
+        self.entry_password.pack(fill='x', ipady=8)
+        self.entry_password.bind('<Return>', lambda e: self.iniciar_sesion())
+        self.mostrar = False
+
+        def alternar_password():
+            if self.mostrar:
+                self.entry_password.config(show='*')
+                boton_ver.config(text="👁mostrar")
+                self.mostrar = False
+            else:
+                self.entry_password.config(show='')
+                boton_ver.config(text="🙈ocultar")
+                self.mostrar = True
+
+        boton_ver = tk.Button(frame, text="👁mostrar", bg='white', relief='flat', cursor="hand2",
+                              command=alternar_password)
+        boton_ver.pack(anchor='e', pady=(5, 0))
+
+        boton_ingresar = tk.Button(frame, text="Ingresar", bg="#0078D7", fg='white',
+                                   font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                                   command=self.iniciar_sesion)
+        boton_ingresar.pack(fill='x', pady=(30, 10), ipady=10)
+
+        boton_salir = tk.Button(frame, text="Salir", bg="#FF8C00", fg='white',
+                                font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                                command=self.root.quit)
+        boton_salir.pack(fill='x', ipady=10)
+
+        def refrescar():
+            self.entry_usuario.delete(0, tk.END)
+            self.entry_password.delete(0, tk.END)
+            if self.mostrar:
+                alternar_password()
+
+        self.al_mostrar(refrescar)
+
+    def iniciar_sesion(self):
+        usuario = self.entry_usuario.get()
+        password = self.entry_password.get()
+        lista_cuentas = Cuentas.listar()
+
+        if usuario == "" or password == "":
+            messagebox.showwarning("Campos vacíos", "Por favor complete todos los campos.")
+        elif lista_cuentas:
+            try:
+                rol = Cuentas.buscar(usuario, password)
+                self.tipo_usuario = str(rol)
+                self.usuario_actual = usuario
+                self.password_actual = password
+                self.descartar_pantallas()
+                if self.tipo_usuario.lower() == "administrador":
+                    self.menu_administrador()
+                else:
+                    self.menu_empleado()
+            except ValueError as e:
+                messagebox.showerror("Error", f"Error: {e}")
+        else:
+            if usuario == "admin" and password == "admin":
+                self.crear_cuenta()
+            else:
+                messagebox.showerror("Error", "ERROR: Credenciales incorrectos")
+
+    def crear_cuenta(self):
+        if not self.abrir_pantalla("crear_cuenta"):
+            return
+
+        titulo = tk.Label(self.contenedor, text="Crear cuenta",
+                          font=("Arial", 16, "bold"), bg='white')
+        titulo.pack(pady=40)
+
+        subtitulo = tk.Label(self.contenedor, text="Ingresar datos\nIngrese nuevos datos para crear la cuenta",
+                             font=("Arial", 9), bg='white', fg='gray')
+        subtitulo.pack(pady=10)
+
+        frame = tk.Frame(self.contenedor, bg="white")
+        frame.pack(pady=20, padx=50, fill="x")
+
+        usuario_actual = getattr(self, "tipo_usuario", None)
+
+        if usuario_actual == "administrador":
+            tk.Label(frame, text="Seleccione un empleado:", font=("Arial", 10), bg="white").pack(anchor="w", pady=(10, 5))
+            combo_empleado = ttk.Combobox(frame, state="readonly", font=("Arial", 10))
+            combo_empleado.pack(fill="x", ipady=8, pady=(0, 15))
+        else:
+            combo_empleado = None
+
+        tk.Label(frame, text="Nuevo usuario:", font=("Arial", 10), bg="white").pack(anchor="w", pady=(10, 5))
+        entry_nuevo_usuario = tk.Entry(frame, font=("Arial", 10), relief="solid", bd=1)
+        entry_nuevo_usuario.pack(fill="x", ipady=8)
+
+        tk.Label(frame, text="Nueva contraseña:", font=("Arial", 10), bg="white").pack(anchor="w", pady=(20, 5))
+        entry_new_pass = tk.Entry(frame, show="*", font=("Arial", 10), relief="solid", bd=1)
+        entry_new_pass.pack(fill="x", ipady=8)
+        self.mostrar = False
+
+        def alternar_password():
+            if self.mostrar:
+                entry_new_pass.config(show='*')
+                boton_ver.config(text="👁️mostrar")
+                self.mostrar = False
+            else:
+                entry_new_pass.config(show='')
+                boton_ver.config(text="🙈ocultar")
+                self.mostrar = True
+
+        boton_ver = tk.Button(frame, text="👁️mostrar", bg='white', relief='flat', cursor="hand2",
+                              command=alternar_password)
+        boton_ver.pack(anchor='e', pady=(5, 0))
+
+        def guardar_nuevos_datos():
+            nuevo_usuario = entry_nuevo_usuario.get().strip()
+            new_pass = entry_new_pass.get().strip()
+
+            if nuevo_usuario == "" or new_pass == "":
+                messagebox.showwarning("Campos vacíos", "Por favor complete ambos campos.")
+                return
+
+            if usuario_actual == "administrador" and combo_empleado:
+                seleccion = combo_empleado.get()
+                if not seleccion:
+                    messagebox.showwarning("Selección requerida", "Seleccione un empleado para crear la cuenta.")
+                    return
+                id_empleado = seleccion.split(" - ")[0]
+            else:
+                id_empleado = 1
+
+            if not Cuentas.listar():
+                admin = Empleados("admin", 0000, "administrador")
+                admin.guardar()
+
+            cuenta = Cuentas(id_empleado, nuevo_usuario, new_pass, "administrador" if id_empleado == 1 else "empleado")
+            cuenta.guardar()
+
+            if usuario_actual is None:
+                self.ventana_login()
+                boton_cancelar.config(command=self.ventana_login)
+            else:
+                self.gestion_empleados()
+                boton_cancelar.config(command=self.gestion_empleados)
+
+            messagebox.showinfo("Éxito", "Usuario y contraseña creada")
+
+        boton_guardar = tk.Button(frame, text="Guardar cambios", bg="#0078D7", fg='white',
+                                  font=("Arial", 10, "bold"), relief="flat", cursor="hand2",
+                                  command=guardar_nuevos_datos)
+        boton_guardar.pack(fill="x", pady=(30, 10), ipady=10)
+
+        boton_cancelar = tk.Button(frame, text="Cancelar", bg="#FF8C00", fg='white',
+                                   font=("Arial", 10, "bold"), relief="flat", cursor="hand2",
+                                   command=self.ventana_login)
+        boton_cancelar.pack(fill="x", ipady=10)
+
+        if usuario_actual is None:
+            boton_cancelar.config(command=self.ventana_login)
+        else:
+            boton_cancelar.config(command=self.gestion_empleados)
+
+        def refrescar():
+            if combo_empleado:
+                combo_empleado['values'] = [f"{e['id']} - {e['nombre']}" for e in Empleados.listar() if e['id'] != 1]
+                combo_empleado.set('')
+            entry_nuevo_usuario.delete(0, tk.END)
+            entry_new_pass.delete(0, tk.END)
+            if self.mostrar:
+                alternar_password()
+
+        self.al_mostrar(refrescar)
+
+    #====VENTANA ADMINISTRADOR===
+    def menu_administrador(self):
+        if not self.abrir_pantalla("menu_administrador"):
+            return
+
+        cabecera = tk.Frame(self.contenedor, bg ='#0078D7', height=80)
+        cabecera.pack(fill='x')
+        cabecera.pack_propagate(False)
+
+        tk.Label(cabecera, text=f"Bienvenido: {self.usuario_actual}",
+                 font=("Arial", 14, "bold"), bg='#0078D7', fg='white').pack(pady=25)
+
+        frame_contenido = tk.Frame(self.contenedor, bg='white')
+        frame_contenido.pack(fill='both', expand=True, padx=40, pady=30)
+
+        tk.Label(frame_contenido, text="Seleccione una opción",
+                 font=("Arial", 12), bg='white', fg='gray').pack(pady=20)
+
+        botones = [
+            ("👥 Gestión de Empleados", self.gestion_empleados),
+            ("📦 Gestión de Pedidos", self.gestion_pedidos),
+            ("⚙️ Gestión de Operaciones", self.gestion_operaciones),
+            ("✍️ Gestión de Tareas", self.gestion_tareas)
+        ]
+
+        for texto, comando in botones:
+            boton = tk.Button(frame_contenido, text=texto, bg='#0078D7', fg='white',
+                              font=("Arial", 11, "bold"), relief='flat', cursor="hand2",
+                              command=comando)
+            boton.pack(fill='x', pady=8, ipady=12)
+
+        pied_pagina = tk.Frame(self.contenedor, bg='white')
+        pied_pagina.pack(fill='x',padx=40, pady=20)
+
+        boton_cerrar = tk.Button(pied_pagina, text="Cerrar Sesión", bg='#E84C3C', fg='white',
+                                 font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                                 command=self.cerrar_sesion)
+        boton_cerrar.pack(fill='x', ipady=10)
+
+    #===VENTANA EMPLEADO===
+    def menu_empleado(self):
+        if not self.abrir_pantalla("menu_empleado"):
+            return
+
+        cabecera = tk.Frame(self.contenedor,bg='#0078D7', height=80)
+        cabecera.pack(fill='x')
+        cabecera.pack_propagate(False)
+
+        tk.Label(cabecera, text=f"Bienvenidos: {self.usuario_actual}",
+                 font=("Arial", 14, "bold"), bg='#0078D7', fg='white').pack(pady=25)
+
+        frame_contenido = tk.Frame(self.contenedor, bg='white')
+        frame_contenido.pack(fill='both', expand=True, padx=40, pady=30)
+
+        tk.Label(frame_contenido, text="Seleccione una opción",
+                 font=("Arial", 12), bg='white', fg='gray').pack(pady=20)
+
+        botones = []
+
+        id_empleado = Cuentas.buscar_id(self.usuario_actual, self.password_actual)
+        area = Empleados.obtener_area(id_empleado)
+        if area.lower() == "costura":
+            botones = [
+                ("Ver tareas", self.ver_tareas),
+                ("Ver reporte", self.ver_reporte_empleado)
+            ]
+        else:
+            botones = [
+                ("Registrar entrada", self.registrar_entrada),
+                ("Registrar salida", self.registrar_salida),
+                ("ver reporte", self.ver_reporte_empleado)
+            ]
+
+        for texto, comando in botones:
+            boton = tk.Button(frame_contenido, text=texto, bg='#0078D7', fg='white',
+                              font=("Arial", 11, "bold"), relief='flat', cursor="hand2",
+                              command=comando)
+            boton.pack(fill='x', pady=8, ipady=12)
+
+        pied_pagina = tk.Frame(self.contenedor, bg='white')
+        pied_pagina.pack(fill='x', padx=40, pady=20)
+
+        boton_cerrar = tk.Button(pied_pagina, text="Cerrar Sesión", bg='#E74C3C', fg='white',
+                                 font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                                 command=self.cerrar_sesion)
+        boton_cerrar.pack(fill='x', ipady=10)
+
+#===Ventanas de submenú administrador===
+       #==SUBMENÚ GESTIÓN DE EMPLEADOS===
+    def gestion_empleados(self):
+        if not self.abrir_pantalla("gestion_empleados"):
+            return
+
+        self.crear_cabecera_submenu("👥 Gestión de Empleados")
+
+        frame_contenido = tk.Frame(self.contenedor, bg='white')
+        frame_contenido.pack(fill='both', expand=True, padx=40, pady=30)
+
+        botones = [
+            ("Registrar empleado", self.registrar_empleado),
+            ("Listar empleados", self.listar_empleados),
+            ("Despedir empleado", self.despedir_empleado),
+            ("Crear cuenta", self.crear_cuenta)
+        ]
+
+        for texto, comando in botones:
+            btn = tk.Button(frame_contenido, text=texto, bg="#0078D7", fg="white",
+                            font=("Arial", 11, "bold"), relief='flat', cursor="hand2",
+                            command=comando)
+            btn.pack(fill='x', pady=8, ipady=12)
+
+        self.crear_footer_volver(self.menu_administrador)
+
+    #===SUBMENÚ GESTIÓN DE PEDIDOS===
+    def gestion_pedidos(self):
+        if not self.abrir_pantalla("gestion_pedidos"):
+            return
+
+        self.crear_cabecera_submenu("📦 Gestión de Pedidos")
+
+        frame_contenido = tk.Frame(self.contenedor, bg='white')
+        frame_contenido.pack(fill='both', expand=True, padx=40, pady=30)
+
+        botones = [
+            ("Registrar corte", self.registrar_corte),
+            ("Agregar bandos", self.agregar_bandos),
+            ("Ver cortes en proceso", self.listar_pedidos),
+            ("Entregar Pedido", self.entregar_pedido)
+        ]
+
+        for texto, comando in botones:
+            btn = tk.Button(frame_contenido, text=texto, bg="#0078D7", fg="white",
+                            font=("Arial", 11, "bold"), relief='flat', cursor="hand2",
+                            command=comando)
+            btn.pack(fill='x', pady=8, ipady=12)
+
+        self.crear_footer_volver(self.menu_administrador)
+
+    #===SUBMENÚ GESTIÓN DE OPERACIONES===
+    def gestion_operaciones(self):
+        if not self.abrir_pantalla("gestion_operaciones"):
+            return
+
+        self.crear_cabecera_submenu("⚙️ Gestión de Operaciones")
+
+        frame_contenido = tk.Frame(self.contenedor, bg='white')
+        frame_contenido.pack(fill='both', expand=True, padx=40, pady=30)
+
+        botones = [
+            ("Registrar operación", self.registrar_operacion),
+            ("Consultar operación", self.consultar_operacion)
+        ]
+
+        for texto, comando in botones:
+            boton = tk.Button(frame_contenido, text=texto, bg='#0078D7', fg='white',
+                              font=("Arial", 11, "bold"), relief='flat', cursor="hand2",
+                              command=comando)
+            boton.pack(fill='x', pady=8, ipady=12)
+
+        self.crear_footer_volver(self.menu_administrador)
+
+    #===SUBMENÚ GESTIÓN DE TAREAS===
+    def gestion_tareas(self):
+        if not self.abrir_pantalla("gestion_tareas"):
+            return
+        self.crear_cabecera_submenu("✍️ Gestión de Tareas")
+
+        frame_contenido = tk.Frame(self.contenedor, bg='white')
+        frame_contenido.pack(fill='both', expand=True, padx=40, pady=30)
+
+        botones = [
+            ("Asignar Tareas", self.asignar_tareas),
+            ("Lista de tareas", self.marcar_tareas),
+            ("Ver reportes", self.ver_reportes)
+        ]
+
+        for texto, comando in botones:
+            btn = tk.Button(frame_contenido, text=texto, bg="#0078D7", fg="white",
+                            font=("Arial", 11, "bold"), relief='flat', cursor="hand2",
+                            command=comando)
+            btn.pack(fill='x', pady=8, ipady=12)
+
+        self.crear_footer_volver(self.menu_administrador)
+
+    #=====GESTIÓN EMPLEADOS=====
+    def registrar_empleado(self):
+        if not self.abrir_pantalla("registrar_empleado"):
+            return
+        self.crear_cabecera_submenu("Registrar empleado")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(pady=20, padx=40, fill='both', expand=True)
+
+        tk.Label(frame, text="Nombre:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        entry_nombre = tk.Entry(frame, font=("Arial", 10), relief='solid', bd=1)
+        entry_nombre.pack(fill='x', ipady=8, pady=(5,15))
+
+        tk.Label(frame, text="Teléfono:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        entry_telefono = tk.Entry(frame, font=("Arial", 10), relief='solid', bd=1)
+        entry_telefono.pack(fill='x', ipady=8, pady=(5,15))
+
+        areas = ["Corte", "Costura", "Empacar"]
+
+        tk.Label(frame, text="Área:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        seleccion_area = ttk.Combobox(frame, values=areas, state='readonly', font=("Arial", 10))
+        seleccion_area.pack(fill='x', ipady=8, pady=(5, 15))
+
+        label_salario = tk.Label(frame, text='Salario por hora:', font=("Arial", 10), bg='white', fg='gray')
+        entry_salario = tk.Entry(frame, font=("Arial", 10), relief='solid', bd=1)
+
+        def solicitar_salario(evento):
+            if seleccion_area.get().lower() in ('corte', 'empacar'):
+                label_salario.pack(anchor='w', pady=(10, 2))
+                entry_salario.pack(fill='x', ipady=8, pady=(5, 15))
+            else:
+                label_salario.pack_forget()
+                entry_salario.pack_forget()
+
+        seleccion_area.bind("<<ComboboxSelected>>", solicitar_salario)
+
+        def guardar():
+            nombre = entry_nombre.get()
+            telefono = entry_telefono.get()
+            try:
+                if len(telefono) != 8:
+                    messagebox.showerror("Error", "El número de telefono debe ser de 8 dígitos")
+                    return
+                telefono = int(telefono)
+            except ValueError:
+                messagebox.showerror("Error", "Número de teléfono no válido")
+                return
+            area = seleccion_area.get()
+
+            if not nombre or not area:
+                messagebox.showerror("Error", "Complete todos los campos.")
+                return
+            agregar_empleado = Empleados(nombre, telefono, area)
+            agregar_empleado.guardar()
+            try:
+                if area.lower() == "corte" or area.lower() == "empacar":
+                    salario = float(entry_salario.get())
+                    agregar_salario = Salarios(agregar_empleado.obtener_id(), salario)
+                    agregar_salario.agregar_salario()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+            messagebox.showinfo("Éxito", f"{nombre} Registrado correctamente")
+
+        frame_btns = tk.Frame(frame, bg='white')
+        frame_btns.pack(side='bottom', fill='x', pady=20)
+
+        tk.Button(frame_btns, text="Guardar", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=guardar).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_btns, text="Regresar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_empleados).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar():
+            for entry in (entry_nombre, entry_telefono, entry_salario):
+                entry.delete(0, tk.END)
+            seleccion_area.set('')
+            label_salario.pack_forget()
+            entry_salario.pack_forget()
+
+        self.al_mostrar(refrescar)
+
+    def listar_empleados(self):
+        if not self.abrir_pantalla("listar_empleados"):
+            return
+        self.crear_cabecera_submenu("Lista de empleados")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(pady=20, padx=20, fill='both', expand=True)
+        zona_carga = tk.Frame(frame, bg='white')
+        zona_carga.pack(fill='x')
+
+        columnas = ("ID", "Nombre", "Teléfono", "Área", "Salario por hora", "")
+        filas = ttk.Treeview(frame, columns=columnas, show="headings", height=12)
+
+        for col in columnas:
+            filas.heading(col, text=col)
+
+        filas.column("ID", width=60, anchor="center")
+        filas.column("Nombre", width=150)
+        filas.column("Teléfono", width=100, anchor='center')
+        filas.column("Área", width=100, anchor='center')
+        filas.column("Salario por hora", width=120, anchor='center')
+        filas.column("", width=100, anchor='center')
+
+        filas.pack(fill='both', expand=True)
+
+        scroll_y = ttk.Scrollbar(frame, orient="vertical", command=filas.yview)
+        scroll_y.pack(side='right', fill='y')
+        filas.configure(yscrollcommand=scroll_y.set)
+
+        scroll_x = ttk.Scrollbar(frame, orient="horizontal", command=filas.xview)
+        scroll_x.pack(side='bottom', fill='x')
+        filas.configure(xscrollcommand=scroll_x.set)
+
+        def al_hacer_click(event):
+            item = filas.identify_row(event.y)
+            columna = filas.identify_column(event.x)
+            if not item or columna != '#6':
+                return
+            valores = filas.item(item, "values")
+            id_emp = valores[0]
+            self.mostrar_ventana_modificar(id_emp)
+
+        filas.bind("<Button-1>", al_hacer_click)
+
+        self.crear_footer_volver(self.gestion_empleados)
+
+        def fallar(e):
+            messagebox.showerror("Error", str(e))
+            self.gestion_empleados()
+
+        def mostrar_empleados(directorio):
+            lista_emp = [e for e in directorio if e['id'] != 1]
+            if not lista_emp:
+                fallar("No hay empleados registrados!")
+                return
+            for emp in lista_emp:
+                if emp['area'].lower() in ['corte', 'empacar']:
+                    salario = f"{emp['salario'] or 0.0:.2f}"
+                else:
+                    salario = "Por pieza"
+
+                filas.insert('', 'end', values=(
+                    emp['id'], emp['nombre'], emp['telefono'], emp['area'], salario, "Modificar"
+                ))
+
+        def refrescar():
+            filas.delete(*filas.get_children())
+            self.en_segundo_plano(zona_carga, Empleados.directorio, al_terminar=mostrar_empleados, al_fallar=fallar)
+
+        self.al_mostrar(refrescar)
+
+    def mostrar_ventana_modificar(self, id_empleado):
+        try:
+            emp = Empleados.consultar(id_empleado)
+        except ErrorOperGest:
+            emp = None
+
+        if not emp:
+            messagebox.showerror("Error", "Empleado no encontrado")
+            return
+
+        if not self.abrir_pantalla("modificar_empleado", id_empleado, emp):
+            return
+        self.crear_cabecera_submenu("Modificar empleado")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=30, fill='both', expand=True)
+
+        tk.Label(frame, text="Nombre:", bg='white').pack(anchor='w')
+        entry_nombre = tk.Entry(frame, font=("Arial", 10))
+        entry_nombre.pack(fill='x', ipady=8, pady=(0, 10))
+
+        tk.Label(frame, text="Teléfono:", bg='white').pack(anchor='w')
+        entry_telefono = tk.Entry(frame, font=("Arial", 10))
+        entry_telefono.pack(fill='x', ipady=8, pady=(0, 10))
+
+        tk.Label(frame, text="Área:", bg='white').pack(anchor='w')
+        combo_area = ttk.Combobox(frame, values=["Corte", "Empacar", "Costura"], state="readonly")
+        combo_area.pack(fill='x', ipady=8, pady=(0, 10))
+
+        label_salario = tk.Label(frame, text="Salario por hora:", bg='white')
+        entry_salario = tk.Entry(frame, font=("Arial", 10))
+
+        def actualizar_campos(event):
+            area_sel = combo_area.get().lower()
+            if area_sel in ['corte', 'empacar']:
+                label_salario.pack(anchor='w', pady=(10, 2), before=frame_botones)
+                entry_salario.pack(fill='x', ipady=8, pady=(0, 10), before=frame_botones)
+            else:
+                label_salario.pack_forget()
+                entry_salario.pack_forget()
+
+        combo_area.bind("<<ComboboxSelected>>", actualizar_campos)
+
+        def guardar_cambios():
+            nombre = entry_nombre.get().strip()
+            telefono = entry_telefono.get().strip()
+            area = combo_area.get()
+
+            if not nombre or not telefono or not area:
+                messagebox.showerror("Error", "Complete todos los campos")
+                return
+
+            try:
+                if len(telefono) != 8:
+                    messagebox.showerror("Error", "El número de teléfono debe ser de 8 dígitos")
+                    return
+                telefono = int(telefono)
+            except ValueError:
+                messagebox.showerror("Error", "Número de teléfono no válido")
+                return
+
+            try:
+                Empleados.modificar(id_empleado, nombre, telefono, area)
+
+                if area.lower() in ['corte', 'empacar']:
+                    salario = entry_salario.get().strip()
+                    if not salario:
+                        messagebox.showerror("Error", "Ingrese un salario válido")
+                        return
+                    try:
+                        salario = float(salario)
+                    except ValueError:
+                        messagebox.showerror("Error", "El salario debe ser numérico")
+                        return
+                    Salarios.modificar_salario(id_empleado, salario)
+                else:
+                    Salarios.eliminar(id_empleado)
+
+                messagebox.showinfo("Éxito", "Empleado actualizado correctamente")
+                self.gestion_empleados()
+
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+
+        frame_botones = tk.Frame(frame, bg='white')
+        frame_botones.pack(fill='x', pady=10)
+
+        tk.Button(frame_botones, text="Guardar cambios", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=guardar_cambios).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_botones, text="Cancelar", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.listar_empleados).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar(id_emp, emp):
+            nonlocal id_empleado
+            id_empleado = id_emp
+            for entry, valor in ((entry_nombre, emp['nombre']), (entry_telefono, emp['telefono']),
+                                 (entry_salario, Salarios.mostrar_salario(id_emp))):
+                entry.delete(0, tk.END)
+                entry.insert(0, valor)
+            combo_area.set(emp['area'])
+            actualizar_campos(None)
+
+        self.al_mostrar(refrescar, id_empleado, emp)
+
+    def despedir_empleado(self):
+        try:
+            lista_emp = [e for e in Empleados.directorio() if e['id'] != 1]
+            if not lista_emp:
+                raise ValueError("No hay empleados registrados!")
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        if not self.abrir_pantalla("despedir_empleado", lista_emp):
+            return
+        self.crear_cabecera_submenu("Despedir empleado")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(pady=20, padx=40, fill='both', expand=True)
+
+        tk.Label(frame, text="Seleccione un empleado:", font=("Arial", 10),
+                 bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+
+        seleccion_empleado = ttk.Combobox(frame, state="readonly", font=("Arial", 10))
+        seleccion_empleado.pack(fill='x', ipady=8, pady=(5, 20))
+
+        def despedir():
+            seleccion = seleccion_empleado.get()
+            if not seleccion:
+                messagebox.showerror("Error", "Seleccione un empleado")
+                return
+
+            id_emp = seleccion.split(" - ")[0]
+            try:
+                Empleados.eliminar(id_emp)
+            except ErrorOperGest as e:
+                messagebox.showerror("Error", str(e))
+                return
+            Salarios.eliminar(id_emp)
+            seleccion_empleado['values'] = [v for v in seleccion_empleado['values'] if v != seleccion]
+            seleccion_empleado.set('')
+            messagebox.showinfo("Éxito", f"Se eliminó al empleado {id_emp} del registro")
+
+        frame_btns = tk.Frame(frame, bg='white')
+        frame_btns.pack(side='bottom', fill='x', pady=20)
+
+        tk.Button(frame_btns, text="Despedir", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=despedir).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_btns, text="Cancelar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_empleados).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar(lista_emp):
+            seleccion_empleado['values'] = [f"{e['id']} - {e['nombre']}" for e in lista_emp]
+            seleccion_empleado.set('')
+
+        self.al_mostrar(refrescar, lista_emp)
+
+    #=====GESTIÓN PEDIDOS=====
+    def registrar_corte(self):
+        if not self.abrir_pantalla("registrar_corte"):
+            return
+        self.crear_cabecera_submenu("✂️ Registrar nuevo corte")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        marcas = ['Pepe', 'Jhon Mike', 'Wrangler', "Levi's", "Lee"]
+        tk.Label(frame, text="Marca:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        seleccion_marca = ttk.Combobox(frame, values=marcas, state="readonly", font=("Arial", 10))
+        seleccion_marca.pack(fill='x', ipady=8, pady=(5, 15))
+
+        categorias = ['Dama', 'Niño', 'Juvenil', 'Caballero']
+        tk.Label(frame, text="Categoría:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        seleccion_categoria = ttk.Combobox(frame, values=categorias, state="readonly", font=("Arial", 10))
+        seleccion_categoria.pack(fill='x', ipady=8, pady=(5, 15))
+
+        tk.Label(frame, text="Color:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        entry_color = tk.Entry(frame, font=("Arial", 10), relief='solid', bd=1)
+        entry_color.pack(fill='x', ipady=8, pady=(5, 15))
+
+        tallas_elegidas = {}
+
+        def seleccionar_tallas():
+            top = tk.Toplevel(self.contenedor)
+            top.title("Seleccionar tallas")
+            top.geometry("380x420")
+            top.config(bg='white')
+            top.grab_set()
+
+            tk.Label(top, text="Selecciona las tallas disponibles:",
+                     bg='white', font=("Arial", 11, "bold"), fg='gray').pack(pady=10)
+
+            tallas_validas = TallasCorte.TALLAS_PERMITIDAS
+
+            frame_tallas = tk.Frame(top, bg='white')
+            frame_tallas.pack(padx=20, pady=10)
+
+            seleccion = {}
+            columnas = 4
+
+            for i, t in enumerate(tallas_validas):
+                fila = i // columnas
+                columna = i % columnas
+                var = tk.BooleanVar()
+                chk = tk.Checkbutton(frame_tallas, text=f"Talla {t}", variable=var,
+                                     bg='white', activebackground='white')
+                chk.grid(row=fila, column=columna, sticky='w', padx=10, pady=5)
+                seleccion[t] = var
+
+            def confirmar():
+                seleccionadas = [t for t, v in seleccion.items() if v.get()]
+                if not seleccionadas:
+                    messagebox.showwarning("Obligatorio", "Selecciona al menos una talla.")
+                    return
+                top.destroy()
+
+                for widget in frame.pack_slaves():
+                    if isinstance(widget, tk.LabelFrame):
+                        widget.destroy()
+
+                lf = tk.LabelFrame(frame, text="Cantidades por talla", bg="white",
+                                   font=("Arial", 10, "bold"), fg='gray')
+                lf.pack(fill='both', expand=True, pady=10, ipady=10, ipadx=5)
+
+                canvas = tk.Canvas(lf, bg='white', highlightthickness=0, height=250)  # ← altura mayor
+                scrollbar = tk.Scrollbar(lf, orient="vertical", command=canvas.yview)
+                scrollable_frame = tk.Frame(canvas, bg='white')
+
+                scrollable_frame.bind(
+                    "<Configure>",
+                    lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+                )
+
+                canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+                canvas.configure(yscrollcommand=scrollbar.set)
+
+                canvas.pack(side="left", fill="both", expand=True)
+                scrollbar.pack(side="right", fill="y")
+
+                for t in seleccionadas:
+                    f = tk.Frame(scrollable_frame, bg="white")
+                    f.pack(fill='x', pady=3)
+                    tk.Label(f, text=f"Talla {t}:", width=10, bg="white", fg='gray').pack(side='left', padx=10)
+                    e = tk.Entry(f, width=12, font=("Arial", 10), relief='solid', bd=1)
+                    e.pack(side='left', padx=5)
+                    tallas_elegidas[t] = e
+
+            tk.Button(top, text="Confirmar", bg="#0078D7", fg="white",
+                      font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                      command=confirmar).pack(pady=10, fill='x', padx=20, ipady=6)
+
+        btn_agregar_tallas = tk.Button(frame, text="➕ Agregar tallas", bg="#0078D7", fg="white",
+                                       font=("Arial", 9, "bold"), relief='flat', cursor="hand2",
+                                       padx=10, pady=5, command=seleccionar_tallas)
+        btn_agregar_tallas.pack(anchor='w', pady=(5, 10))
+
+        def guardar_corte():
+            marca = seleccion_marca.get().strip()
+            categoria = seleccion_categoria.get().strip()
+            color = entry_color.get().strip()
+
+            if not (marca and categoria and color):
+                messagebox.showwarning("Campos vacíos", "Completa todos los campos.")
+                return
+
+            if not tallas_elegidas:
+                messagebox.showwarning("Tallas", "Debes agregar tallas antes de guardar.")
+                return
+
+            pedido = Pedidos(marca, categoria, color)
+            id_pedido = pedido.guardar()
+
+            for talla, entry in tallas_elegidas.items():
+                try:
+                    cantidad = int(entry.get())
+                except:
+                    cantidad = 0
+                if cantidad > 0:
+                    TallasCorte(id_pedido, talla, cantidad).agregar_talla()
+
+            messagebox.showinfo("Éxito", "Corte registrado correctamente.")
+            self.gestion_pedidos()
+
+        frame_btns = tk.Frame(frame, bg='white')
+        frame_btns.pack(side='bottom', fill='x', pady=20)
+
+        tk.Button(frame_btns, text="Guardar", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=guardar_corte).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_btns, text="Regresar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_pedidos).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar():
+            seleccion_marca.set('')
+            seleccion_categoria.set('')
+            entry_color.delete(0, tk.END)
+            tallas_elegidas.clear()
+            for widget in frame.pack_slaves():
+                if isinstance(widget, tk.LabelFrame):
+                    widget.destroy()
+
+        self.al_mostrar(refrescar)
+
+    def agregar_bandos(self):
+        try:
+            cortes = [f"{c['id']} - {c['marca']} - {c['categoria']}" for c in Pedidos.listar(estado="en proceso")]
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        if not self.abrir_pantalla("agregar_bandos", cortes):
+            return
+        self.crear_cabecera_submenu("➕ Agregar Bandos")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        tk.Label(frame, text="Seleccione el corte:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w',
+                                                                                                     pady=(10, 2))
+        seleccion_corte = ttk.Combobox(frame, state="readonly", font=("Arial", 10))
+        seleccion_corte.pack(fill='x', ipady=8, pady=(5, 15))
+
+        bandos_elegidos = {}
+
+        def seleccionar_bandos():
+            corte_sel = seleccion_corte.get().strip()
+            if not corte_sel:
+                messagebox.showwarning("Seleccionar corte", "Debes seleccionar un corte antes de continuar.")
+                return
+
+            id_corte = corte_sel.split(" - ")[0]
+
+            try:
+                tallas_disp = TallasCorte.obtener_tallas_corte(id_corte)
+            except ValueError as e:
+                messagebox.showwarning("Sin tallas", str(e))
+                return
+
+            bandos_existentes = Bandos.obtener_num_bandos_corte(id_corte)
+            disponibles = [i for i in range(1, 100) if i not in bandos_existentes]
+
+            if not disponibles:
+                messagebox.showinfo("Sin bandos", "Ya se registraron todos los bandos para este corte.")
+                return
+
+            top = tk.Toplevel(self.contenedor)
+            top.title("Seleccionar bandos")
+            top.geometry("450x500")
+            top.config(bg='white')
+            top.grab_set()
+
+            tk.Label(top, text="Selecciona los bandos a agregar:",
+                     bg='white', font=("Arial", 11, "bold"), fg='gray').pack(pady=10)
+
+            contenedor_scroll = tk.Frame(top, bg='white')
+            contenedor_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+            canvas = tk.Canvas(contenedor_scroll, bg='white', highlightthickness=0)
+            scrollbar = tk.Scrollbar(contenedor_scroll, orient="vertical", command=canvas.yview)
+            frame_bandos = tk.Frame(canvas, bg='white')
+
+            frame_bandos.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+            canvas.create_window((0, 0), window=frame_bandos, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+
+            canvas.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
+
+            seleccion = {}
+            columnas = 8
+            for i, bando_num in enumerate(disponibles):
+                fila = i // columnas
+                columna = i % columnas
+                var = tk.BooleanVar()
+                chk = tk.Checkbutton(frame_bandos, text=str(bando_num), variable=var, bg='white',
+                                     activebackground='white')
+                chk.grid(row=fila, column=columna, padx=5, pady=3, sticky='w')
+                seleccion[bando_num] = var
+
+            def confirmar_bandos():
+                seleccionados = [b for b, v in seleccion.items() if v.get()]
+                if not seleccionados:
+                    messagebox.showwarning("Obligatorio", "Selecciona al menos un bando.")
+                    return
+                top.destroy()
+
+                for widget in frame.pack_slaves():
+                    if isinstance(widget, tk.LabelFrame):
+                        widget.destroy()
+
+                lf = tk.LabelFrame(frame, text="Agregar tallas y cantidades por bando", bg="white",
+                                   font=("Arial", 10, "bold"), fg='gray')
+                lf.pack(fill='both', expand=True, pady=10, ipady=10, ipadx=5)
+
+                canvas2 = tk.Canvas(lf, bg='white', highlightthickness=0, height=300)
+                scrollbar2 = tk.Scrollbar(lf, orient="vertical", command=canvas2.yview)
+                scrollable_frame = tk.Frame(canvas2, bg='white')
+
+                scrollable_frame.bind("<Configure>", lambda e: canvas2.configure(scrollregion=canvas2.bbox("all")))
+                canvas2.create_window((0, 0), window=scrollable_frame, anchor="nw")
+                canvas2.configure(yscrollcommand=scrollbar2.set)
+                canvas2.pack(side="left", fill="both", expand=True)
+                scrollbar2.pack(side="right", fill="y")
+
+                for bando in seleccionados:
+                    f = tk.Frame(scrollable_frame, bg="white")
+                    f.pack(fill='x', pady=4)
+
+                    tk.Label(f, text=f"Bando {bando}:", width=10, bg="white", fg='gray').pack(side='left', padx=10)
+                    combo_talla = ttk.Combobox(f, values=tallas_disp, state="readonly", width=10, font=("Arial", 10))
+                    combo_talla.pack(side='left', padx=5)
+
+                    entry_cant = tk.Entry(f, width=8, font=("Arial", 10), relief='solid', bd=1)
+                    entry_cant.pack(side='left', padx=5)
+                    entry_cant.insert(0, "0")
+
+                    bandos_elegidos[bando] = {"talla": combo_talla, "cantidad": entry_cant, "corte": id_corte}
+
+            tk.Button(top, text="Confirmar selección", bg="#0078D7", fg="white",
+                      font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                      command=confirmar_bandos).pack(pady=10, fill='x', padx=20, ipady=6)
+
+        btn_agregar_bandos = tk.Button(frame, text="➕ Seleccionar bandos", bg="#0078D7", fg="white",
+                                       font=("Arial", 9, "bold"), relief='flat', cursor="hand2",
+                                       padx=10, pady=5, command=seleccionar_bandos)
+        btn_agregar_bandos.pack(anchor='w', pady=(5, 10))
+
+        def guardar_bandos():
+            if not bandos_elegidos:
+                messagebox.showwarning("Sin bandos", "Debes seleccionar y llenar los bandos antes de guardar.")
+                return
+
+            resumen = []
+            try:
+                for bando, datos in bandos_elegidos.items():
+                    talla = datos["talla"].get()
+                    try:
+                        cantidad = int(datos["cantidad"].get())
+                    except ValueError:
+                        cantidad = 0
+
+                    if not talla or cantidad <= 0:
+                        raise ValueError(f"Bando {bando}: Debes indicar una talla y una cantidad válida.")
+
+                    nuevo_bando = Bandos(datos["corte"], talla, cantidad)
+                    nuevo_bando.agregar_bando()
+
+                    resumen.append(f"Bando {bando} → Talla {talla}: {cantidad} unidades")
+
+                messagebox.showinfo("Éxito", "Se agregaron los siguientes bandos:\n\n" + "\n".join(resumen))
+                self.gestion_pedidos()
+
+            except Exception as e:
+                messagebox.showerror("Error", f"No se completó el registro:\n{e}")
+
+        frame_btns = tk.Frame(frame, bg='white')
+        frame_btns.pack(side='bottom', fill='x', pady=20)
+
+        tk.Button(frame_btns, text="Guardar", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=guardar_bandos).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_btns, text="Regresar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_pedidos).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar(cortes):
+            seleccion_corte['values'] = cortes
+            seleccion_corte.set('')
+            bandos_elegidos.clear()
+            for widget in frame.pack_slaves():
+                if isinstance(widget, tk.LabelFrame):
+                    widget.destroy()
+
+        self.al_mostrar(refrescar, cortes)
+
+    def listar_pedidos(self):
+        if not self.abrir_pantalla("listar_pedidos"):
+            return
+        self.crear_cabecera_submenu("📋 Cortes en proceso")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(fill='both', expand=True, padx=30, pady=20)
+
+        tk.Label(frame, text="Mostrar por:", bg='white', fg='gray', font=("Arial", 10, "bold")).pack(anchor='w')
+        seleccion_filtro = ttk.Combobox(frame, values=["Tallas", "Bandos"], state="readonly", font=("Arial", 10))
+        seleccion_filtro.current(0)
+        seleccion_filtro.pack(fill='x', pady=(0, 10), ipady=6)
+
+        contenedor_tabla = tk.Frame(frame, bg='white')
+        contenedor_tabla.pack(fill='both', expand=True, pady=10)
+        zona_carga = tk.Frame(frame, bg='white')
+        zona_carga.pack(fill='x')
+
+        tamano_pagina = 50
+        tabla = None
+
+        def mostrar_pedidos():
+            nonlocal tabla
+            for widget in contenedor_tabla.winfo_children() + zona_carga.winfo_children():
+                widget.destroy()
+
+            if seleccion_filtro.get().lower() == "tallas":
+                columnas = [("talla", "Talla", 100), ("cantidad", "Cantidad", 100)]
+            else:
+                columnas = [("bando", "Bando", 100), ("talla", "Talla", 100), ("cantidad", "Cantidad", 100),
+                            ("faltan", "Faltan", 320)]
+            tabla = TablaDatos(contenedor_tabla, columnas, arbol=("Corte", 320), altura=18)
+            tabla.pack(fill='both', expand=True)
+            cargar_pagina(0)
+
+        def consultar_pagina(despues_de):
+            pedidos = Pedidos.listar(estado="en proceso", despues_de=despues_de, limite=tamano_pagina)
+            return pedidos, Pedidos.detalle_cortes([p[0] for p in pedidos])
+
+        def cargar_pagina(despues_de):
+            def fallar(e):
+                messagebox.showerror("Error", str(e))
+                self.gestion_pedidos()
+
+            self.en_segundo_plano(zona_carga, consultar_pagina, despues_de,
+                                  al_terminar=mostrar_pagina, al_fallar=fallar)
+
+        def filas_corte(pedido, detalle, filtro):
+            id_corte, marca, categoria, color = pedido[0], pedido[1], pedido[2], pedido[3]
+            tallas = detalle[id_corte]["tallas"]
+            fila = {"_texto": f"Corte {id_corte} - {marca} ({categoria}) - {color}"}
+
+            if filtro == "tallas":
+                fila["_hijos"] = [{"talla": t["talla"], "cantidad": t["cantidad_max"]} for t in tallas]
+                fila["cantidad"] = f"Total: {sum(t['cantidad_max'] for t in tallas)}"
+                return fila
+
+            bandos = detalle[id_corte]["bandos"]
+            fila["_hijos"] = [{"bando": f"Bando {n}", "talla": b["talla"], "cantidad": b["cantidad"]}
+                              for n, b in enumerate(bandos, start=1)]
+            fila["cantidad"] = f"Total: {sum(b['cantidad'] for b in bandos)}"
+            faltantes = [f"Talla {t['talla']} ({t['restante']})" for t in tallas if t["restante"] > 0]
+            if faltantes:
+                fila["faltan"] = "⚠ " + ", ".join(faltantes)
+                fila["_etiquetas"] = ("alerta",)
+            return fila
+
+        def mostrar_pagina(resultado):
+            pedidos, detalle = resultado
+            filtro = seleccion_filtro.get().lower()
+
+            if not pedidos:
+                return
+
+            tabla.agregar([filas_corte(p, detalle, filtro) for p in pedidos])
+
+            if len(pedidos) == tamano_pagina:
+                def cargar_mas():
+                    btn_mas.destroy()
+                    cargar_pagina(pedidos[-1][0])
+
+                btn_mas = tk.Button(zona_carga, text="Cargar más cortes", bg="#0078D7", fg="white",
+                                    font=("Arial", 9, "bold"), relief='flat', cursor="hand2", command=cargar_mas)
+                btn_mas.pack(pady=10)
+
+        seleccion_filtro.bind("<<ComboboxSelected>>", lambda e: mostrar_pedidos())
+
+        self.crear_footer_volver(self.gestion_pedidos)
+        self.al_mostrar(mostrar_pedidos)
+
+    def entregar_pedido(self):
+        try:
+            pedidos = Pedidos.listar(estado="en proceso", limite=1)
+        except ValueError:
+            pedidos = []
+        if not pedidos:
+            messagebox.showinfo("Entregar pedido", "No hay cortes en proceso.")
+            self.gestion_pedidos()
+            return
+
+        if not self.abrir_pantalla("entregar_pedido"):
+            return
+        self.crear_cabecera_submenu("🚚 Entregar Pedido")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=30, fill='both', expand=True)
+
+        # --- Label y ComboBox para seleccionar corte ---
+        tk.Label(frame, text="Seleccionar corte:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w',
+                                                                                                   pady=(10, 2))
+
+        seleccion_corte = ComboBusqueda(frame, lambda texto: Busqueda.pedidos(texto, estado="en proceso"),
+                                        lambda p: f"Corte {p[0]} - {p[1]} - {p[2]} - {p[3]}", font=("Arial", 10))
+        seleccion_corte.pack(fill='x', ipady=8, pady=(5, 15))
+
+        lbl_estado = tk.Label(frame, text="", bg='white', fg='gray', font=("Arial", 10))
+        lbl_estado.pack(anchor='w', pady=(5, 20))
+
+        def actualizar_estado(event=None):
+            valor = seleccion_corte.seleccion()
+            if not valor:
+                lbl_estado.config(text="")
+                return
+            id_corte = int(valor.split()[1])
+            pedido = Pedidos.buscar(id_corte)
+            if pedido:
+                lbl_estado.config(text=f"Estado actual: {pedido['estado']}")
+            else:
+                lbl_estado.config(text="Estado no disponible.")
+
+        seleccion_corte.bind("<<ComboboxSelected>>", actualizar_estado)
+
+        def entregar():
+            valor = seleccion_corte.seleccion()
+            if not valor:
+                messagebox.showwarning("Seleccionar corte", "Seleccione un corte para entregar.")
+                return
+            id_corte = int(valor.split()[1])
+            pedido = Pedidos.buscar(id_corte)
+            if not pedido:
+                messagebox.showerror("Error", "No se encontró el corte seleccionado.")
+                return
+
+            if pedido['estado'] == 'entregado':
+                messagebox.showinfo("Información", "Este pedido ya fue entregado.")
+                return
+
+            Pedidos.actualizar_estado(id_corte, "entregado")
+            messagebox.showinfo("Éxito", f"Corte {id_corte} entregado correctamente.")
+            self.entregar_pedido()
+
+        frame_btns = tk.Frame(frame, bg='white')
+        frame_btns.pack(side='bottom', fill='x', pady=20)
+
+        tk.Button(frame_btns, text="Entregar", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=entregar).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_btns, text="Regresar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_pedidos).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar():
+            seleccion_corte.recargar()
+            lbl_estado.config(text="")
+
+        self.al_mostrar(refrescar)
+
+    #====GESTIÓN OPERACIONES====
+    def registrar_operacion(self):
+        if not self.abrir_pantalla("registrar_operacion"):
+            return
+        self.crear_cabecera_submenu("🧮 Registrar Operación")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=30, fill='both', expand=True)
+
+        tk.Label(frame, text="Nombre de la operación:", bg='white', fg='gray', anchor='w', font=("Arial", 10)).pack(
+            fill='x', pady=(5, 2))
+        entry_nombre = tk.Entry(frame, font=("Arial", 10))
+        entry_nombre.pack(fill='x', ipady=8, pady=(0, 10))
+
+        tk.Label(frame, text="Precio talla pequeña:", bg='white', fg='gray', anchor='w', font=("Arial", 10)).pack(
+            fill='x', pady=(5, 2))
+        entry_small = tk.Entry(frame, font=("Arial", 10))
+        entry_small.pack(fill='x', ipady=8, pady=(0, 10))
+
+        tk.Label(frame, text="Precio talla grande:", bg='white', fg='gray', anchor='w', font=("Arial", 10)).pack(
+            fill='x', pady=(5, 2))
+        entry_big = tk.Entry(frame, font=("Arial", 10))
+        entry_big.pack(fill='x', ipady=8, pady=(0, 20))
+
+        def guardar_operacion():
+            nombre = entry_nombre.get().strip()
+            small = entry_small.get().strip()
+            big = entry_big.get().strip()
+
+            if not nombre or not small or not big:
+                messagebox.showwarning("Campos incompletos", "Por favor complete todos los campos.")
+                return
+
+            try:
+                small_price = float(small)
+                big_price = float(big)
+            except ValueError:
+                messagebox.showerror("Error", "Los precios deben ser números.")
+                return
+
+            nueva_op = Operaciones(nombre, small_price, big_price)
+            nueva_op.guardar()
+            messagebox.showinfo("Éxito", f"Operación '{nombre}' registrada correctamente.")
+            entry_nombre.delete(0, tk.END)
+            entry_small.delete(0, tk.END)
+            entry_big.delete(0, tk.END)
+
+        frame_btns = tk.Frame(frame, bg='white')
+        frame_btns.pack(side='bottom', fill='x', pady=20)
+
+        tk.Button(frame_btns, text="Guardar", bg="#FF8C00", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=guardar_operacion).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        tk.Button(frame_btns, text="Regresar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_operaciones).pack(side='left', expand=True, fill='x', padx=5, ipady=8)
+
+        def refrescar():
+            for entry in (entry_nombre, entry_small, entry_big):
+                entry.delete(0, tk.END)
+
+        self.al_mostrar(refrescar)
+
+    def consultar_operacion(self):
+        try:
+            operaciones = Operaciones.listar()
+        except ValueError as e:
+            messagebox.showwarning("Sin registros", str(e))
+            self.gestion_operaciones()
+            return
+
+        if not self.abrir_pantalla("consultar_operacion", operaciones):
+            return
+        self.crear_cabecera_submenu("🔍 Consultar Operaciones")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=30, pady=20, fill='both', expand=True)
+
+        tk.Label(frame, text="Seleccionar operación:", bg='white', fg='gray', font=("Arial", 10, "bold")).pack(
+            anchor='w')
+        seleccion = ttk.Combobox(frame, state="readonly", font=("Arial", 10))
+        seleccion.pack(fill='x', pady=(0, 15), ipady=5)
+
+        contenedor_scroll = tk.Frame(frame, bg='white')
+        contenedor_scroll.pack(fill='both', expand=True)
+
+        canvas = tk.Canvas(contenedor_scroll, bg='white', highlightthickness=0)
+        canvas.pack(side='left', fill='both', expand=True)
+
+        scroll_y = tk.Scrollbar(contenedor_scroll, orient='vertical', command=canvas.yview)
+        scroll_y.pack(side='right', fill='y')
+
+        scroll_x = tk.Scrollbar(frame, orient='horizontal', command=canvas.xview)
+        scroll_x.pack(fill='x')
+
+        canvas.configure(yscrollcommand=scroll_y.set, xscrollcommand=scroll_x.set)
+        canvas.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+
+        contenedor_tabla = tk.Frame(canvas, bg='white')
+        canvas.create_window((0, 0), window=contenedor_tabla, anchor='nw')
+
+        def mostrar_resultados():
+            for w in contenedor_tabla.winfo_children():
+                w.destroy()
+
+            try:
+                operaciones = Operaciones.listar()
+            except ValueError as e:
+                messagebox.showwarning("Sin registros", str(e))
+                self.gestion_operaciones()
+                return
+
+            filtro = seleccion.get()
+            if filtro == "Mostrar todo":
+                datos = operaciones
+            else:
+                datos = [op for op in operaciones if op[1] == filtro]
+
+            encabezado = tk.Frame(contenedor_tabla, bg="#E9ECEF")
+            encabezado.pack(fill='x', pady=(0, 5))
+
+            columnas = ["ID", "Nombre", "Precio Pequeña", "Precio Grande", "Acciones"]
+            anchos = [8, 25, 18, 18, 25]
+
+            for c, w in zip(columnas, anchos):
+                tk.Label(encabezado, text=c, font=("Arial", 9, "bold"), bg="#E9ECEF",
+                         width=w, anchor='center').pack(side='left', padx=1)
+
+            for op in datos:
+                fila = tk.Frame(contenedor_tabla, bg='white')
+                fila.pack(fill='x', pady=1)
+
+                tk.Label(fila, text=op[0], width=anchos[0], bg='white', anchor='center').pack(side='left', padx=1)
+                tk.Label(fila, text=op[1], width=anchos[1], bg='white', anchor='w').pack(side='left', padx=1)
+                tk.Label(fila, text=f"Q{op[2]:.3f}", width=anchos[2], bg='white', anchor='e').pack(side='left', padx=1)
+                tk.Label(fila, text=f"Q{op[3]:.3f}", width=anchos[3], bg='white', anchor='e').pack(side='left', padx=1)
+
+                acciones = tk.Frame(fila, bg='white')
+                acciones.pack(side='left', padx=3)
+
+                tk.Button(acciones, text="✏ Modificar", bg="#FFC107", fg="black", font=("Arial", 9),
+                          relief='flat', width=10,
+                          command=lambda oid=op[0]: modificar_operacion(oid)).pack(side='left', padx=2)
+
+                tk.Button(acciones, text="🗑 Eliminar", bg="#DC3545", fg="white", font=("Arial", 9),
+                          relief='flat', width=10,
+                          command=lambda oid=op[0]: eliminar_operacion(oid)).pack(side='left', padx=2)
+
+            canvas.update_idletasks()
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def modificar_operacion(id):
+            ventana_modificar = tk.Toplevel(self.contenedor)
+            ventana_modificar.title("Modificar Operación")
+            ventana_modificar.geometry("300x250")
+            ventana_modificar.configure(bg='white')
+
+            operacion = Operaciones.buscar(id)
+
+            tk.Label(ventana_modificar, text="Nombre:", bg='white').pack()
+            e_nombre = tk.Entry(ventana_modificar)
+            e_nombre.insert(0, operacion[1])
+            e_nombre.pack(pady=5)
+
+            tk.Label(ventana_modificar, text="Precio pequeña:", bg='white').pack()
+            e_small = tk.Entry(ventana_modificar)
+            e_small.insert(0, operacion[2])
+            e_small.pack(pady=5)
+
+            tk.Label(ventana_modificar, text="Precio grande:", bg='white').pack()
+            e_big = tk.Entry(ventana_modificar)
+            e_big.insert(0, operacion[3])
+            e_big.pack(pady=5)
+
+            def guardar_cambios():
+                v = VentanaConfirmacion(self.contenedor, "¿Seguro que desea modificar esta operación?")
+                if not v.resultado:
+                    messagebox.showinfo("Cancelado", "La modificación fue cancelada.")
+                    return
+
+                nombre = e_nombre.get().strip()
+                small = e_small.get().strip()
+                big = e_big.get().strip()
+
+                if not nombre or not small or not big:
+                    messagebox.showwarning("Error", "Todos los campos son obligatorios.")
+                    return
+
+                try:
+                    Operaciones.modificar(id, nombre, small, big)
+                except ErrorOperGest as e:
+                    messagebox.showerror("Error", str(e))
+                    return
+                messagebox.showinfo("Éxito", "Se guradaron los cambios correctamente")
+                ventana_modificar.destroy()
+                mostrar_resultados()
+
+            tk.Button(ventana_modificar, text="Guardar cambios", bg="#28A745", fg="white",
+                      relief='flat', command=guardar_cambios).pack(pady=15)
+
+        def eliminar_operacion(id):
+            v = VentanaConfirmacion(self.contenedor, "¿Seguro que desea eliminar esta operación?")
+            if not v.resultado:
+                messagebox.showinfo("Cancelado", "La eliminación fue cancelada.")
+                return
+
+            try:
+                Operaciones.eliminar(id)
+                messagebox.showinfo("Éxito", "Se eliminaron los datos de la operación.")
+                mostrar_resultados()
+            except ValueError as e:
+                messagebox.showwarning("Error", str(e))
+
+        seleccion.bind("<<ComboboxSelected>>", lambda e: mostrar_resultados())
+
+        self.crear_footer_volver(self.gestion_operaciones)
+
+        def refrescar(operaciones):
+            seleccion['values'] = ["Mostrar todo"] + [op[1] for op in operaciones]
+            seleccion.current(0)
+            mostrar_resultados()
+
+        self.al_mostrar(refrescar, operaciones)
+
+    #===GESTIÓN DE TAREAS===
+    def asignar_tareas(self):
+        # Solo asignar necesita operaciones y un corte abierto; la lista y los reportes no.
+        try:
+            Operaciones.listar()
+            Pedidos.listar(estado="en proceso", limite=1)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        if not self.abrir_pantalla("asignar_tareas"):
+            return
+        self.crear_cabecera_submenu("🧵 Asignar Tarea")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        tk.Label(frame, text="Completa los datos para asignar la tarea:",
+                 bg='white', font=("Arial", 11, "bold"), fg='gray').pack(anchor='w', pady=(0, 5))
+
+        campos = tk.Frame(frame, bg='white')
+        campos.pack(fill='x', pady=5)
+
+        tk.Label(campos, text="Empleado:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        cb_empleado = ComboBusqueda(campos, lambda texto: Busqueda.empleados(texto, area="Costura"),
+                                    lambda e: f"{e['id']} - {e['nombre']}", font=("Arial", 10))
+        cb_empleado.pack(fill='x', ipady=5, pady=(0, 5))
+
+        tk.Label(campos, text="Corte:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        cb_corte = ComboBusqueda(campos, lambda texto: Busqueda.pedidos(texto, estado="en proceso"),
+                                 lambda p: f"{p['id']} - {p['marca']} {p['categoria']}", font=("Arial", 10))
+        cb_corte.pack(fill='x', ipady=5, pady=(0, 5))
+
+        tk.Label(campos, text="Operación:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w', pady=(10, 2))
+        cb_oper = ttk.Combobox(campos, state="readonly", font=("Arial", 10))
+        cb_oper.pack(fill='x', ipady=5, pady=(0, 5))
+
+        tk.Label(campos, text="Bandos a realizar:", font=("Arial", 10), bg='white', fg='gray').pack(anchor='w',
+                                                                                                    pady=(10, 2))
+        cb_bando = ttk.Combobox(campos, state="readonly", font=("Arial", 10))
+        cb_bando.pack(fill='x', ipady=5, pady=(0, 5))
+
+        def seleccionar_bando():
+            val_corte = cb_corte.seleccion()
+            if not val_corte:
+                messagebox.showwarning("Atención", "Primero selecciona un corte.")
+                return
+            corte_id = int(val_corte.split(" - ")[0])
+            self.abrir_ventana_bandos(corte_id, cb_bando)
+
+        btn_bandos = tk.Button(frame, text="➕ Seleccionar Bandos",
+                               bg="#0078D7", fg="white", font=("Arial", 9, "bold"),
+                               relief='flat', cursor="hand2", padx=10, pady=6,
+                               command=seleccionar_bando)
+        btn_bandos.pack(anchor='w', pady=(10, 20))
+
+        frame_botones = tk.Frame(frame, bg='white')
+        frame_botones.pack(side='bottom', fill='x', pady=20)
+
+        def guardar_tarea():
+            if not (cb_empleado.seleccion() and cb_corte.seleccion() and cb_oper.get() and cb_bando.get()):
+                messagebox.showwarning("Atención", "Completa todos los campos antes de guardar.")
+                return
+
+            id_empleado = int(cb_empleado.seleccion().split(" - ")[0])
+            id_corte = int(cb_corte.seleccion().split(" - ")[0])
+            id_oper = int(cb_oper.get().split(" - ")[0])
+            bandos = [int(b) for b in cb_bando.get().split(",") if b.strip()]
+
+            tarea = Tareas(id_empleado, id_corte, bandos, id_oper)
+            tarea.guardar()
+
+            messagebox.showinfo("Éxito", "Tarea asignada correctamente.")
+            refrescar()
+
+        tk.Button(frame_botones, text="Confirmar",
+                  bg="#D2691E", fg="white", font=("Arial", 10, "bold"),
+                  relief='flat', cursor="hand2", padx=10, pady=8,
+                  command=guardar_tarea).pack(side='left', expand=True, fill='x', padx=5)
+
+        tk.Button(frame_botones, text="Cancelar",
+                  bg="#0078D7", fg="white", font=("Arial", 10, "bold"),
+                  relief='flat', cursor="hand2", padx=10, pady=8,
+                  command=self.gestion_tareas).pack(side='left', expand=True, fill='x', padx=5)
+
+        def refrescar():
+            cb_empleado.recargar()
+            cb_corte.recargar()
+            for combo in (cb_oper, cb_bando):
+                combo.set('')
+            cb_oper['values'] = [f"{o['id']} - {o['nombre']}" for o in Operaciones.listar()]
+
+        self.al_mostrar(refrescar)
+
+    def abrir_ventana_bandos(self, corte_id, cb_bando):
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Seleccionar Bandos Disponibles")
+        ventana.config(bg="white")
+
+        ventana.update_idletasks()
+        w, h = 400, 400
+        x = (ventana.winfo_screenwidth() // 2) - (w // 2)
+        y = (ventana.winfo_screenheight() // 2) - (h // 2)
+        ventana.geometry(f"{w}x{h}+{x}+{y}")
+        ventana.resizable(False, False)
+
+        tk.Label(ventana, text="Selecciona los bandos disponibles:", bg="white", font=("Arial", 11, "bold")).pack(
+            pady=10)
+
+        frame_lista = tk.Frame(ventana, bg="white")
+        frame_lista.pack(fill="both", expand=True)
+
+        try:
+            bandos = Bandos.obtener_bandos_corte(corte_id)
+        except Exception:
+            bandos = []
+
+        vars_bandos = []
+        for b in bandos:
+            var = tk.BooleanVar()
+            chk = tk.Checkbutton(frame_lista, text=f"No.{b['id']} - Cantidad={b['cantidad']} - talla={b['talla']}",
+                                 variable=var, bg="white")
+            chk.pack(anchor="w", padx=20, pady=2)
+            vars_bandos.append((var, b['id']))
+
+        def confirmar_seleccion():
+            seleccionados = [str(b_id) for var, b_id in vars_bandos if var.get()]
+            if not seleccionados:
+                messagebox.showwarning("Atención", "Selecciona al menos un bando.")
+                return
+            cb_bando.set(", ".join(seleccionados))
+            ventana.destroy()
+
+        frame_botones = tk.Frame(ventana, bg="white")
+        frame_botones.pack(pady=15)
+        tk.Button(frame_botones, text="Confirmar", command=confirmar_seleccion, bg="#d2691e", fg="white").pack(side="left",
+                                                                                                          padx=10)
+        tk.Button(frame_botones, text="Cancelar", command=ventana.destroy, bg="#007ACC", fg="white").pack(
+            side="left", padx=10)
+
+    def marcar_tareas(self):
+        if not self.abrir_pantalla("marcar_tareas"):
+            return
+        self.crear_cabecera_submenu("✅ Marcar Tareas Completadas")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        tk.Label(frame, text="Selecciona un empleado para ver sus tareas asignadas:",
+                 bg='white', font=("Arial", 11, "bold"), fg='gray').pack(anchor='w', pady=(0, 15))
+
+        cb_empleado = ttk.Combobox(frame, state="readonly", font=("Arial", 10))
+        cb_empleado.pack(fill='x', ipady=6, pady=(0, 20))
+
+        tabla = TablaDatos(frame, [
+            ("corte", "Corte", 60),
+            ("operacion", "Operación", 230, Operaciones.buscar_nombre_por_id),
+            ("bandos", "Bandos", 160, lambda b: ", ".join(map(str, b))),
+        ], casilla="id")
+        tabla.pack(fill='both', expand=True)
+
+        zona_carga = tk.Frame(frame, bg='white')
+        zona_carga.pack(fill='x')
+
+        def mostrar_tareas(tareas):
+            tabla.cargar(tareas)
+            if not tareas:
+                messagebox.showinfo("Tareas", "Este empleado no tiene tareas pendientes.")
+
+        def cargar_tareas():
+            # Cambiar de empleado cancela la carga anterior al destruir su indicador.
+            for widget in zona_carga.winfo_children():
+                widget.destroy()
+            tabla.cargar([])
+            if not cb_empleado.get():
+                return
+
+            id_empleado = int(cb_empleado.get().split(" - ")[0])
+            self.en_segundo_plano(zona_carga, Tareas.listar_por_empleado, id_empleado, pendientes=True,
+                                  al_terminar=mostrar_tareas)
+
+        cb_empleado.bind("<<ComboboxSelected>>", lambda e: cargar_tareas())
+
+        frame_botones = tk.Frame(frame, bg='white')
+        frame_botones.pack(side='bottom', fill='x', pady=20)
+
+        def guardar_tareas():
+            tareas_marcadas = tabla.marcadas()
+            if not tareas_marcadas:
+                messagebox.showwarning("Atención", "No seleccionaste ninguna tarea completada.")
+                return
+
+            try:
+                resultado = Reportes.registrar_tareas(tareas_marcadas)
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudieron registrar las tareas: {e}")
+                return
+
+            for id_tarea, motivo in resultado["fallidas"].items():
+                messagebox.showerror("Error", f"No se pudo registrar la tarea {id_tarea}: {motivo}")
+
+            messagebox.showinfo("Éxito", f"Se registraron {len(resultado['registradas'])} tareas completadas.")
+            cargar_tareas()
+
+        tk.Button(frame_botones, text="Guardar",
+                  bg="#D2691E", fg="white", font=("Arial", 10, "bold"),
+                  relief='flat', cursor="hand2", padx=10, pady=8,
+                  command=guardar_tareas).pack(side='left', expand=True, fill='x', padx=5)
+
+        tk.Button(frame_botones, text="Cancelar",
+                  bg="#0078D7", fg="white", font=("Arial", 10, "bold"),
+                  relief='flat', cursor="hand2", padx=10, pady=8,
+                  command=self.gestion_tareas).pack(side='left', expand=True, fill='x', padx=5)
+
+        def refrescar():
+            try:
+                cb_empleado['values'] = Empleados.buscar_empleado_costura()
+            except ErrorOperGest:
+                cb_empleado['values'] = []
+            cargar_tareas()
+
+        self.al_mostrar(refrescar)
+
+    def ver_reportes(self):
+        if not self.abrir_pantalla("ver_reportes"):
+            return
+        self.crear_cabecera_submenu("📄 Reporte Quincenal")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        tk.Label(frame, text="Selecciona un empleado:", bg='white',
+                 font=("Arial", 11, "bold"), fg='gray').pack(anchor='w', pady=(0, 15))
+
+        cb_empleado = ttk.Combobox(frame, state="readonly", font=("Arial", 10))
+        cb_empleado.pack(fill='x', ipady=6, pady=(0, 20))
+
+        scroll_frame = tk.Frame(frame, bg='white')
+        scroll_frame.pack(fill='both', expand=True)
+
+        def cargar_reporte():
+            for widget in scroll_frame.winfo_children():
+                widget.destroy()
+
+            if not cb_empleado.get():
+                return
+
+            id_empleado = int(cb_empleado.get().split(" - ")[0])
+            quincena = Quincena.actual()
+            inicio, fin = quincena.inicio, quincena.fin
+
+            tk.Label(scroll_frame, text=f"Reporte del {inicio.strftime('%d/%m/%Y')} al {fin.strftime('%d/%m/%Y')}",
+                     bg='white', fg='gray', font=("Arial", 10, "italic")).pack(pady=(0, 10))
+
+            def mostrar_reporte(reporte):
+                if reporte["costura"]:
+                    tareas = reporte["destajo"]
+
+                    if not tareas:
+                        tk.Label(scroll_frame, text="No hay tareas registradas en este periodo.",
+                                 bg='white', fg='gray', font=("Arial", 10, "italic")).pack()
+                        return
+
+                    TablaDestajo(scroll_frame, tareas, reporte["resumen"]['total_destajo']).mostrar()
+
+                else:
+                    horas = reporte["horas"]
+
+                    if not horas:
+                        tk.Label(scroll_frame, text="No hay registros de horas en este periodo.",
+                                 bg='white', fg='gray', font=("Arial", 10, "italic")).pack()
+                        return
+
+                    tabla = TablaHoras(scroll_frame, horas)
+                    tabla.mostrar()
+
+            self.en_segundo_plano(scroll_frame, quincena.reporte_empleado, id_empleado, al_terminar=mostrar_reporte)
+
+        cb_empleado.bind("<<ComboboxSelected>>", lambda e: cargar_reporte())
+
+        def cerrar_quincena():
+            anterior = Quincena.actual().anterior()
+            if not messagebox.askyesno("Cerrar quincena",
+                                       f"¿Cerrar la quincena del {anterior.inicio.strftime('%d/%m/%Y')} "
+                                       f"al {anterior.fin.strftime('%d/%m/%Y')}?\n"
+                                       "Los totales quedarán congelados."):
+                return
+            self.en_segundo_plano(
+                frame, anterior.cerrar, mensaje="Cerrando quincena...",
+                al_terminar=lambda cerrados: messagebox.showinfo("Éxito", f"Quincena cerrada con {cerrados} empleados."),
+                al_fallar=lambda e: messagebox.showwarning("Aviso", str(e))
+            )
+
+        tk.Button(frame, text="Cerrar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.gestion_tareas).pack(side='bottom', pady=20)
+
+        tk.Button(frame, text="Cerrar quincena anterior", bg="#6c757d", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=cerrar_quincena).pack(side='bottom')
+
+        def refrescar():
+            cb_empleado['values'] = [f"{e['id']} - {e['nombre']}" for e in Empleados.listar()]
+            cargar_reporte()
+
+        self.al_mostrar(refrescar)
+
+#====VENTANAS DE SUBMENÚ DE EMPLEADOS====
+    def ver_tareas(self):
+        id_empleado = Cuentas.buscar_id(self.usuario_actual, self.password_actual)
+        if not id_empleado:
+            messagebox.showerror("Error", "No se pudo obtener el ID del empleado.")
+            return
+
+        if not self.abrir_pantalla("ver_tareas"):
+            return
+        self.crear_cabecera_submenu("📋 Tareas Asignadas")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        aviso = tk.Label(frame, text="", font=("Arial", 12), bg='white', fg='gray')
+        aviso.pack()
+        zona_carga = tk.Frame(frame, bg='white')
+        zona_carga.pack(fill='x')
+
+        tabla = TablaDatos(frame, [
+            ("corte", "Corte", 60),
+            ("bandos", "Bando(s)", 140, lambda b: ", ".join(map(str, b))),
+            ("operacion", "Operación", 220, lambda o: Operaciones.buscar_nombre_por_id(o) if o else "Desconocida"),
+            ("fecha", "Fecha", 160, lambda f: f or "N/A"),
+        ])
+        tabla.pack(fill='both', expand=True)
+
+        tk.Button(frame, text="Volver", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.menu_empleado).pack(side='bottom', pady=20)
+
+        def mostrar_tareas(tareas):
+            tabla.cargar(tareas)
+            aviso.config(text="" if tareas else "No tienes tareas asignadas.")
+
+        def refrescar():
+            tabla.cargar([])
+            aviso.config(text="")
+            self.en_segundo_plano(zona_carga, Tareas.listar_por_empleado, id_empleado, al_terminar=mostrar_tareas)
+
+        self.al_mostrar(refrescar)
+
+    def ver_reporte_empleado(self):
+        try:
+            id_empleado = Cuentas.buscar_id(self.usuario_actual, self.password_actual)
+        except:
+            messagebox.showerror("Error", "Error al conectar con el sistema de cuentas.")
+            return
+
+        if not id_empleado:
+            messagebox.showerror("Error", "No se pudo obtener el ID del empleado.")
+            return
+
+        if not self.abrir_pantalla("ver_reporte_empleado"):
+            return
+        self.crear_cabecera_submenu("📄 Reporte Quincenal")
+
+        frame = tk.Frame(self.contenedor, bg='white')
+        frame.pack(padx=40, pady=20, fill='both', expand=True)
+
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_rowconfigure(1, weight=0)
+        frame.grid_columnconfigure(0, weight=1)
+
+        scroll_frame = tk.Frame(frame, bg='white')
+        scroll_frame.grid(row=0, column=0, sticky='nsew', pady=(0, 10))
+
+        def mostrar_reporte(reporte):
+            if reporte["costura"]:
+                tareas = reporte["destajo"]
+
+                if not tareas:
+                    tk.Label(scroll_frame, text="No hay tareas registradas en este periodo.",
+                             bg='white', fg='gray', font=("Arial", 10, "italic")).pack()
+                else:
+                    TablaDestajo(scroll_frame, tareas, reporte["resumen"]['total_destajo']).mostrar()
+
+            else:
+                horas = reporte["horas"]
+
+                if not horas:
+                    tk.Label(scroll_frame, text="No hay registros de horas en este periodo.",
+                             bg='white', fg='gray', font=("Arial", 10, "italic")).pack()
+                else:
+                    tabla = TablaHoras(scroll_frame, horas)
+                    tabla.mostrar()
+
+        frame_botones = tk.Frame(frame, bg='white')
+        frame_botones.grid(row=1, column=0, sticky='ew', pady=10)
+
+        tk.Button(frame_botones, text="Cerrar", bg="#0078D7", fg="white",
+                  font=("Arial", 10, "bold"), relief='flat', cursor="hand2",
+                  command=self.menu_empleado).pack(pady=10)
+
+        def refrescar():
+            for widget in scroll_frame.winfo_children():
+                widget.destroy()
+
+            quincena = Quincena.actual()
+            inicio, fin = quincena.inicio, quincena.fin
+
+            tk.Label(scroll_frame,
+                     text=f"Reporte del {inicio.strftime('%d/%m/%Y')} al {fin.strftime('%d/%m/%Y')}",
+                     bg='white', fg='gray', font=("Arial", 10, "italic")).pack(pady=(0, 10))
+
+            self.en_segundo_plano(scroll_frame, quincena.reporte_empleado, id_empleado, al_terminar=mostrar_reporte)
+
+        self.al_mostrar(refrescar)
+
+    def registrar_entrada(self):
+        id_empleado = Cuentas.buscar_id(self.usuario_actual, self.password_actual)
+        try:
+            RegistroHoras.registrar_entrada(id_empleado)
+        except ErrorOperGest as e:
+            messagebox.showwarning("Atención", str(e))
+            return
+        messagebox.showinfo("Entrada registrada", "Tu hora de entrada fue registrada correctamente.")
+        self.menu_empleado()
+
+    def registrar_salida(self):
+        id_empleado = Cuentas.buscar_id(self.usuario_actual, self.password_actual)
+        try:
+            RegistroHoras.registrar_salida(id_empleado)
+        except ErrorOperGest as e:
+            messagebox.showwarning("Atención", str(e))
+            return
+        messagebox.showinfo("Salida registrada", "Tu hora de salida fue registrada correctamente.")
+        self.menu_empleado()
+
+
+    #====MÉTODO PARA EJECUTAR====
+    def ejecutar(self):
+        try:
+            self.root.mainloop()
+        finally:
+            self.trabajador.detener()
+            Conexion.cerrar()
+
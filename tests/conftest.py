@@ -0,0 +1,36 @@
+import shutil
+from datetime import date
+
+import pytest
+
+from opergest.core import Conexion, Migraciones
+from opergest.generador import GeneradorPlanta
+
+
+@pytest.fixture(scope="session")
+def plantilla(tmp_path_factory):
+    # Base sintética pequeña: quincenas 2025-02-1 y 2025-02-2 entregadas, 2025-03-1 en proceso.
+    # Empleados: 1 admin, 2-9 costura, 10-11 corte, 12-13 empacar.
+    destino = str(tmp_path_factory.mktemp("plantilla") / "registros.db")
+    GeneradorPlanta(destino, "taller", semilla=3, hasta=date(2025, 3, 20), quincenas=3).generar()
+    return destino
+
+
+@pytest.fixture
+def base(plantilla, tmp_path):
+    ruta, perfil = Conexion.ruta, Conexion.perfil
+    destino = str(tmp_path / "registros.db")
+    shutil.copy(plantilla, destino)
+    Conexion.configurar(ruta=destino, perfil="single-terminal")
+    yield destino
+    Conexion.configurar(ruta=ruta, perfil=perfil)
+
+
+@pytest.fixture
+def base_vacia(tmp_path):
+    ruta, perfil = Conexion.ruta, Conexion.perfil
+    destino = str(tmp_path / "vacia.db")
+    Conexion.configurar(ruta=destino, perfil="single-terminal")
+    Migraciones.aplicar()
+    yield destino
+    Conexion.configurar(ruta=ruta, perfil=perfil)
@@ -0,0 +1,53 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from opergest.core import Archivo, Conexion, Nomina
+
+
+def contar(conn, tabla):
+    return conn.execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
+
+
+def test_archivo_confirmado_antes_de_borrar(base):
+    conn = Conexion.get_conn()
+    reportes = contar(conn, "main.reporte")
+    conn.execute("""
+        CREATE TRIGGER main.no_borrar BEFORE DELETE ON reporte
+        BEGIN SELECT RAISE(ABORT, 'falla simulada'); END
+    """)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        Archivo.archivar(date(2025, 2, 23))
+    # La copia ya quedó en el archivo; la base principal no perdió nada.
+    copiados = contar(conn, "archivo.reporte")
+    assert copiados > 0
+    assert contar(conn, "main.reporte") == reportes
+
+    conn.execute("DROP TRIGGER main.no_borrar")
+    movidos = Archivo.archivar(date(2025, 2, 23))
+    assert movidos["reporte"] == copiados
+    assert contar(conn, "archivo.reporte") == copiados
+    assert contar(conn, "main.reporte") + copiados == reportes
+
+
+def test_archivo_sigue_al_esquema_principal(base):
+    antes = Nomina.calcular(date(2025, 2, 9), date(2025, 2, 22))
+    Archivo.archivar(date(2025, 2, 10))
+
+    # Una migración posterior agrega una columna a la base principal.
+    conn = Conexion.get_conn()
+    version = conn.execute("PRAGMA main.user_version").fetchone()[0]
+    conn.execute("ALTER TABLE main.pedidos ADD COLUMN notas TEXT DEFAULT ''")
+    conn.execute(f"PRAGMA main.user_version = {version + 1}")
+    Conexion.cerrar()
+
+    conn = Conexion.get_conn()
+    assert "notas" in {c['name'] for c in conn.execute("PRAGMA archivo.table_info(pedidos)")}
+    assert conn.execute("PRAGMA archivo.user_version").fetchone()[0] == version + 1
+    assert contar(conn, "historico_pedidos") == contar(conn, "main.pedidos") + contar(conn, "archivo.pedidos")
+
+    movidos = Archivo.archivar(date(2025, 2, 23))
+    assert movidos["pedidos"] > 0
+    assert Nomina.calcular(date(2025, 2, 9), date(2025, 2, 22)) == antes
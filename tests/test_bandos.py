@@ -0,0 +1,43 @@
+import threading
+
+from opergest.core import Bandos, CapacidadExcedidaError, Conexion, Pedidos, TallasCorte
+
+
+def test_asignacion_concurrente_respeta_el_tope(base, hilos=16, intentos=50, cantidad_max=500, cantidad=3):
+    id_corte = Pedidos("Lee", "Dama", "azul").guardar()
+    TallasCorte(id_corte, 30, cantidad_max).agregar_talla()
+
+    aceptados = []
+    errores = []
+    barrera = threading.Barrier(hilos)
+
+    def trabajador():
+        # Cada hilo abre su propia conexión; todos compiten por el mismo saldo.
+        barrera.wait()
+        for _ in range(intentos):
+            try:
+                Bandos(id_corte, 30, cantidad).agregar_bando()
+                aceptados.append(cantidad)
+            except CapacidadExcedidaError:
+                pass
+            except Exception as e:
+                errores.append(e)
+
+    hilos_activos = [threading.Thread(target=trabajador) for _ in range(hilos)]
+    for hilo in hilos_activos:
+        hilo.start()
+    for hilo in hilos_activos:
+        hilo.join()
+
+    assert not errores, f"{len(errores)} hilos fallaron; primero: {errores[0]!r}"
+
+    conn = Conexion.get_conn()
+    total = conn.execute(
+        "SELECT IFNULL(SUM(cantidad), 0) FROM bandos WHERE corte = ? AND talla = 30", (id_corte,)
+    ).fetchone()[0]
+    assert total <= cantidad_max
+    assert total == sum(aceptados)
+    # Hubo más intentos que capacidad: el tope se llena hasta donde cabe otro bando.
+    assert total > cantidad_max - cantidad
+    assert Pedidos.buscar(id_corte)['cantidad'] == total
+    assert TallasCorte.verificar_saldos() == []
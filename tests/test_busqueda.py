@@ -0,0 +1,56 @@
+import pytest
+
+from opergest.core import Busqueda, Conexion, Empleados, Pedidos
+
+
+@pytest.fixture
+def datos(base_vacia):
+    ids = {
+        "wrangler": Pedidos("Wrangler", "Caballero", "azul marino").guardar(),
+        "lee": Pedidos("Lee", "Dama", "negro").guardar(),
+        "levis": Pedidos("Levi's", "Niño", "azul").guardar(),
+    }
+    for nombre, area in [("María José López", "Costura"), ("Mario Pérez", "Corte"), ("Marta Ajú", "Costura")]:
+        Empleados(nombre, 55550000, area).guardar()
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE pedidos SET estado = 'entregado' WHERE id = ?", (ids["levis"],))
+    return ids
+
+
+@pytest.fixture(params=["fts", "like"])
+def modo(request, datos, monkeypatch):
+    if request.param == "like":
+        monkeypatch.setattr(Busqueda, "_con_fts", staticmethod(lambda conn, indice: False))
+    return request.param
+
+
+def ids(filas):
+    return [fila['id'] for fila in filas]
+
+
+def test_todas_las_palabras_deben_coincidir(datos, modo):
+    assert set(ids(Busqueda.pedidos("azul"))) == {datos["wrangler"], datos["levis"]}
+    assert ids(Busqueda.pedidos("azul caballero")) == [datos["wrangler"]]
+
+
+def test_prefijos_y_diacriticos(datos, modo):
+    assert ids(Busqueda.pedidos("wran")) == [datos["wrangler"]]
+    nombres = {fila['nombre'] for fila in Busqueda.empleados("mar")}
+    assert nombres == {"María José López", "Mario Pérez", "Marta Ajú"}
+    if modo == "fts":
+        # FTS5 ignora acentos y corta por palabra; LIKE compara el texto tal cual.
+        assert {fila['nombre'] for fila in Busqueda.empleados("lopez")} == {"María José López"}
+
+
+def test_filtros_por_estado_y_area(datos, modo):
+    assert ids(Busqueda.pedidos("azul", estado="en proceso")) == [datos["wrangler"]]
+    assert {fila['nombre'] for fila in Busqueda.empleados("mar", area="Costura")} == {"María José López", "Marta Ajú"}
+
+
+def test_un_numero_busca_tambien_por_id(datos, modo):
+    assert ids(Busqueda.pedidos(str(datos["lee"])))[0] == datos["lee"]
+    assert ids(Busqueda.pedidos(str(datos["levis"]), estado="en proceso")) == []
+
+
+def test_sin_texto_lista_los_primeros(datos, modo):
+    assert ids(Busqueda.pedidos("", limite=2)) == [datos["wrangler"], datos["lee"]]
@@ -0,0 +1,38 @@
+import os
+from datetime import date
+
+import pytest
+
+from opergest.cli import main
+from opergest.core import Archivo, Conexion, Nomina
+
+
+def leer_movidos(salida):
+    return {linea.split()[0]: int(linea.split()[1]) for linea in salida.splitlines()}
+
+
+def test_archive_mueve_cortes_entregados(base, capsys):
+    antes = Nomina.calcular(date(2025, 2, 9), date(2025, 2, 22))
+    assert any(fila['bandos'] for fila in antes)
+
+    assert main(["--db", base, "archive", "--antes-de", "2025-02-23"]) == 0
+
+    movidos = leer_movidos(capsys.readouterr().out)
+    assert movidos["pedidos"] > 0 and movidos["reporte"] > 0
+    assert os.path.exists(Archivo.ruta())
+
+    conn = Conexion.get_conn()
+    assert conn.execute("SELECT COUNT(*) FROM main.pedidos WHERE estado = 'en proceso'").fetchone()[0] > 0
+    assert conn.execute("SELECT COUNT(*) FROM archivo.pedidos").fetchone()[0] == movidos["pedidos"]
+    # La nómina de un periodo archivado se sigue leyendo por las vistas históricas.
+    assert Nomina.calcular(date(2025, 2, 9), date(2025, 2, 22)) == antes
+
+
+def test_archive_no_toca_otros_estados(base, capsys):
+    assert main(["--db", base, "archive", "--antes-de", "2025-02-23", "--estado", "cancelado"]) == 0
+    assert set(leer_movidos(capsys.readouterr().out).values()) == {0}
+
+
+def test_archive_requiere_fecha(base):
+    with pytest.raises(SystemExit):
+        main(["--db", base, "archive"])
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+
+import pytest
+
+from opergest.core import DatosInvalidosError, Exportacion, Quincena
+
+
+def claves(desde=None, hasta=None):
+    _, filas = Exportacion.abrir("nomina", desde, hasta)
+    return list(dict.fromkeys(fila[0] for fila in filas))
+
+
+def test_nomina_desde_empieza_en_la_primera_quincena_completa(base):
+    assert claves(date(2025, 2, 9), date(2025, 3, 22)) == ["2025-02-1", "2025-02-2", "2025-03-1"]
+    assert claves(date(2025, 2, 10), date(2025, 3, 22)) == ["2025-02-2", "2025-03-1"]
+
+
+def test_nomina_hasta_termina_en_la_ultima_quincena_completa(base):
+    assert claves(date(2025, 2, 9), date(2025, 3, 8)) == ["2025-02-1", "2025-02-2"]
+    assert claves(date(2025, 2, 9), date(2025, 3, 7)) == ["2025-02-1"]
+
+
+def test_nomina_sin_hasta_no_incluye_la_quincena_en_curso(base):
+    anterior = Quincena.actual().anterior()
+    exportadas = claves(anterior.anterior().inicio)
+    assert exportadas == [anterior.anterior().clave, anterior.clave]
+
+    futuro = date.today() + timedelta(days=60)
+    assert claves(anterior.inicio, futuro) == [anterior.clave]
+
+
+def test_nomina_sin_fechas_o_solo_hasta_exporta_una_quincena(base):
+    assert claves() == [Quincena.actual().anterior().clave]
+    assert claves(hasta=date(2025, 3, 10)) == ["2025-02-2"]
+
+
+def test_nomina_sin_quincenas_completas_en_el_rango(base):
+    with pytest.raises(DatosInvalidosError):
+        Exportacion.abrir("nomina", date(2025, 2, 10), date(2025, 3, 7))
@@ -0,0 +1,46 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from opergest.core import Conexion, ConflictoError
+from opergest.generador import GeneradorPlanta
+
+
+def test_generar_restaura_la_base_y_el_perfil(base, tmp_path):
+    destino = str(tmp_path / "sintetica.db")
+    GeneradorPlanta(destino, "taller", semilla=5, hasta=date(2025, 3, 20), quincenas=1, costura=2).generar()
+
+    assert (Conexion.ruta, Conexion.perfil) == (base, "single-terminal")
+    assert Conexion.get_conn().execute("PRAGMA synchronous").fetchone()[0] != 0
+    assert Conexion.get_conn().execute("SELECT COUNT(*) FROM empleados").fetchone()[0] == 13
+
+
+def test_generar_restaura_aunque_falle(base, tmp_path, monkeypatch):
+    generador = GeneradorPlanta(str(tmp_path / "sintetica.db"), "taller", semilla=5, quincenas=1)
+
+    def fallar(*args):
+        raise RuntimeError("interrumpido")
+
+    monkeypatch.setattr(generador, "_operaciones", fallar)
+    with pytest.raises(RuntimeError):
+        generador.generar()
+    assert (Conexion.ruta, Conexion.perfil) == (base, "single-terminal")
+
+
+def test_misma_semilla_misma_base(tmp_path):
+    conteos = []
+    for nombre in ("a.db", "b.db"):
+        destino = str(tmp_path / nombre)
+        conteo, _ = GeneradorPlanta(destino, "taller", semilla=7, hasta=date(2025, 3, 20), quincenas=2,
+                                    costura=2).generar()
+        with sqlite3.connect(destino) as conn:
+            reporte = conn.execute("SELECT * FROM reporte ORDER BY id").fetchall()
+        conteos.append((conteo, reporte))
+    assert conteos[0] == conteos[1]
+
+
+def test_no_sobrescribe_una_base_existente(base):
+    with pytest.raises(ConflictoError):
+        GeneradorPlanta(base, "taller").generar()
+    assert Conexion.ruta == base
@@ -0,0 +1,25 @@
+import logging
+import os
+import shutil
+
+from opergest.core import Conexion, Migraciones
+
+REGISTROS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "registros.db")
+
+
+def test_reportes_sin_tarea_se_conservan(tmp_path, caplog):
+    ruta, perfil = Conexion.ruta, Conexion.perfil
+    destino = str(tmp_path / "registros.db")
+    shutil.copy(REGISTROS, destino)
+    Conexion.configurar(ruta=destino, perfil="single-terminal")
+    try:
+        with caplog.at_level(logging.WARNING, logger="opergest.core"):
+            assert Migraciones.aplicar() == len(Migraciones.PASOS)
+        assert "1 filas de la tabla reportes no tienen tarea" in caplog.text
+
+        conn = Conexion.get_conn()
+        assert [tuple(f) for f in conn.execute("SELECT id_tarea, fecha FROM reportes_sin_tarea")] == \
+            [(1, "2025-11-09 20:05:43")]
+        assert not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'reportes'").fetchone()
+    finally:
+        Conexion.configurar(ruta=ruta, perfil=perfil)
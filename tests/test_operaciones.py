@@ -0,0 +1,48 @@
+import pytest
+
+from opergest.core import Conexion, NoEncontradoError, Operaciones
+
+
+def nombres():
+    return {fila['id']: fila['nombre'] for fila in Operaciones.listar()}
+
+
+@pytest.fixture
+def catalogo(base):
+    Operaciones.invalidar()
+    nombres()
+    return Operaciones.estadisticas()
+
+
+def test_lecturas_repetidas_salen_de_la_cache(catalogo):
+    Operaciones.listar()
+    Operaciones.buscar(1)
+    despues = Operaciones.estadisticas()
+    assert despues["aciertos"] == catalogo["aciertos"] + 2
+    assert despues["fallos"] == catalogo["fallos"]
+
+
+def test_guardar_invalida(catalogo):
+    Operaciones("Presillas", 0.15, 0.18).guardar()
+    assert "Presillas" in nombres().values()
+
+
+def test_modificar_invalida(catalogo):
+    Operaciones.modificar(1, "Ruedo doble", 0.3, 0.35)
+    assert Operaciones.buscar_nombre_por_id(1) == "Ruedo doble"
+    assert Operaciones.obtener_precio_big(1) == 0.35
+
+
+def test_eliminar_invalida(catalogo):
+    Operaciones.eliminar(1)
+    assert 1 not in nombres()
+    with pytest.raises(NoEncontradoError):
+        Operaciones.buscar(1)
+
+
+def test_id_desconocido_recarga_lo_escrito_por_otra_terminal(catalogo):
+    with Conexion.transaccion() as conn:
+        id_nuevo = conn.execute(
+            "INSERT INTO operaciones (nombre, small_price, big_price) VALUES ('Bastilla', 0.2, 0.25)"
+        ).lastrowid
+    assert Operaciones.buscar_nombre_por_id(id_nuevo) == "Bastilla"
@@ -0,0 +1,17 @@
+import pytest
+
+from opergest.core import Conexion, Pedidos, NoEncontradoError
+
+
+def test_listar_sin_pedidos_nombra_el_estado(base):
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE pedidos SET estado = 'entregado'")
+
+    with pytest.raises(NoEncontradoError, match="No hay pedidos en proceso registrados."):
+        Pedidos.listar(estado="en proceso")
+    assert Pedidos.listar(limite=1)
+
+
+def test_listar_sin_filtro_en_base_vacia(base_vacia):
+    with pytest.raises(NoEncontradoError, match="^No hay pedidos registrados.$"):
+        Pedidos.listar()
@@ -0,0 +1,125 @@
+import re
+from datetime import date
+
+import pytest
+
+from opergest.core import (
+    Conexion, Pedidos, TallasCorte, Bandos, Operaciones, Empleados, Salarios, Tareas, Reportes,
+    RegistroHoras, Nomina, Quincena, Cuentas, Busqueda
+)
+
+INICIO, FIN = date(2025, 2, 9), date(2025, 2, 22)
+
+
+def preparar_ids(conn):
+    # Se calculan antes de activar el trace para que estas consultas no se revisen.
+    corte = conn.execute("SELECT MAX(id) FROM pedidos WHERE estado = 'en proceso'").fetchone()[0]
+    return {
+        "tarea_pendiente": conn.execute(
+            "SELECT id FROM tareas WHERE id NOT IN (SELECT id_tarea FROM reporte) LIMIT 1"
+        ).fetchone()[0],
+        "corte_en_proceso": corte,
+        "talla_en_proceso": conn.execute("SELECT talla FROM corte_talla_saldo WHERE corte = ? "
+                                         "AND cantidad_max > asignada LIMIT 1", (corte,)).fetchone()[0],
+    }
+
+
+# Cada llamada ejecuta la capa de datos tal como la usan la interfaz y la CLI; el plan se revisa
+# sobre las sentencias que SQLite recibe realmente, no sobre copias del SQL.
+LLAMADAS = [
+    ("Pedidos.listar", lambda ids: Pedidos.listar(despues_de=0, limite=50)),
+    ("Pedidos.listar/estado", lambda ids: Pedidos.listar(estado="en proceso", limite=50)),
+    ("Pedidos.buscar", lambda ids: Pedidos.buscar(1)),
+    ("Pedidos.detalle_cortes", lambda ids: Pedidos.detalle_cortes([1, 2, 3])),
+    ("Pedidos.actualizar_estado", lambda ids: Pedidos.actualizar_estado(1, "entregado")),
+    ("TallasCorte.obtener_tallas_corte", lambda ids: TallasCorte.obtener_tallas_corte(1)),
+    ("TallasCorte.obtener_tallas_cantidades", lambda ids: TallasCorte.obtener_tallas_cantidades(1)),
+    ("TallasCorte.obtener_saldos", lambda ids: TallasCorte.obtener_saldos(1)),
+    ("Bandos.agregar_bando",
+     lambda ids: Bandos(ids["corte_en_proceso"], ids["talla_en_proceso"], 1).agregar_bando()),
+    ("Bandos.obtener_num_bandos_corte", lambda ids: Bandos.obtener_num_bandos_corte(1)),
+    ("Bandos.obtener_bandos_corte", lambda ids: Bandos.obtener_bandos_corte(1)),
+    ("Operaciones.listar", lambda ids: Operaciones.listar()),
+    ("Operaciones.buscar", lambda ids: Operaciones.buscar(1)),
+    ("Operaciones.modificar", lambda ids: Operaciones.modificar(1, "Ruedo", 0.2, 0.25)),
+    ("Empleados.listar", lambda ids: Empleados.listar()),
+    ("Empleados.directorio", lambda ids: Empleados.directorio(limite=50)),
+    ("Empleados.directorio/area", lambda ids: Empleados.directorio(area="Costura", limite=50)),
+    ("Empleados.consultar", lambda ids: Empleados.consultar(2)),
+    ("Empleados.buscar_empleado_costura", lambda ids: Empleados.buscar_empleado_costura()),
+    ("Empleados.obtener_area", lambda ids: Empleados.obtener_area(2)),
+    ("Salarios.mostrar_salario", lambda ids: Salarios.mostrar_salario(10)),
+    ("Salarios.modificar_salario", lambda ids: Salarios.modificar_salario(10, 12.5)),
+    ("Tareas.listar_por_empleado", lambda ids: Tareas.listar_por_empleado(2)),
+    ("Tareas.listar_por_empleado/pendientes", lambda ids: Tareas.listar_por_empleado(2, pendientes=True)),
+    ("Tareas.eliminar", lambda ids: Tareas.eliminar(ids["tarea_pendiente"])),
+    ("Reportes.registrar_tareas", lambda ids: Reportes.registrar_tareas([1, 2, ids["tarea_pendiente"]])),
+    ("Reportes.obtener_tareas_realizadas", lambda ids: Reportes.obtener_tareas_realizadas(2, INICIO, FIN)),
+    ("Reportes.bandos_realizados", lambda ids: Reportes.bandos_realizados(1, corte=1)),
+    ("Reportes.buscar_por_empleado", lambda ids: Reportes.buscar_por_empleado(2)),
+    ("RegistroHoras.registrar_entrada", lambda ids: RegistroHoras.registrar_entrada(10)),
+    ("RegistroHoras.registrar_salida",
+     lambda ids: (RegistroHoras.registrar_entrada(11), RegistroHoras.registrar_salida(11))),
+    ("RegistroHoras.obtener_registros_horarios", lambda ids: RegistroHoras.obtener_registros_horarios(10, INICIO, FIN)),
+    ("Nomina.calcular", lambda ids: Nomina.calcular(INICIO, FIN)),
+    ("Nomina.calcular/empleado", lambda ids: Nomina.calcular(INICIO, FIN, id_empleado=2)),
+    ("Nomina.detalle_destajo", lambda ids: Nomina.detalle_destajo(2, INICIO, FIN)),
+    ("Nomina.detalle_horas", lambda ids: Nomina.detalle_horas(10, INICIO, FIN)),
+    ("Quincena.nomina", lambda ids: Quincena.desde_clave("2025-02-1").nomina()),
+    ("Quincena.resumen_empleado", lambda ids: Quincena.desde_clave("2025-02-1").resumen_empleado(2)),
+    ("Cuentas.listar", lambda ids: Cuentas.listar()),
+    ("Cuentas.buscar", lambda ids: Cuentas.buscar("admin", "admin")),
+    ("Cuentas.buscar_id", lambda ids: Cuentas.buscar_id("admin", "admin")),
+    ("Busqueda.pedidos", lambda ids: Busqueda.pedidos("Lee azul", estado="en proceso")),
+    ("Busqueda.pedidos/id", lambda ids: Busqueda.pedidos("12")),
+    ("Busqueda.empleados", lambda ids: Busqueda.empleados("Mar", area="Costura")),
+]
+
+# Recorridos completos a propósito: listados de catálogos (operaciones también al llenar su caché),
+# la nómina que lista a todos los empleados (e) y el destajo ya agrupado por empleado (d).
+NOMINA_EMPLEADO = {"SCAN d LEFT-JOIN"}
+NOMINA = NOMINA_EMPLEADO | {"SCAN e"}
+PERMITIDOS = {
+    "Operaciones.listar": {"SCAN operaciones"},
+    "Operaciones.buscar": {"SCAN operaciones"},
+    "Empleados.listar": {"SCAN empleados"},
+    "Cuentas.listar": {"SCAN cuentas"},
+    "Nomina.calcular": NOMINA,
+    "Nomina.calcular/empleado": NOMINA_EMPLEADO,
+    "Quincena.nomina": NOMINA,
+    "Quincena.resumen_empleado": NOMINA_EMPLEADO,
+}
+
+
+def sentencias(conn, llamada):
+    capturadas = []
+    conn.set_trace_callback(capturadas.append)
+    try:
+        llamada()
+    finally:
+        conn.set_trace_callback(None)
+    # Lecturas y modificaciones de la aplicación; los INSERT, el control de transacciones, los
+    # cuerpos de triggers ("-- TRIGGER") y las consultas internas de FTS5 no se revisan.
+    return [sql for sql in capturadas
+            if re.match(r"\s*(SELECT|WITH|UPDATE|DELETE)\b", sql, re.IGNORECASE)
+            and "sqlite_master" not in sql and "_fts_" not in sql]
+
+
+@pytest.mark.parametrize("nombre, llamada", LLAMADAS, ids=[nombre for nombre, _ in LLAMADAS])
+def test_consultas_sin_recorrido_completo(base, nombre, llamada):
+    conn = Conexion.get_conn()
+    ids = preparar_ids(conn)
+    Operaciones.invalidar()
+    revisadas = sentencias(conn, lambda: llamada(ids))
+    assert revisadas, f"{nombre} no emitió consultas"
+
+    escaneos = {}
+    for sql in revisadas:
+        # El trace entrega la sentencia con los parámetros ya sustituidos.
+        for fila in conn.execute(f"EXPLAIN QUERY PLAN {sql}"):
+            detalle = fila['detail']
+            if detalle.startswith("SCAN") and "VIRTUAL TABLE" not in detalle:
+                escaneos.setdefault(detalle, " ".join(sql.split())[:120])
+
+    inesperados = {d: sql for d, sql in escaneos.items() if d not in PERMITIDOS.get(nombre, set())}
+    assert not inesperados, f"{nombre} recorre tablas completas: {inesperados}"
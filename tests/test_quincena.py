@@ -0,0 +1,59 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from opergest.core import ConflictoError, Conexion, Nomina, Quincena
+
+
+@pytest.mark.parametrize("fecha, clave", [
+    (date(2025, 3, 8), "2025-02-2"),
+    (date(2025, 3, 9), "2025-03-1"),
+    (date(2025, 3, 22), "2025-03-1"),
+    (date(2025, 3, 23), "2025-03-2"),
+    (date(2025, 1, 5), "2024-12-2"),
+    (date(2024, 12, 31), "2024-12-2"),
+])
+def test_para_fecha_en_los_bordes(fecha, clave):
+    assert Quincena.para_fecha(fecha).clave == clave
+
+
+def test_la_segunda_mitad_cruza_el_mes():
+    quincena = Quincena.desde_clave("2024-12-2")
+    assert (quincena.inicio, quincena.fin) == (date(2024, 12, 23), date(2025, 1, 8))
+    assert quincena.siguiente().clave == "2025-01-1"
+    assert quincena.anterior().clave == "2024-12-1"
+
+
+def test_cerrar_congela_la_nomina(base):
+    quincena = Quincena.desde_clave("2025-02-1")
+    calculada = quincena.nomina()
+
+    assert quincena.cerrar() == len(calculada)
+    assert quincena.cerrada()
+    assert quincena.nomina() == calculada
+
+    # Un reporte tardío ya no cambia una quincena cerrada.
+    conn = Conexion.get_conn()
+    with Conexion.transaccion():
+        conn.execute("UPDATE reporte SET fecha = '2025-02-10 12:00:00'")
+    assert Nomina.calcular(quincena.inicio, quincena.fin) != calculada
+    assert quincena.nomina() == calculada
+
+
+def test_las_filas_cerradas_no_se_modifican(base):
+    Quincena.desde_clave("2025-02-1").cerrar()
+    conn = Conexion.get_conn()
+
+    with pytest.raises(sqlite3.IntegrityError, match="no se puede modificar"):
+        conn.execute("UPDATE nomina_cerrada SET total = 0 WHERE clave = '2025-02-1'")
+    with pytest.raises(sqlite3.IntegrityError, match="no se puede modificar"):
+        conn.execute("DELETE FROM nomina_cerrada WHERE clave = '2025-02-1'")
+
+
+def test_no_se_cierra_dos_veces_ni_antes_de_terminar(base):
+    Quincena.desde_clave("2025-02-1").cerrar()
+    with pytest.raises(ConflictoError):
+        Quincena.desde_clave("2025-02-1").cerrar()
+    with pytest.raises(ConflictoError):
+        Quincena.actual().cerrar()
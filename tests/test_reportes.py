@@ -0,0 +1,41 @@
+from opergest.core import Conexion, Nomina, Reportes, Quincena
+
+
+def test_registrar_tareas_separa_registradas_inexistentes_y_repetidas(base):
+    conn = Conexion.get_conn()
+    reportada = conn.execute("SELECT id_tarea FROM reporte ORDER BY id LIMIT 1").fetchone()[0]
+    pendientes = [fila[0] for fila in conn.execute(
+        "SELECT id FROM tareas WHERE id NOT IN (SELECT id_tarea FROM reporte) ORDER BY id LIMIT 2"
+    )]
+    antes = conn.execute("SELECT COUNT(*) FROM reporte").fetchone()[0]
+
+    resultado = Reportes.registrar_tareas(pendientes + [reportada, 999999, pendientes[0]])
+
+    assert resultado["registradas"] == pendientes
+    assert resultado["fallidas"] == {reportada: "La tarea ya fue registrada.", 999999: "La tarea no existe."}
+    assert conn.execute("SELECT COUNT(*) FROM reporte").fetchone()[0] == antes + 2
+    filas = conn.execute(f"SELECT id_tarea, id_empleado, id_operacion FROM reporte "
+                         f"WHERE id_tarea IN ({pendientes[0]}, {pendientes[1]}) ORDER BY id_tarea").fetchall()
+    tareas = conn.execute(f"SELECT id, id_empleado, operacion FROM tareas "
+                          f"WHERE id IN ({pendientes[0]}, {pendientes[1]}) ORDER BY id").fetchall()
+    assert [tuple(f) for f in filas] == [tuple(t) for t in tareas]
+
+
+def test_registrar_dos_veces_no_duplica_el_destajo(base):
+    conn = Conexion.get_conn()
+    id_tarea, id_empleado = conn.execute(
+        "SELECT id, id_empleado FROM tareas WHERE id NOT IN (SELECT id_tarea FROM reporte) LIMIT 1"
+    ).fetchone()
+    quincena = Quincena.actual()
+
+    Reportes.registrar_tareas([id_tarea])
+    una_vez = Nomina.calcular(quincena.inicio, quincena.fin, id_empleado)
+    assert una_vez[0]['bandos'] > 0
+    segunda = Reportes.registrar_tareas([id_tarea])
+
+    assert segunda["registradas"] == []
+    assert Nomina.calcular(quincena.inicio, quincena.fin, id_empleado) == una_vez
+
+
+def test_registrar_sin_ids(base):
+    assert Reportes.registrar_tareas([]) == {"registradas": [], "fallidas": {}}
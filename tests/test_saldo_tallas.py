@@ -0,0 +1,53 @@
+import pytest
+
+from opergest.core import Bandos, CapacidadExcedidaError, Conexion, Pedidos, TallasCorte
+
+
+def saldo(id_corte, talla):
+    fila = Conexion.get_conn().execute(
+        "SELECT cantidad_max, asignada FROM corte_talla_saldo WHERE corte = ? AND talla = ?", (id_corte, talla)
+    ).fetchone()
+    return tuple(fila) if fila else None
+
+
+def test_saldo_sigue_a_tallas_y_bandos(base_vacia):
+    id_corte = Pedidos("Lee", "Dama", "azul").guardar()
+    TallasCorte(id_corte, 10, 50).agregar_talla()
+    TallasCorte(id_corte, 12, 30).agregar_talla()
+    assert saldo(id_corte, 10) == (50, 0)
+
+    bando = Bandos(id_corte, 10, 20).agregar_bando()
+    Bandos(id_corte, 10, 25).agregar_bando()
+    assert saldo(id_corte, 10) == (50, 45)
+
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE bandos SET cantidad = 5 WHERE id = ?", (bando,))
+    assert saldo(id_corte, 10) == (50, 30)
+
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE bandos SET talla = 12 WHERE id = ?", (bando,))
+    assert (saldo(id_corte, 10), saldo(id_corte, 12)) == ((50, 25), (30, 5))
+
+    with Conexion.transaccion() as conn:
+        conn.execute("DELETE FROM bandos WHERE id = ?", (bando,))
+    assert (saldo(id_corte, 10), saldo(id_corte, 12)) == ((50, 25), (30, 0))
+    assert TallasCorte.verificar_saldos() == []
+
+
+def test_el_saldo_limita_los_bandos(base_vacia):
+    id_corte = Pedidos("Lee", "Dama", "azul").guardar()
+    TallasCorte(id_corte, 10, 30).agregar_talla()
+    Bandos(id_corte, 10, 24).agregar_bando()
+
+    with pytest.raises(CapacidadExcedidaError):
+        Bandos(id_corte, 10, 7).agregar_bando()
+    Bandos(id_corte, 10, 6).agregar_bando()
+    assert saldo(id_corte, 10) == (30, 30)
+
+
+def test_verificar_saldos_corrige_diferencias(base):
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE corte_talla_saldo SET asignada = asignada + 1 WHERE corte = 1")
+
+    assert TallasCorte.verificar_saldos(corregir=True)
+    assert TallasCorte.verificar_saldos() == []
@@ -0,0 +1,40 @@
+from opergest.core import Bandos, Conexion, Pedidos, TallasCorte
+
+
+def cantidad(id_corte):
+    return Pedidos.buscar(id_corte)['cantidad']
+
+
+def test_cantidad_sigue_a_los_bandos(base_vacia):
+    corte_a = Pedidos("Lee", "Dama", "azul").guardar()
+    corte_b = Pedidos("Pepe", "Niño", "negro").guardar()
+    for corte in (corte_a, corte_b):
+        TallasCorte(corte, 10, 100).agregar_talla()
+    assert cantidad(corte_a) == 0
+
+    bando = Bandos(corte_a, 10, 12).agregar_bando()
+    Bandos(corte_a, 10, 20).agregar_bando()
+    assert cantidad(corte_a) == 32
+
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE bandos SET cantidad = 15 WHERE id = ?", (bando,))
+    assert cantidad(corte_a) == 35
+
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE bandos SET corte = ? WHERE id = ?", (corte_b, bando))
+    assert (cantidad(corte_a), cantidad(corte_b)) == (20, 15)
+
+    with Conexion.transaccion() as conn:
+        conn.execute("DELETE FROM bandos WHERE id = ?", (bando,))
+    assert (cantidad(corte_a), cantidad(corte_b)) == (20, 0)
+    assert Pedidos.verificar_totales() == []
+
+
+def test_verificar_totales_corrige_diferencias(base):
+    with Conexion.transaccion() as conn:
+        conn.execute("UPDATE pedidos SET cantidad = cantidad + 5 WHERE id = 1")
+
+    diferencias = Pedidos.verificar_totales(corregir=True)
+
+    assert [d['id'] for d in diferencias] == [1]
+    assert Pedidos.verificar_totales() == []